@@ -1,3 +1,48 @@
-from .go_loader.bind import ChangeLanguage
-from .core import GameClient, LogClient
-from .utils.default_logging import DefaultLoggingFormatter
+import importlib
+
+# 公开名称 -> 所在模块，首次访问时才导入，
+# 使仅使用 UQHolderParser 等工具的子模块导入无需承担 core、绑定层与数据包系统的导入开销
+_LAZY_EXPORTS = {
+    "ChangeLanguage": ".go_loader.bind",
+    "GameClient": ".core",
+    "LogClient": ".core",
+    "DefaultLoggingFormatter": ".utils.default_logging",
+    "CommandPriority": ".utils.command_scheduler",
+    "CommandScheduler": ".utils.command_scheduler",
+    "Reactor": ".utils.reactor",
+    "IdleBackoff": ".utils.reactor",
+    "CommandResult": ".utils.command_result",
+    "Packet": ".packets",
+    "LazyPacket": ".packets",
+    "ListenerSpec": ".packets",
+    "register_packet_type": ".packets",
+    "resolve_packet_id": ".packets",
+    "Equals": ".packets",
+    "In": ".packets",
+    "Prefix": ".packets",
+    "Regex": ".packets",
+    "Where": ".packets",
+    "ChatRouter": ".chat_router",
+    "Arg": ".chat_router",
+    "PlayerQuery": ".batch_query",
+    "EntityTracker": ".mirrors",
+    "RegionWatch": ".mirrors",
+    "ScoreboardMirror": ".mirrors",
+    "InventoryMirror": ".mirrors",
+    "TickClock": ".mirrors",
+    "TickScheduler": ".mirrors",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # 缓存到模块属性，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,254 @@
+import json
+import re
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .mirrors.scoreboard import parse_players_list
+
+_PLAIN_SELECTOR_VALUE = re.compile(r"^[A-Za-z0-9_.+\-]+$")
+
+
+def selector_value(value: str) -> str:
+    """目标选择器参数值，含空格等字符时加引号"""
+    return value if _PLAIN_SELECTOR_VALUE.match(value) else json.dumps(value, ensure_ascii=False)
+
+
+def _score_range(low: Optional[int], high: Optional[int]) -> str:
+    if low is not None and low == high:
+        return str(low)
+    return f"{'' if low is None else low}..{'' if high is None else high}"
+
+
+def parse_testfor(output: Any) -> List[str]:
+    """
+    解析 /testfor 的命令输出
+
+    参数:
+        output: 命令响应
+
+    返回:
+        匹配的玩家名，没有匹配时为空列表
+    """
+    if not isinstance(output, Mapping) or not output.get("SuccessCount"):
+        return []
+    names: List[str] = []
+    for message in output.get("OutputMessages") or ():
+        if not message.get("Success", True) or not message.get("Message", "").endswith("testfor.success"):
+            continue
+        for param in message.get("Parameters") or ():
+            names.extend(name.strip() for name in str(param).split(", ") if name.strip())
+    return names
+
+
+def parse_querytarget(output: Any) -> List[Dict[str, Any]]:
+    """
+    解析 /querytarget 的命令输出
+
+    参数:
+        output: 命令响应
+
+    返回:
+        目标列表，每项包含 dimension、position、uniqueId、yRot
+    """
+    if not isinstance(output, Mapping) or not output.get("SuccessCount"):
+        return []
+    targets: List[Dict[str, Any]] = []
+    for message in output.get("OutputMessages") or ():
+        if not message.get("Success", True):
+            continue
+        for param in message.get("Parameters") or ():
+            try:
+                parsed = json.loads(param)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(parsed, list):
+                targets.extend(t for t in parsed if isinstance(t, dict))
+    return targets
+
+
+class _Flight:
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+
+
+class PlayerQuery:
+    """
+    按玩家批量查询
+
+    把逐个玩家发送的 /testfor、/querytarget、标签与分数查询合并为一条以 @a 目标选择器
+    发送的命令，解析合并后的输出再按玩家拆分，N 次命令往返减少为约一次。
+    同时进行的相同查询共用一次命令往返。
+    """
+
+    def __init__(self, client, timeout: int = 5) -> None:
+        """
+        初始化批量查询
+
+        参数:
+            client: GameClient 实例
+            timeout: 命令超时时间(秒)
+        """
+        self.client = client
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, _Flight] = {}
+
+        # 统计信息
+        self.queries = 0
+        self.commands = 0
+
+    def run(self, cmd: str) -> Any:
+        """
+        发送查询命令，与同时进行的相同命令共用响应
+
+        参数:
+            cmd: 命令字符串
+
+        返回:
+            命令响应，超时时返回 None
+        """
+        with self._lock:
+            self.queries += 1
+            flight = self._inflight.get(cmd)
+            owner = flight is None
+            if owner:
+                flight = self._inflight[cmd] = _Flight()
+                self.commands += 1
+        if not owner:
+            flight.done.wait(self.timeout + 1)
+            return flight.result
+        try:
+            flight.result = self.client.send_websocket_command_need_response(cmd, self.timeout)
+        finally:
+            with self._lock:
+                self._inflight.pop(cmd, None)
+            flight.done.set()
+        return flight.result
+
+    def online_players(self) -> List[str]:
+        """由 UQHolder 获取在线玩家名"""
+        players = self.client.get_players_info() or {}
+        return [p["Username"] for p in players.values() if p.get("Username")]
+
+    def _split(self, matched: Iterable[str], players: Optional[Iterable[str]]) -> Dict[str, bool]:
+        matched = set(matched)
+        if players is not None:
+            return {name: name in matched for name in players}
+        # 在线玩家列表可能略有滞后，匹配到的玩家总是包含在结果中
+        result = {name: False for name in self.online_players()}
+        result.update(dict.fromkeys(matched, True))
+        return result
+
+    def matching(self, selector_args: str, players: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """
+        查询哪些玩家满足目标选择器条件
+
+        参数:
+            selector_args: @a 的选择器参数，如 "tag=vip,m=c"
+            players: 只返回这些玩家的结果，默认为全部在线玩家
+
+        返回:
+            玩家名 -> 是否满足
+        """
+        selector = f"@a[{selector_args}]" if selector_args else "@a"
+        return self._split(parse_testfor(self.run(f"/testfor {selector}")), players)
+
+    def has_tag(self, tag: str, players: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """查询玩家是否带有标签，返回 玩家名 -> 是否带有"""
+        return self.matching(f"tag={selector_value(tag)}", players)
+
+    def in_score_range(
+        self,
+        objective: str,
+        low: Optional[int] = None,
+        high: Optional[int] = None,
+        players: Optional[Iterable[str]] = None
+    ) -> Dict[str, bool]:
+        """
+        查询玩家分数是否在范围内(含边界)
+
+        参数:
+            objective: 计分板项目名
+            low: 下限，为 None 时不限
+            high: 上限，为 None 时不限
+            players: 只返回这些玩家的结果，默认为全部在线玩家
+
+        返回:
+            玩家名 -> 是否在范围内
+        """
+        return self.matching(f"scores={{{selector_value(objective)}={_score_range(low, high)}}}", players)
+
+    def scores(self, players: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        用一条 /scoreboard players list @a 获取玩家在所有项目中的分数
+
+        参数:
+            players: 只返回这些玩家的结果，默认为全部有分数的在线玩家
+
+        返回:
+            玩家名 -> {项目名: 分数}
+        """
+        result: Dict[str, Dict[str, int]] = {}
+        if players is not None:
+            result = {name: {} for name in players}
+        output = self.run("/scoreboard players list @a")
+        if isinstance(output, Mapping):
+            for (holder, objective), score in parse_players_list(output).items():
+                if players is None or holder in result:
+                    result.setdefault(holder, {})[objective] = score
+        return result
+
+    def score(self, objective: str, players: Optional[Iterable[str]] = None) -> Dict[str, Optional[int]]:
+        """获取玩家在一个项目中的分数，返回 玩家名 -> 分数(没有时为 None)"""
+        return {name: scores.get(objective) for name, scores in self.scores(players).items()}
+
+    def query_targets(self, players: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        用一条 /querytarget @a 获取玩家的维度、坐标与朝向
+
+        querytarget 的输出只有 uniqueId，按 UQHolder 中玩家的 EntityUniqueID 对应到玩家名。
+
+        参数:
+            players: 只返回这些玩家的结果，默认为全部在线玩家
+
+        返回:
+            玩家名 -> {"dimension", "position": (x, y, z), "yRot", "uniqueId"}
+        """
+        wanted = set(players) if players is not None else None
+        names: Dict[int, str] = {}
+        for player in (self.client.get_players_info() or {}).values():
+            if player.get("Username") and player.get("EntityUniqueID") is not None:
+                names[int(player["EntityUniqueID"])] = player["Username"]
+        result: Dict[str, Dict[str, Any]] = {}
+        for target in parse_querytarget(self.run("/querytarget @a")):
+            try:
+                name = names.get(int(target.get("uniqueId")))
+            except (TypeError, ValueError):
+                continue
+            if name is None or (wanted is not None and name not in wanted):
+                continue
+            position = target.get("position") or {}
+            result[name] = {
+                "dimension": target.get("dimension"),
+                "position": (position.get("x"), position.get("y"), position.get("z")),
+                "yRot": target.get("yRot"),
+                "uniqueId": target.get("uniqueId"),
+            }
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            查询次数、实际发送的命令数与两者之比
+        """
+        return {
+            "queries": self.queries,
+            "commands": self.commands,
+            "sharing_ratio": self.queries / self.commands if self.commands else 0.0,
+        }
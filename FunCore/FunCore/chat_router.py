@@ -0,0 +1,457 @@
+import json
+import re
+import shlex
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .packets.ids import resolve_packet_id
+from .utils.token_bucket import TokenBucket
+
+# Text 数据包中玩家聊天的 TextType
+TEXT_TYPE_CHAT = 1
+
+_REQUIRED = object()
+
+_WORD = re.compile(r"\S+")
+
+# 每个命令保留的令牌桶数达到该值后开始清理已补满的桶
+_BUCKET_SWEEP_MIN = 256
+
+
+def tokenize(text: str) -> List[Tuple[str, int]]:
+    """
+    按 shell 规则分词并记录每个词在原文中的起始位置
+
+    参数:
+        text: 原始文本
+
+    返回:
+        (词, 起始位置) 列表，引号不成对时按空白分词
+    """
+    lexer = shlex.shlex(text, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    tokens: List[Tuple[str, int]] = []
+    pos = 0
+    try:
+        while True:
+            # 下一个词从上一个词之后的第一个非空白字符开始
+            while pos < len(text) and text[pos] in lexer.whitespace:
+                pos += 1
+            token = lexer.get_token()
+            if token is None:
+                return tokens
+            tokens.append((token, pos))
+            pos = lexer.instream.tell()
+    except ValueError:
+        return [(m.group(), m.start()) for m in _WORD.finditer(text)]
+
+
+class ArgumentError(ValueError):
+    """聊天命令参数错误"""
+
+
+class Arg:
+    """聊天命令参数"""
+
+    __slots__ = ("name", "type", "default", "greedy")
+
+    def __init__(
+        self,
+        name: str,
+        type: Callable[[str], Any] = str,
+        default: Any = _REQUIRED,
+        greedy: bool = False
+    ) -> None:
+        """
+        参数:
+            name: 参数名
+            type: 转换函数，如 int、float，抛出 ValueError 时视为参数错误
+            default: 默认值，不指定时为必填参数
+            greedy: 是否把剩余的全部内容作为该参数(只能是最后一个参数)
+        """
+        self.name = name
+        self.type = type
+        self.default = default
+        self.greedy = greedy
+
+    @property
+    def required(self) -> bool:
+        return self.default is _REQUIRED
+
+    def __repr__(self) -> str:
+        name = f"{self.name}..." if self.greedy else self.name
+        return f"<{name}>" if self.required else f"[{name}]"
+
+
+class ChatCommand:
+    """已注册的聊天命令"""
+
+    __slots__ = ("trigger", "handler", "args", "description", "rate", "burst", "_buckets", "_sweep_at")
+
+    def __init__(
+        self,
+        trigger: Tuple[str, ...],
+        handler: Callable[["ChatContext"], Any],
+        args: Sequence[Arg],
+        description: str,
+        rate: Optional[float],
+        burst: Optional[float]
+    ) -> None:
+        self.trigger = trigger
+        self.handler = handler
+        self.args = tuple(args)
+        self.description = description
+        self.rate = rate
+        self.burst = burst
+        # 玩家名 -> 令牌桶
+        self._buckets: Dict[str, TokenBucket] = {}
+        # 令牌桶数达到该值时清理已补满的桶
+        self._sweep_at = _BUCKET_SWEEP_MIN
+
+    @property
+    def usage(self) -> str:
+        """用法说明，如 ".home set <name>" """
+        return " ".join((*self.trigger, *map(repr, self.args)))
+
+    def allow(self, player: str) -> bool:
+        """按玩家限速，返回是否允许执行"""
+        if self.rate is None:
+            return True
+        bucket = self._buckets.get(player)
+        if bucket is None:
+            if len(self._buckets) >= self._sweep_at:
+                self._sweep_buckets()
+            bucket = self._buckets[player] = TokenBucket(self.rate, self.burst)
+        return bucket.try_acquire()
+
+    def _sweep_buckets(self) -> None:
+        """丢弃已补满的令牌桶，它们与新建的桶等价"""
+        self._buckets = {player: bucket for player, bucket in self._buckets.items() if not bucket.full()}
+        # 按剩余数量加倍，使清理的均摊开销为常数
+        self._sweep_at = max(_BUCKET_SWEEP_MIN, 2 * len(self._buckets))
+
+    def parse(self, tokens: List[Tuple[str, int]], rest: str) -> Dict[str, Any]:
+        """
+        解析参数
+
+        参数:
+            tokens: 触发词之后的参数分词，为 tokenize(rest) 的结果
+            rest: 触发词之后的原始文本，用于 greedy 参数
+
+        返回:
+            参数名 -> 参数值
+
+        异常:
+            ArgumentError: 参数缺失、多余或无法转换
+        """
+        values: Dict[str, Any] = {}
+        index = 0
+        for arg in self.args:
+            if arg.greedy:
+                # 从该参数第一个词的起始位置截取原始文本，保留其中的空格与引号
+                text = rest[tokens[index][1]:].strip() if index < len(tokens) else ""
+                if not text:
+                    if arg.required:
+                        raise ArgumentError(f"缺少参数 {arg.name}")
+                    values[arg.name] = arg.default
+                else:
+                    values[arg.name] = self._convert(arg, text)
+                index = len(tokens)
+                continue
+            if index < len(tokens):
+                values[arg.name] = self._convert(arg, tokens[index][0])
+                index += 1
+            elif arg.required:
+                raise ArgumentError(f"缺少参数 {arg.name}")
+            else:
+                values[arg.name] = arg.default
+        if index < len(tokens):
+            raise ArgumentError(f"多余的参数: {' '.join(token for token, _ in tokens[index:])}")
+        return values
+
+    @staticmethod
+    def _convert(arg: Arg, text: str) -> Any:
+        try:
+            return arg.type(text)
+        except ValueError:
+            raise ArgumentError(f"参数 {arg.name} 无效: {text}")
+
+    def __repr__(self) -> str:
+        return f"<ChatCommand {self.usage}>"
+
+
+class ChatContext:
+    """传给聊天命令处理函数的上下文"""
+
+    __slots__ = ("router", "player", "message", "command", "args")
+
+    def __init__(
+        self,
+        router: "ChatRouter",
+        player: str,
+        message: str,
+        command: ChatCommand,
+        args: Dict[str, Any]
+    ) -> None:
+        self.router = router
+        self.player = player
+        self.message = message
+        self.command = command
+        self.args = args
+
+    def __getitem__(self, name: str) -> Any:
+        return self.args[name]
+
+    def reply(self, text: str) -> None:
+        """向发送命令的玩家发送消息"""
+        self.router.tell(self.player, text)
+
+
+class _TrieNode:
+    __slots__ = ("children", "command")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.command: Optional[ChatCommand] = None
+
+
+class ChatRouter:
+    """
+    聊天命令路由器
+
+    只订阅一次 Text 数据包(以 TextType 条件过滤，非聊天消息不完整解码)，
+    按空白分词后沿前缀树匹配最长的已注册触发词，路由耗时只与消息的词数有关，
+    与注册的命令数无关。支持引号参数、类型转换与按玩家和命令的限速。
+    """
+
+    def __init__(
+        self,
+        client,
+        case_sensitive: bool = False,
+        queue_size: Optional[int] = None,
+        usage_on_error: bool = True
+    ) -> None:
+        """
+        初始化聊天命令路由器
+
+        参数:
+            client: GameClient 实例
+            case_sensitive: 触发词是否区分大小写
+            queue_size: 指定时命令处理函数在专属的有界队列后执行，不阻塞事件循环
+            usage_on_error: 参数错误时是否向玩家发送用法说明
+        """
+        self.client = client
+        self.case_sensitive = case_sensitive
+        self.queue_size = queue_size
+        self.usage_on_error = usage_on_error
+        self._root = _TrieNode()
+        self._commands: Dict[Tuple[str, ...], ChatCommand] = {}
+        self._lock = threading.Lock()
+        self._packet_id: Optional[int] = None
+
+        # 统计信息
+        self.messages = 0
+        self.routed = 0
+        self.rate_limited = 0
+        self.argument_errors = 0
+        self.errors = 0
+
+    def _key(self, token: str) -> str:
+        return token if self.case_sensitive else token.lower()
+
+    def register(
+        self,
+        trigger: str | Sequence[str],
+        handler: Callable[[ChatContext], Any],
+        args: Sequence[Arg] = (),
+        *,
+        description: str = "",
+        rate: Optional[float] = None,
+        burst: Optional[float] = None
+    ) -> ChatCommand:
+        """
+        注册聊天命令
+
+        参数:
+            trigger: 触发词，如 ".tpa" 或 ".home set"(多个词)
+            handler: 处理函数，参数为 ChatContext
+            args: 参数定义
+            description: 命令说明
+            rate: 每个玩家每秒最多执行的次数，为 None 时不限速
+            burst: 限速的突发容量，默认与 rate 相同(至少为 1)
+
+        返回:
+            已注册的命令
+
+        异常:
+            ValueError: 触发词为空或 greedy 参数不是最后一个
+        """
+        tokens = tuple(self._key(t) for t in (trigger.split() if isinstance(trigger, str) else trigger))
+        if not tokens:
+            raise ValueError("触发词不能为空")
+        if any(arg.greedy for arg in args[:-1]):
+            raise ValueError("greedy 参数只能是最后一个参数")
+        command = ChatCommand(tokens, handler, args, description, rate, burst)
+        with self._lock:
+            node = self._root
+            for token in tokens:
+                node = node.children.setdefault(token, _TrieNode())
+            node.command = command
+            self._commands[tokens] = command
+        return command
+
+    def command(
+        self,
+        trigger: str | Sequence[str],
+        *args: Arg,
+        description: str = "",
+        rate: Optional[float] = None,
+        burst: Optional[float] = None
+    ) -> Callable[[Callable[[ChatContext], Any]], Callable[[ChatContext], Any]]:
+        """
+        以装饰器形式注册聊天命令，参数同 register
+
+        示例:
+            @router.command(".pay", Arg("player"), Arg("amount", int), rate=1)
+            def pay(ctx):
+                ...
+        """
+        def decorator(handler: Callable[[ChatContext], Any]) -> Callable[[ChatContext], Any]:
+            self.register(trigger, handler, args, description=description, rate=rate, burst=burst)
+            return handler
+        return decorator
+
+    def unregister(self, trigger: str | Sequence[str]) -> bool:
+        """
+        注销聊天命令
+
+        返回:
+            是否存在该命令
+        """
+        tokens = tuple(self._key(t) for t in (trigger.split() if isinstance(trigger, str) else trigger))
+        with self._lock:
+            if self._commands.pop(tokens, None) is None:
+                return False
+            path = [self._root]
+            for token in tokens:
+                path.append(path[-1].children[token])
+            path[-1].command = None
+            # 移除不再通向任何命令的节点
+            for depth in range(len(tokens), 0, -1):
+                node = path[depth]
+                if node.command is not None or node.children:
+                    break
+                del path[depth - 1].children[tokens[depth - 1]]
+        return True
+
+    def commands(self) -> List[ChatCommand]:
+        """获取所有已注册的命令"""
+        with self._lock:
+            return list(self._commands.values())
+
+    def start(self) -> "ChatRouter":
+        """开始订阅 Text 数据包"""
+        if self._packet_id is not None:
+            return self
+        self._packet_id = resolve_packet_id("Text", self.client._packet_name_to_id_mapping)
+        self.client.add_packets_listener(
+            self._packet_id,
+            self._on_text,
+            where={"TextType": TEXT_TYPE_CHAT},
+            queue_size=self.queue_size
+        )
+        return self
+
+    def stop(self) -> None:
+        """停止订阅 Text 数据包"""
+        if self._packet_id is not None:
+            self.client.remove_packet_listener(self._packet_id, self._on_text)
+            self._packet_id = None
+
+    def match(self, message: str) -> Optional[Tuple[ChatCommand, str]]:
+        """
+        匹配聊天消息
+
+        参数:
+            message: 聊天内容
+
+        返回:
+            (命令, 触发词之后的原始文本)，没有匹配时返回 None
+        """
+        node = self._root
+        found: Optional[Tuple[ChatCommand, str]] = None
+        rest = message
+        while True:
+            parts = rest.split(None, 1)
+            if not parts:
+                break
+            node = node.children.get(self._key(parts[0]))
+            if node is None:
+                break
+            rest = parts[1] if len(parts) > 1 else ""
+            if node.command is not None:
+                found = (node.command, rest)
+        return found
+
+    def dispatch(self, player: str, message: str) -> bool:
+        """
+        路由一条聊天消息
+
+        参数:
+            player: 发送者
+            message: 聊天内容
+
+        返回:
+            是否匹配到命令
+        """
+        self.messages += 1
+        matched = self.match(message)
+        if matched is None:
+            return False
+        command, rest = matched
+        if not command.allow(player):
+            self.rate_limited += 1
+            return True
+        try:
+            args = command.parse(tokenize(rest), rest)
+        except ArgumentError as e:
+            self.argument_errors += 1
+            if self.usage_on_error:
+                self.tell(player, f"{e}，用法: {command.usage}")
+            return True
+        self.routed += 1
+        try:
+            command.handler(ChatContext(self, player, message, command, args))
+        except Exception as e:
+            self.errors += 1
+            self.client.logger.error(f"聊天命令 {' '.join(command.trigger)} 出错: {e}")
+        return True
+
+    def tell(self, player: str, text: str) -> None:
+        """用 tellraw 向玩家发送消息"""
+        target = json.dumps(player, ensure_ascii=False)
+        raw = json.dumps({"rawtext": [{"text": text}]}, ensure_ascii=False)
+        self.client.send_websocket_command_omit_response(f"tellraw {target} {raw}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取统计信息
+
+        返回:
+            命令数、收到的聊天消息数、路由成功数、被限速数、参数错误数与处理出错数
+        """
+        return {
+            "commands": len(self._commands),
+            "messages": self.messages,
+            "routed": self.routed,
+            "rate_limited": self.rate_limited,
+            "argument_errors": self.argument_errors,
+            "errors": self.errors,
+        }
+
+    def _on_text(self, packet_id: int, packet: Dict[str, Any]) -> None:
+        player = packet.get("SourceName")
+        message = packet.get("Message")
+        if player and message:
+            self.dispatch(player, message)
@@ -3,11 +3,9 @@ import time
 import functools
 import json
 import uuid as uuid_lib
-import nbtlib
-import msgpack
 from io import BytesIO
 from collections import defaultdict
-from typing import Optional, Tuple, Callable, Any, List, Dict, DefaultDict, Union
+from typing import Optional, Tuple, Callable, Any, List, Dict, DefaultDict, Union, Iterable, Iterator
 
 from .go_loader.bind import (
     GameAvailable, ConnectGame, DisconnectGame,
@@ -16,11 +14,47 @@ from .go_loader.bind import (
     SendWebSocketCommandNeedResponse, SendPlayerCommandNeedResponse,
     SendSettingsCommand, SendTotalSettingsCommand,
     SendWebSocketCommandOmitResponse, SendPlayerCommandOmitResponse,
-    ListenAllPackets, GetPacketNameIDMapping, SendGamePacket,
+    ListenAllPackets, GetPacketNameIDMappingJSON, SendGamePacket,
     EnterConsole, PlaceNBTBlockInConsole, GetStructureAsNBT, MoveToPosition,
     GetUQHolderData, GetBotDisplayName, GetBotIdentity, GetBotXUID
 )
-from .utils.nbt_writer import MarshalPythonNBTObjectToWriter
+from .utils.lazy_import import lazy_import
+from .utils.command_stream import TotalSettingsCommandProgress, iter_command_chunks
+from .utils.command_batcher import SettingsCommandBatcher
+from .utils.command_scheduler import CommandPriority, CommandScheduler, ScheduledCommand
+from .utils.concurrency_window import AdaptiveConcurrencyWindow, command_type
+from .utils.reconnect import ReconnectSupervisor
+from .utils.outbox import CommandOutbox, outboxable
+from .utils.log_pipeline import LogPipeline, resolve_level
+from .utils.reactor import Reactor, IdleBackoff
+from .utils.command_result import CommandResult
+from .packets import (
+    ListenerSpec, PacketRoute, LazyPacket, Packet, Where, ConflatingSubscription,
+    ListenerQueue, OverflowPolicy,
+    packet_type_for, compile_where, decode_fields, PARTIAL_DECODE_MIN_BYTES
+)
+
+# 重量级依赖在首次使用时才导入
+msgpack = lazy_import("msgpack")
+nbtlib = lazy_import("nbtlib")
+
+# 数据包名称与 ID 映射的缓存，以映射原始 JSON 为键，同一协议版本只解析一次
+_packet_mapping_cache: Dict[str, Tuple[Dict[str, int], Dict[int, str]]] = {}
+
+def load_packet_mapping() -> Tuple[Dict[str, int], Dict[int, str]]:
+    """
+    获取数据包名称与 ID 的双向映射
+
+    返回:
+        (名称 -> ID, ID -> 名称)
+    """
+    raw = GetPacketNameIDMappingJSON()
+    mapping = _packet_mapping_cache.get(raw)
+    if mapping is None:
+        name_to_id = json.loads(raw) if raw else {}
+        id_to_name = {pid: name for name, pid in name_to_id.items()}
+        mapping = _packet_mapping_cache[raw] = (name_to_id, id_to_name)
+    return mapping
 
 class Counter:
     """ID生成器，用于创建唯一标识符"""
@@ -36,8 +70,15 @@ class Counter:
             return f"{self.prefix}_{self.current_i}"
 
 def check_available(func):
+    deferrable = getattr(func, "_outboxable", False)
+    
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
+        # 启用发件箱时，即发即弃的方法在断线期间(或发件箱尚未清空时)直接入箱，保持调用顺序
+        outbox = self._outbox if deferrable else None
+        if outbox is not None and (outbox.pending or not self.check_available()):
+            outbox.put(func.__name__, args, kwargs)
+            return None
         first = True
         # 循环检查，直到返回值为 True
         while True:
@@ -55,7 +96,22 @@ def check_available(func):
     return wrapper
 
 def decorate_core_methods(cls):
-    excluded = {"check_available", "connect", "disconnect"}  # 明确排除的方法名
+    excluded = {
+        "check_available", "connect", "disconnect",
+        "enable_settings_command_batching", "disable_settings_command_batching",
+        "enable_command_scheduler", "disable_command_scheduler",
+        "enable_adaptive_concurrency", "disable_adaptive_concurrency",
+        "_dispatch", "_send_command_need_response",
+        "reconnect", "_connect_game", "_fail_pending_commands",
+        "start_reconnect_supervisor", "stop_reconnect_supervisor",
+        "add_connect_listener", "remove_connect_listener",
+        "enable_outbox", "disable_outbox", "_replay_outbox_entry",
+        "_start_event_thread", "_poll_once", "_packet_type", "_packet_route",
+        "_replace_listener", "_close_listener_specs", "_remove_listener_spec", "listener_stats",
+        # 事件循环与内部辅助方法不能在断线时阻塞，否则共用事件循环的日志与命令响应也会停止
+        "_react", "_handle_mc_packet", "_handle_command_response_cb",
+        "_create_lock_and_result_setter", "_flush_settings_batch", "_stream_total_settings_command"
+    }  # 明确排除的方法名
     # 遍历类属性
     for name in cls.__dict__:
         # 跳过以__开头的方法和排除的方法
@@ -72,12 +128,21 @@ def decorate_core_methods(cls):
 class GameClient:
     """Game 游戏客户端"""
     
-    def __init__(self, logger):
-        """初始化客户端"""
+    def __init__(self, logger, reactor: Optional[Reactor] = None):
+        """
+        初始化客户端
+        
+        参数:
+            logger: 日志记录器
+            reactor: 统一事件循环，指定时游戏事件由其轮询，不再单独启动事件处理线程
+        """
         self.running = False
         self.event_thread = None
         self.connected = False
         self.logger = logger
+        self._reactor = reactor
+        if reactor is not None:
+            reactor.add_source("game", self._poll_once)
         
         # 命令回调系统
         self._cmd_callback_retriever_counter = Counter("cmd_callback")
@@ -87,8 +152,30 @@ class GameClient:
         # 数据包监听系统
         self._packet_name_to_id_mapping: Dict[str, int] = {}
         self._packet_id_to_name_mapping: Dict[int, str] = {}
-        self._packet_listeners: DefaultDict[int, set[Callable[[int, Any], None]]] = defaultdict(set)
+        self._packet_listeners: DefaultDict[int, Dict[Callable[[int, Any], None], ListenerSpec]] = defaultdict(dict)
+        self._packet_types: Dict[int, Optional[type]] = {}
+        self._packet_routes: Dict[int, Optional[PacketRoute]] = {}
         self._packet_lock = threading.Lock()
+        
+        # WO 命令微批处理
+        self._settings_batcher: Optional[SettingsCommandBatcher] = None
+        
+        # 命令优先级调度
+        self._command_scheduler: Optional[CommandScheduler] = None
+        
+        # 需响应命令的自适应并发窗口
+        self._concurrency_window: Optional[AdaptiveConcurrencyWindow] = None
+        
+        # 断线重连
+        self._reconnect_supervisor: Optional[ReconnectSupervisor] = None
+        self._connected_at: Optional[float] = None
+        self._awaiting_first_packet = False
+        self.last_time_to_first_packet: Optional[float] = None
+        # 每次(重新)连接成功后调用，用于重置依赖服务器状态的本地镜像
+        self._connect_listeners: List[Callable[[], None]] = []
+        
+        # 断线期间的命令发件箱
+        self._outbox: Optional[CommandOutbox] = None
     
     def _create_lock_and_result_setter(self) -> Tuple[Callable, Callable]:
         """
@@ -97,20 +184,21 @@ class GameClient:
         返回:
             (结果设置器, 结果获取器)
         """
+        done = threading.Event()
         lock = threading.Lock()
-        lock.acquire()
         ret = [None]
         
         def result_setter(result):
-            """设置命令响应结果"""
-            ret[0] = result
-            lock.release()
+            """设置命令响应结果，只有第一次设置生效"""
+            with lock:
+                if done.is_set():
+                    return
+                ret[0] = result
+                done.set()
         
         def result_getter(timeout: int = -1):
             """获取命令响应结果"""
-            acquired = lock.acquire(timeout=float(timeout) if timeout >= 0 else -1)
-            if acquired:
-                lock.release()
+            done.wait(float(timeout) if timeout >= 0 else None)
             return ret[0]
         
         return result_setter, result_getter
@@ -150,27 +238,36 @@ class GameClient:
         self.server_code = server_code
         self.server_passcode = server_passcode
         self.console_center_pos = console_center_pos
+        self._connect_game()
+        
+        # 启动事件处理线程
+        self.connected = True
+        self._start_event_thread()
+    
+    def _connect_game(self):
+        """使用已保存的参数连接并初始化数据包系统"""
         if err := ConnectGame(
-            auth_server,
-            auth_token,
-            server_code,
-            server_passcode,
-            *console_center_pos
+            self.auth_server,
+            self.auth_token,
+            self.server_code,
+            self.server_passcode,
+            *self.console_center_pos
         ):
             raise ConnectionError(f"连接失败: {err}")
+        self._connected_at = time.monotonic()
+        self._awaiting_first_packet = True
         
-        # 启动事件处理线程
-        self.running = True
-        self.connected = True
-        self.event_thread = threading.Thread(target=self._react, daemon=True)
-        self.event_thread.start()
+        # 在处理新连接的数据包前重置本地镜像
+        for callback in list(self._connect_listeners):
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"连接回调错误: {e}")
         
         # 初始化数据包系统
         ListenAllPackets()
-        self._packet_name_to_id_mapping = GetPacketNameIDMapping()
-        self._packet_id_to_name_mapping = {
-            pid: name for name, pid in self._packet_name_to_id_mapping.items()
-        }
+        self._packet_name_to_id_mapping, self._packet_id_to_name_mapping = load_packet_mapping()
+        self._packet_types.clear()
     
     def disconnect(self):
         """断开游戏连接"""
@@ -184,17 +281,159 @@ class GameClient:
             self.event_thread.join(timeout=2.0)
         
         DisconnectGame()
+        self._fail_pending_commands()
+    
+    def reconnect(self):
+        """
+        使用上次的连接参数重新连接
+        
+        事件处理线程、数据包监听器与各类缓存均被保留，
+        等待中的命令会立即以 None 结束。
+        
+        异常:
+            ConnectionError: 连接失败时抛出
+        """
+        if not hasattr(self, "auth_server"):
+            raise ConnectionError("尚未连接过，无法重连")
+        self._fail_pending_commands()
+        DisconnectGame()
+        self._connect_game()
+        self.connected = True
+        self._start_event_thread()
+    
+    def _start_event_thread(self):
+        """开始处理事件，使用统一事件循环时只需标记为运行中"""
+        self.running = True
+        if self._reactor is not None:
+            return
+        if not (self.event_thread and self.event_thread.is_alive()):
+            self.event_thread = threading.Thread(target=self._react, daemon=True)
+            self.event_thread.start()
+    
+    def _fail_pending_commands(self):
+        """让所有等待响应的命令立即以 None 结束"""
+        with self._callback_lock:
+            callbacks = list(self._game_cmd_callback_events.values())
+            self._game_cmd_callback_events.clear()
+        for callback in callbacks:
+            callback(None)
+    
+    def add_connect_listener(self, callback: Callable[[], None]):
+        """
+        添加连接回调
+        
+        回调在每次 connect() 或 reconnect() 连接成功后、处理新连接的数据包前调用，
+        用于清空或重新同步断线前镜像的服务器状态。
+        
+        参数:
+            callback: 无参数的回调函数
+        """
+        if callback not in self._connect_listeners:
+            self._connect_listeners.append(callback)
+    
+    def remove_connect_listener(self, callback: Callable[[], None]):
+        """
+        移除连接回调
+        
+        参数:
+            callback: 要移除的回调函数
+        """
+        if callback in self._connect_listeners:
+            self._connect_listeners.remove(callback)
+    
+    def start_reconnect_supervisor(self, **kwargs) -> ReconnectSupervisor:
+        """
+        启动断线重连监督器
+        
+        参数:
+            **kwargs: 传给 ReconnectSupervisor 的参数
+            
+        返回:
+            重连监督器，可查看重连统计
+        """
+        self.stop_reconnect_supervisor()
+        self._reconnect_supervisor = ReconnectSupervisor(self, **kwargs)
+        self._reconnect_supervisor.start()
+        return self._reconnect_supervisor
+    
+    def stop_reconnect_supervisor(self):
+        """停止断线重连监督器"""
+        supervisor, self._reconnect_supervisor = self._reconnect_supervisor, None
+        if supervisor is not None:
+            supervisor.stop()
+    
+    def enable_outbox(self, **kwargs) -> CommandOutbox:
+        """
+        启用断线期间的命令发件箱
+        
+        启用后 send_settings_command、send_*_omit_response 与 send_game_packet
+        在断线期间不再阻塞调用方，而是暂存到发件箱，恢复连接后按限定速率重放。
+        
+        参数:
+            **kwargs: 传给 CommandOutbox 的参数(capacity、ttl、path、replay_rate)
+            
+        返回:
+            命令发件箱，可查看暂存与重放统计
+        """
+        self.disable_outbox()
+        outbox = CommandOutbox(self._replay_outbox_entry, self.check_available, logger=self.logger, **kwargs)
+        outbox.start()
+        self._outbox = outbox
+        return outbox
+    
+    def disable_outbox(self):
+        """停用命令发件箱，未重放的条目仅在启用了持久化文件时保留"""
+        outbox, self._outbox = self._outbox, None
+        if outbox is None:
+            return
+        outbox.stop()
+        if outbox.pending and outbox.path is None:
+            self.logger.warning(f"发件箱停用，丢弃 {outbox.pending} 条未重放的命令")
+    
+    def _replay_outbox_entry(self, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]):
+        """跳过可用性检查与发件箱，直接调用被暂存的方法"""
+        getattr(type(self), method).__wrapped__(self, *args, **kwargs)
     
     def _react(self):
         """事件处理主循环"""
+        idle = IdleBackoff()
         while self.running:
             try:
-                event_type, retriever = EventPoll()
-                
-                if not event_type or not retriever:
-                    time.sleep(0.01)
-                    continue
-                
+                if self._poll_once():
+                    idle.reset()
+                else:
+                    idle.idle()
+            except Exception as e:
+                self.logger.error(f"事件处理错误: {e}")
+                time.sleep(0.1)
+    
+    def _poll_once(self, max_events: int = 64) -> int:
+        """
+        取出并处理一批事件
+        
+        不在每次轮询时检查 GameAvailable：断线期间 EventPoll 没有事件，
+        事件处理方法也不会等待连接恢复。
+        
+        参数:
+            max_events: 最多处理的事件数
+            
+        返回:
+            本次处理的事件数
+        """
+        if not self.running:
+            return 0
+        handled = 0
+        while handled < max_events:
+            event_type, retriever = EventPoll()
+            if not event_type or not retriever:
+                break
+            handled += 1
+            
+            if self._awaiting_first_packet and event_type == "MCPacket":
+                self._awaiting_first_packet = False
+                self.last_time_to_first_packet = time.monotonic() - self._connected_at
+            
+            try:
                 if event_type == "CommandResponseCB":
                     self._handle_command_response_cb(retriever)
                 elif event_type == "MCPacket":
@@ -203,7 +442,7 @@ class GameClient:
                     OmitEvent()
             except Exception as e:
                 self.logger.error(f"事件处理错误: {e}")
-                time.sleep(0.1)
+        return handled
     
     def _handle_command_response_cb(self, retriever: str):
         """处理命令响应事件"""
@@ -211,10 +450,8 @@ class GameClient:
         if resp is None:
             return
             
-        try:
-            data = json.loads(resp)
-        except json.JSONDecodeError:
-            data = resp
+        # 响应在访问时才解析，事件循环中不做 JSON 解析
+        data = CommandResult(resp) if CommandResult.looks_like_json(resp) else resp
         
         with self._callback_lock:
             callback = self._game_cmd_callback_events.get(retriever)
@@ -233,138 +470,487 @@ class GameClient:
             OmitEvent()
             return
             
-        with self._packet_lock:
-            listeners = self._packet_listeners.get(packet_id, set()).copy()
-        
-        if not listeners:
+        route = self._packet_route(packet_id)
+        if route is None:
             OmitEvent()
             return
             
-        packet_data_bytes, _, convert_error = ConsumeMCPacket()
+        packet_buffer, _, convert_error = ConsumeMCPacket(as_buffer=True)
         
         if convert_error:
             self.logger.error(f"数据包 {packet_id} 处理出错: {convert_error}")
             return
+        
+        packet_type = self._packet_type(packet_id) if route.any_typed else None
+        # 所有监听器共享同一个延迟解码的数据包，解码结果只计算一次
+        lazy_packet = LazyPacket(packet_id, packet_buffer, packet_type)
+        specs = route.always
+        values: Dict[str, Any] = {}
+        if route.fields:
+            try:
+                # 谓词与合并键只需要少数字段，数据较大且无需完整解码时只读取这些字段；
+                # 小数据包完整解码更快，解码结果缓存在 LazyPacket 中供投递时复用
+                if route.eager_always or len(packet_buffer) < PARTIAL_DECODE_MIN_BYTES:
+                    values = lazy_packet.value
+                else:
+                    values = decode_fields(packet_buffer.view, route.fields)
+            except Exception as e:
+                self.logger.error(f"解析数据包失败: {e}")
+                return
+        if route.groups:
+            specs = route.select(values)
+            if not specs:
+                return
+        
+        packet_data = typed_packet = None
+        if not all(spec.lazy for spec in specs):
+            try:
+                # 使用msgpack直接从 Go 内存解析数据包
+                packet_data = lazy_packet.value
+                if packet_type is not None:
+                    typed_packet = lazy_packet.packet
+            except Exception as e:
+                self.logger.error(f"解析数据包失败: {e}")
+                return
             
-        try:
-            # 使用msgpack解析数据包
-            packet_data = msgpack.unpackb(packet_data_bytes, strict_map_key=False)
-        except Exception as e:
-            self.logger.error(f"解析数据包失败: {e}")
-            return
-            
-        for listener in listeners:
+        for spec in specs:
+            if spec.conflation is not None:
+                # 交给合并订阅，被覆盖的数据包不会被解码
+                spec.conflation.offer(packet_id, values.get(spec.conflation.key), lazy_packet)
+                continue
+            if spec.lazy:
+                payload = lazy_packet
+            elif spec.typed and typed_packet is not None:
+                payload = typed_packet
+            else:
+                payload = packet_data
+            if spec.queue is not None:
+                spec.queue.put(packet_id, payload)
+                continue
             try:
-                listener(packet_id, packet_data)
+                spec.callback(packet_id, payload)
             except Exception as e:
                 self.logger.error(f"数据包监听器错误: {e}")
     
-    def send_websocket_command_need_response(self, cmd: str, timeout: int = 5) -> Any:
+    def _packet_route(self, packet_id: int) -> Optional[PacketRoute]:
+        """获取数据包 ID 的分发表(带缓存)，没有监听器时返回 None"""
+        try:
+            return self._packet_routes[packet_id]
+        except KeyError:
+            pass
+        with self._packet_lock:
+            specs = self._packet_listeners.get(packet_id)
+            route = self._packet_routes[packet_id] = PacketRoute(specs.values()) if specs else None
+        return route
+    
+    def _packet_type(self, packet_id: int) -> Optional[type]:
+        """获取数据包 ID 对应的类型化数据包类(带缓存)"""
+        try:
+            return self._packet_types[packet_id]
+        except KeyError:
+            packet_type = self._packet_types[packet_id] = packet_type_for(packet_id, self._packet_id_to_name_mapping)
+            return packet_type
+    
+    def send_websocket_command_need_response(
+        self,
+        cmd: str,
+        timeout: int = 5,
+        *,
+        priority: Optional[CommandPriority] = None,
+        tag: str = "default"
+    ) -> Any:
         """
         发送 WebSocket 命令并等待响应
         
         参数:
             cmd: 命令字符串
             timeout: 超时时间(秒)，默认5秒
+            priority: 启用命令调度器时的优先级，默认为 NORMAL
+            tag: 启用命令调度器时的调用方标签
             
         返回:
-            命令响应数据
+            命令响应，为只读映射 CommandResult(访问时才解析，需要 dict 时调用 to_dict())；
+            响应不是 JSON 时为原始字符串，超时返回 None
         """
-        setter, getter = self._create_lock_and_result_setter()
-        retriever_id = next(self._cmd_callback_retriever_counter)
-        
-        with self._callback_lock:
-            self._game_cmd_callback_events[retriever_id] = setter
-        
-        try:
-            SendWebSocketCommandNeedResponse(cmd, retriever_id)
-            return getter(timeout=timeout)
-        finally:
-            with self._callback_lock:
-                if retriever_id in self._game_cmd_callback_events:
-                    del self._game_cmd_callback_events[retriever_id]
+        return self._send_command_need_response(SendWebSocketCommandNeedResponse, cmd, timeout, priority, tag)
     
-    def send_player_command_need_response(self, cmd: str, timeout: int = 5) -> Any:
+    def send_player_command_need_response(
+        self,
+        cmd: str,
+        timeout: int = 5,
+        *,
+        priority: Optional[CommandPriority] = None,
+        tag: str = "default"
+    ) -> Any:
         """
         发送 Player 命令并等待响应
         
         参数:
             cmd: 命令字符串
             timeout: 超时时间(秒)，默认5秒
+            priority: 启用命令调度器时的优先级，默认为 NORMAL
+            tag: 启用命令调度器时的调用方标签
             
         返回:
-            命令响应数据
+            命令响应，为只读映射 CommandResult(访问时才解析，需要 dict 时调用 to_dict())；
+            响应不是 JSON 时为原始字符串，超时返回 None
         """
+        return self._send_command_need_response(SendPlayerCommandNeedResponse, cmd, timeout, priority, tag)
+
+    def _send_command_need_response(
+        self,
+        sender: Callable[[str, str], None],
+        cmd: str,
+        timeout: int,
+        priority: Optional[CommandPriority],
+        tag: str
+    ) -> Any:
+        """发送需要响应的命令并等待响应"""
+        window = self._concurrency_window
+        if window is not None:
+            start = time.monotonic()
+            if not window.acquire(timeout if timeout >= 0 else None):
+                return None
+            if timeout >= 0:
+                timeout = max(0.0, timeout - (time.monotonic() - start))
+        
         setter, getter = self._create_lock_and_result_setter()
         retriever_id = next(self._cmd_callback_retriever_counter)
         
         with self._callback_lock:
             self._game_cmd_callback_events[retriever_id] = setter
         
+        job = None
+        result = None
+        dispatched = False
+        sent_at = time.monotonic()
         try:
-            SendPlayerCommandNeedResponse(cmd, retriever_id)
-            return getter(timeout=timeout)
+            job = self._dispatch(sender, (cmd, retriever_id), priority, tag)
+            dispatched = True
+            result = getter(timeout=timeout)
+            return result
         finally:
+            # 超时仍在排队的命令不再发送
+            unsent = job is not None and job.cancel()
             with self._callback_lock:
-                if retriever_id in self._game_cmd_callback_events:
-                    del self._game_cmd_callback_events[retriever_id]
+                # 回调已被移除说明命令因断线被提前结束，而不是超时
+                pending = self._game_cmd_callback_events.pop(retriever_id, None) is not None
+            if window is not None:
+                if result is None:
+                    if dispatched and pending and not unsent:
+                        window.release(command_type(cmd), None)
+                    else:
+                        window.abort()
+                else:
+                    # 经由调度器发送时从实际发出的时刻开始计时
+                    if job is not None and job.dispatched_at is not None:
+                        sent_at = job.dispatched_at
+                    window.release(command_type(cmd), time.monotonic() - sent_at)
+
+    def enable_adaptive_concurrency(self, **kwargs) -> AdaptiveConcurrencyWindow:
+        """
+        启用需响应命令的自适应并发窗口
+
+        在途命令数受 AIMD 窗口限制：时延稳定时窗口逐步增大，
+        超时或时延突增时窗口减半，使批量查询贴近服务器的实际承载能力。
+
+        参数:
+            **kwargs: 传给 AdaptiveConcurrencyWindow 的参数
+
+        返回:
+            并发窗口，可查看窗口大小与往返时延百分位数
+        """
+        self._concurrency_window = AdaptiveConcurrencyWindow(**kwargs)
+        return self._concurrency_window
+
+    def disable_adaptive_concurrency(self):
+        """停用需响应命令的自适应并发窗口"""
+        self._concurrency_window = None
+
+    def enable_command_scheduler(self, scheduler: Optional[CommandScheduler] = None) -> CommandScheduler:
+        """
+        启用命令优先级调度器
+
+        启用后所有 send_* 方法都经由调度器发送：高优先级命令总是先于低优先级命令，
+        每个优先级有独立的令牌桶限速，同优先级内按调用方标签加权公平排队。
+
+        参数:
+            scheduler: 自定义调度器，默认使用默认速率创建
+
+        返回:
+            使用中的调度器
+        """
+        remaining = self.disable_command_scheduler()
+        self._command_scheduler = scheduler or CommandScheduler(logger=self.logger)
+        # 旧调度器中尚未发送的命令转交新调度器
+        for job in remaining:
+            self._command_scheduler.submit(job.func, job.args, job.priority, job.tag, job.cost)
+        return self._command_scheduler
+
+    def disable_command_scheduler(self) -> List[ScheduledCommand]:
+        """
+        停用命令优先级调度器
+
+        排队中的命令会被取消，不会集中发送；同步等待结果的调用方改为各自直接发送。
+
+        返回:
+            被取消的命令，调用方可自行重新发送
+        """
+        scheduler, self._command_scheduler = self._command_scheduler, None
+        if scheduler is None:
+            return []
+        return [job for job in scheduler.stop() if not job.awaited]
+
+    def _dispatch(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        priority: Optional[CommandPriority],
+        tag: str,
+        cost: float = 1.0,
+        wait: bool = False
+    ) -> Any:
+        """
+        直接或经由调度器调用发送函数
+
+        返回:
+            wait 为 True 或未启用调度器时为发送函数的返回值，否则为已提交的命令
+        """
+        scheduler = self._command_scheduler
+        if scheduler is not None:
+            try:
+                job = scheduler.submit(
+                    func, args, CommandPriority.NORMAL if priority is None else priority, tag, cost, wait
+                )
+            except RuntimeError:
+                # 调度器在读取后被停用，改为直接发送
+                job = None
+            if job is not None:
+                if not wait:
+                    return job
+                try:
+                    return job.result()
+                except RuntimeError:
+                    if not job.cancelled:
+                        raise
+                    # 调度器停止时命令仍在排队，改为直接发送
+        result = func(*args)
+        return result if wait else None
     
-    def send_settings_command(self, cmd: str):
+    @outboxable
+    def send_settings_command(
+        self,
+        cmd: str,
+        *,
+        priority: Optional[CommandPriority] = None,
+        tag: str = "default"
+    ):
         """
         发送 WO 命令
+
+        启用微批处理后命令会先入队，由批处理器合并发送。
         
         参数:
             cmd: 命令字符串
+            priority: 启用命令调度器时的优先级，默认为 NORMAL(微批处理时不生效)
+            tag: 启用命令调度器时的调用方标签
+        """
+        batcher = self._settings_batcher
+        if batcher is not None:
+            batcher.add(cmd)
+            return
+        self._dispatch(SendSettingsCommand, (cmd,), priority, tag)
+
+    def enable_settings_command_batching(
+        self,
+        window: float = 0.02,
+        max_batch: int = 256
+    ) -> SettingsCommandBatcher:
         """
-        SendSettingsCommand(cmd)
+        启用 WO 命令微批处理
+
+        send_settings_command 提交的命令在时间窗口内或达到条数上限后，
+        按提交顺序通过 send_total_settings_command 批量发送。
+
+        参数:
+            window: 第一条命令入队后最长等待时间(秒)
+            max_batch: 单批最多命令条数
+
+        返回:
+            微批处理器，可用于查看统计信息
+        """
+        self.disable_settings_command_batching()
+        self._settings_batcher = SettingsCommandBatcher(self._flush_settings_batch, window, max_batch, logger=self.logger)
+        return self._settings_batcher
+
+    def disable_settings_command_batching(self):
+        """发送剩余命令并停用 WO 命令微批处理"""
+        batcher, self._settings_batcher = self._settings_batcher, None
+        if batcher is not None:
+            batcher.close()
+
+    def flush_settings_commands(self) -> int:
+        """
+        立即发送微批处理器中积压的 WO 命令
+
+        返回:
+            本次发送的命令条数
+        """
+        batcher = self._settings_batcher
+        if batcher is None:
+            return 0
+        return batcher.flush()
+
+    def _flush_settings_batch(self, batch: List[str]):
+        """批量发送一批 WO 命令"""
+        if not self.send_total_settings_command(batch, priority=CommandPriority.NORMAL, tag="batcher"):
+            self.logger.error(f"批量发送 {len(batch)} 条 WO 命令失败")
     
-    def send_total_settings_command(self, cmds: str | list) -> bool:
+    def send_total_settings_command(
+        self,
+        cmds: str | Iterable[str],
+        chunk_commands: int = 4096,
+        chunk_bytes: int = 1 << 20,
+        chunk_interval: float = 0.0,
+        max_rate: Optional[float] = None,
+        wait: bool = True,
+        on_progress: Optional[Callable[[TotalSettingsCommandProgress], None]] = None,
+        *,
+        priority: Optional[CommandPriority] = None,
+        tag: str = "default"
+    ) -> TotalSettingsCommandProgress:
         """
-        发送大量 WO 命令
-        
+        分块发送大量 WO 命令
+
+        命令被惰性地切分为有界大小的块逐块发送，峰值内存只与块大小有关。
+
         参数:
-            cmd: 命令字符串
-            
+            cmds: 以换行分隔的命令字符串，或命令的可迭代对象(可为生成器)
+            chunk_commands: 每块最多命令条数
+            chunk_bytes: 每块最多 UTF-8 字节数
+            chunk_interval: 相邻两块之间的间隔(秒)
+            max_rate: 平均发送速率上限(条/秒)，默认不限制
+            wait: 是否阻塞到全部发送完毕，为 False 时在后台线程发送
+            on_progress: 每发送一块后调用的进度回调
+            priority: 启用命令调度器时的优先级，默认为 BULK
+            tag: 启用命令调度器时的调用方标签
+
         返回:
-            是否成功
+            进度句柄，布尔值为是否全部发送成功
         """
-        if isinstance(cmds, list):
-            cmds = "\n".join(cmds)
-        return SendTotalSettingsCommand(cmds)
+        progress = TotalSettingsCommandProgress()
+        chunks = iter_command_chunks(cmds, chunk_commands, chunk_bytes)
+        priority = CommandPriority.BULK if priority is None else priority
+        args = (chunks, progress, chunk_interval, max_rate, on_progress, priority, tag)
+        if wait:
+            self._stream_total_settings_command(*args)
+        else:
+            threading.Thread(target=self._stream_total_settings_command, args=args, daemon=True).start()
+        return progress
+
+    def _stream_total_settings_command(
+        self,
+        chunks: Iterator[Tuple[bytes, int]],
+        progress: TotalSettingsCommandProgress,
+        chunk_interval: float,
+        max_rate: Optional[float],
+        on_progress: Optional[Callable[[TotalSettingsCommandProgress], None]],
+        priority: CommandPriority,
+        tag: str
+    ):
+        """逐块发送 WO 命令并更新进度"""
+        error = None
+        try:
+            for index, (payload, count) in enumerate(chunks):
+                if progress.cancelled:
+                    break
+                if index and chunk_interval > 0:
+                    time.sleep(chunk_interval)
+                if max_rate:
+                    # 按已发送条数计算下一块的最早发送时间
+                    delay = progress.started_at + (progress.sent_commands + progress.failed_commands) / max_rate - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                ok = self._dispatch(SendTotalSettingsCommand, (payload,), priority, tag, cost=count, wait=True)
+                progress._record_chunk(index, count, ok)
+                if on_progress:
+                    try:
+                        on_progress(progress)
+                    except Exception as e:
+                        self.logger.error(f"进度回调处理错误: {e}")
+        except Exception as e:
+            error = e
+            self.logger.error(f"大量 WO 命令发送出错: {e}")
+        finally:
+            progress._finish(error)
     
-    def send_websocket_command_omit_response(self, cmd: str):
+    @outboxable
+    def send_websocket_command_omit_response(
+        self,
+        cmd: str,
+        *,
+        priority: Optional[CommandPriority] = None,
+        tag: str = "default"
+    ):
         """
         发送 WebSocket 命令并忽略响应
         
         参数:
             cmd: 命令字符串
+            priority: 启用命令调度器时的优先级，默认为 NORMAL
+            tag: 启用命令调度器时的调用方标签
         """
-        SendWebSocketCommandOmitResponse(cmd)
+        self._dispatch(SendWebSocketCommandOmitResponse, (cmd,), priority, tag)
     
-    def send_player_command_omit_response(self, cmd: str):
+    @outboxable
+    def send_player_command_omit_response(
+        self,
+        cmd: str,
+        *,
+        priority: Optional[CommandPriority] = None,
+        tag: str = "default"
+    ):
         """
         发送 Player 命令并忽略响应
         
         参数:
             cmd: 命令字符串
+            priority: 启用命令调度器时的优先级，默认为 NORMAL
+            tag: 启用命令调度器时的调用方标签
         """
-        SendPlayerCommandOmitResponse(cmd)
+        self._dispatch(SendPlayerCommandOmitResponse, (cmd,), priority, tag)
     
-    def send_game_packet(self, packet_id: int, content: Any):
+    @outboxable
+    def send_game_packet(
+        self,
+        packet_id: int,
+        content: Any,
+        *,
+        priority: Optional[CommandPriority] = None,
+        tag: str = "default"
+    ):
         """
         发送游戏数据包
         
         参数:
             packet_id: 数据包ID
             content: 数据包内容(可序列化为JSON)
+            priority: 启用命令调度器时的优先级，默认为 NORMAL
+            tag: 启用命令调度器时的调用方标签
         """        
-        if error := SendGamePacket(packet_id, json.dumps(content)):
+        if error := self._dispatch(SendGamePacket, (packet_id, json.dumps(content)), priority, tag, wait=True):
             raise RuntimeError(f"发送数据包失败: {error}")
     
     def add_packets_listener(
         self,
         targets: int | List[int],
-        callback: Callable[[int, Any], None]
+        callback: Callable[[int, Any], None],
+        *,
+        typed: bool = False,
+        lazy: bool = False,
+        where: Optional[Dict[str, Any] | Where] = None,
+        queue_size: Optional[int] = None,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST
     ):
         """
         添加数据包监听器
@@ -372,12 +958,71 @@ class GameClient:
         参数:
             targets: 目标数据包ID或列表
             callback: 回调函数，参数为(数据包ID, 数据包内容)
+            typed: 为 True 时已注册类型的数据包(如 MovePlayer、Text)以带 __slots__ 的
+                数据包对象传入，字段以属性访问；其余数据包仍以字典传入
+            lazy: 为 True 时传入 LazyPacket，首次访问字段时才解码，只统计或按 ID 处理的
+                监听器几乎没有解码开销；其 packet 属性为类型化数据包(typed 时)
+            where: 顶层字段条件，如 {"TextType": 1, "Message": Prefix("!")}；
+                普通值表示相等，list/tuple/set 表示属于，也可使用 Equals/In/Prefix/Regex。
+                较大的数据包只解码相关字段后求值，不满足时不调用回调
+            queue_size: 指定时监听器在专属的有界队列后由独立线程调用，
+                慢速监听器不会拖慢事件循环，可通过 listener_stats() 查看积压情况
+            overflow: 队列满时的处理方式: drop_oldest、drop_newest、block(阻塞事件循环)
+                或 disconnect(移除该监听器)
         """
         if isinstance(targets, int):
             targets = [targets]
+        spec = ListenerSpec(callback, typed, lazy, compile_where(where))
+        if queue_size is not None:
+            spec.queue = ListenerQueue(
+                callback, queue_size, overflow,
+                on_disconnect=lambda _: self._remove_listener_spec(spec),
+                logger=self.logger
+            )
+        removed: List[ListenerSpec] = []
         with self._packet_lock:
             for t in targets:
-                self._packet_listeners[t].add(callback)
+                removed.extend(self._replace_listener(t, callback, spec))
+        self._close_listener_specs(removed)
+    
+    def add_conflating_listener(
+        self,
+        targets: int | List[int],
+        callback: Callable[[int, Any], None],
+        key: str = "EntityRuntimeID",
+        rate: float = 20.0,
+        *,
+        typed: bool = False,
+        where: Optional[Dict[str, Any] | Where] = None
+    ) -> ConflatingSubscription:
+        """
+        添加最新值合并监听器
+        
+        适用于 MovePlayer、MoveActorDelta、SetActorData 等高频状态数据包:
+        按 key 字段只保留每个键的最新数据包，以不超过 rate 的频率投递，
+        较大的被覆盖数据包不会被完整解码(小数据包完整解码比读取键字段更快)。
+        
+        参数:
+            targets: 目标数据包ID或列表
+            callback: 回调函数，参数为(数据包ID, 数据包内容)，在合并订阅的投递线程中调用
+            key: 区分状态的顶层字段名
+            rate: 每秒最多投递的轮数
+            typed: 是否投递类型化数据包
+            where: 顶层字段条件，同 add_packets_listener
+            
+        返回:
+            合并订阅，可查看合并比等统计信息
+        """
+        if isinstance(targets, int):
+            targets = [targets]
+        subscription = ConflatingSubscription(callback, key, rate, typed, self.logger)
+        spec = ListenerSpec(callback, typed, True, compile_where(where), subscription)
+        removed: List[ListenerSpec] = []
+        with self._packet_lock:
+            for t in targets:
+                removed.extend(self._replace_listener(t, callback, spec))
+        self._close_listener_specs(removed)
+        return subscription
     
     def remove_packet_listener(
         self,
@@ -392,13 +1037,77 @@ class GameClient:
             callback: 要移除的回调函数
         """
         with self._packet_lock:
-            if packet_id in self._packet_listeners:
-                self._packet_listeners[packet_id].discard(callback)
+            removed = self._replace_listener(packet_id, callback, None)
+        self._close_listener_specs(removed)
+    
+    def _replace_listener(
+        self,
+        packet_id: int,
+        callback: Callable[[int, Any], None],
+        spec: Optional[ListenerSpec]
+    ) -> List[ListenerSpec]:
+        """
+        替换或移除(spec 为 None 时)监听器，需持有 _packet_lock
+        
+        返回:
+            不再被使用的注册信息，需在释放 _packet_lock 后交给 _close_listener_specs，
+            避免等待卡住的回调时阻塞事件循环的分发表重建
+        """
+        listeners = self._packet_listeners[packet_id]
+        old = listeners.pop(callback, None)
+        if spec is not None:
+            listeners[callback] = spec
+        elif not listeners:
+            del self._packet_listeners[packet_id]
+        self._packet_routes.pop(packet_id, None)
+        if old is not None and old is not spec:
+            # 同一注册信息可能还挂在其他数据包 ID 上
+            still_used = any(
+                s is old for ls in self._packet_listeners.values() for s in ls.values()
+            )
+            if not still_used:
+                return [old]
+        return []
+    
+    def _close_listener_specs(self, specs: Iterable[ListenerSpec], wait: bool = True):
+        """释放已移除监听器占用的资源"""
+        for spec in set(specs):
+            if spec.conflation is not None:
+                spec.conflation.stop()
+            if spec.queue is not None:
+                spec.queue.stop(wait)
+    
+    def _remove_listener_spec(self, spec: ListenerSpec):
+        """从所有数据包 ID 上移除该监听器，不等待其正在执行的回调"""
+        with self._packet_lock:
+            for packet_id, listeners in list(self._packet_listeners.items()):
+                if listeners.get(spec.callback) is spec:
+                    del listeners[spec.callback]
+                    if not listeners:
+                        del self._packet_listeners[packet_id]
+                    self._packet_routes.pop(packet_id, None)
+        self._close_listener_specs([spec], wait=False)
+    
+    def listener_stats(self) -> List[Dict[str, Any]]:
+        """
+        获取使用专属队列的监听器的统计信息
+        
+        返回:
+            每个监听器的队列深度、高水位、丢弃数与排队/处理耗时百分位数，按积压程度降序排列
+        """
+        with self._packet_lock:
+            specs = {id(spec): spec for listeners in self._packet_listeners.values() for spec in listeners.values()}
+        stats = [spec.queue.stats() for spec in specs.values() if spec.queue is not None]
+        stats.sort(key=lambda s: (s["depth"], s["dropped"]), reverse=True)
+        return stats
     
     def remove_all_listeners(self):
         """移除所有数据包监听器"""
         with self._packet_lock:
+            specs = [spec for listeners in self._packet_listeners.values() for spec in listeners.values()]
             self._packet_listeners.clear()
+            self._packet_routes.clear()
+        self._close_listener_specs(specs)
     
     def get_uqholder_data(self) -> dict | None:
         """
@@ -407,14 +1116,15 @@ class GameClient:
         返回:
             UQHolder 数据
         """
-        uqholder_data_bytes, _, marshal_error = GetUQHolderData()
+        uqholder_buffer, _, marshal_error = GetUQHolderData(as_buffer=True)
         if marshal_error:
             self.logger.error(f"获取 UQHolder 失败: {marshal_error}")
             return
-        if uqholder_data_bytes is None:
+        if uqholder_buffer is None:
             return
         
-        uqholder_data = {k: msgpack.unpackb(v, strict_map_key=False) for k, v in msgpack.unpackb(uqholder_data_bytes).items()}
+        with uqholder_buffer:
+            uqholder_data = {k: msgpack.unpackb(v, strict_map_key=False) for k, v in msgpack.unpackb(uqholder_buffer.view).items()}
         players_info_holder_data = {}
         for uuid, player in uqholder_data["PlayersInfoHolder"].items():
             player["UUID"] = uuid_lib.UUID(bytes=uuid)
@@ -486,7 +1196,7 @@ class GameClient:
         self,
         block_name: str,
         block_states: str,
-        block_nbt: bytes | nbtlib.tag.Compound
+        block_nbt: "bytes | nbtlib.tag.Compound"
     ) -> Tuple[bool, str, Tuple[int, int, int], Optional[str]]:
         """
         在控制台放置NBT方块
@@ -499,7 +1209,8 @@ class GameClient:
         返回:
             (是否可快速放置, 唯一ID, (x偏移, y偏移, z偏移), 错误信息)
         """
-        if isinstance(block_nbt, nbtlib.tag.Compound):
+        if not isinstance(block_nbt, bytes):
+            from .utils.nbt_writer import MarshalPythonNBTObjectToWriter
             block_nbt_buffer = BytesIO()
             MarshalPythonNBTObjectToWriter(block_nbt_buffer, block_nbt, "")
             block_nbt_bytes = block_nbt_buffer.getvalue()
@@ -511,7 +1222,7 @@ class GameClient:
         self,
         block_name: str,
         block_states: str,
-        block_nbt: bytes | nbtlib.tag.Compound,
+        block_nbt: "bytes | nbtlib.tag.Compound",
         block_pos: Tuple[int, int, int]
     ) -> Optional[str]:
         """
@@ -547,7 +1258,7 @@ class GameClient:
         # 统一命令执行和错误检查
         def execute_command(cmd):
             result = self.send_websocket_command_need_response(cmd)
-            if not result or not result["OutputMessages"][0]["Success"]:
+            if not isinstance(result, CommandResult) or not result.success:
                 return f"发送 WebSocket 命令失败 ({cmd})"
             return None
     
@@ -586,28 +1297,29 @@ class GameClient:
         finally:
             structure_delete_cmd = '/structure delete "place_nbt_block_in_world"'
             result = self.send_websocket_command_need_response(structure_delete_cmd)
-            if not result or not result["OutputMessages"][0]["Success"]:
+            if not isinstance(result, CommandResult) or not result.success:
                 # 记录删除失败但不中断主流程
                 self.logger.warning(f"结构删除失败 ({structure_delete_cmd})")
     
         return None
     
-    def get_structure_as_nbt(self, origin, size):
+    def get_structure_as_nbt(self, origin, size, as_buffer: bool = False):
         """
         获取一个结构 NBT
         
         参数:
             origin: 结构在世界的坐标
             size: 结构的大小
+            as_buffer: 为 True 时返回不复制的 GoBuffer，使用完毕后需调用 release() 或用 with 语句释放
         
         返回:
-            NBT 字节
+            NBT 字节或 GoBuffer
         """
-        structure_nbt_data_bytes, _, convert_error = GetStructureAsNBT(*origin, *size)
+        structure_nbt_data, _, convert_error = GetStructureAsNBT(*origin, *size, as_buffer=as_buffer)
         if convert_error:
             self.logger.error(f"结构 NBT 处理出错: {convert_error}")
             return
-        return structure_nbt_data_bytes
+        return structure_nbt_data
 
     def move_to_pos(self, pos, facing):
         return MoveToPosition(
@@ -631,37 +1343,105 @@ class GameClient:
 class LogClient:
     """Game 日志处理客户端"""
     
-    def __init__(self, logger):
-        """初始化日志客户端"""
+    def __init__(
+        self,
+        logger,
+        batch_size: int = 256,
+        idle_interval: float = 0.01,
+        async_sink: bool = True,
+        reactor: Optional[Reactor] = None,
+        **pipeline_kwargs
+    ):
+        """
+        初始化日志客户端
+        
+        参数:
+            logger: 日志记录器
+            batch_size: 每次唤醒最多取出的日志条数
+            idle_interval: 无日志时的最长轮询间隔(秒)
+            async_sink: 是否由独立线程调用 logger，避免输出拖慢轮询
+            reactor: 统一事件循环，指定时日志由其轮询，不再单独启动轮询线程
+            **pipeline_kwargs: 传给 LogPipeline 的参数(max_queue、rate、burst、dedup_window)
+        """
         self.logger = logger
         if not hasattr(self.logger, "success"):
             self.logger.success = self.logger.info
-        self.event_thread = threading.Thread(target=self._react, daemon=True)
-        self.event_thread.start()
+        self.batch_size = batch_size
+        self.idle_interval = idle_interval
         self.log_callback: Optional[Callable[[str, str], Tuple[str, str]]] = None
+        self.pipeline: Optional[LogPipeline] = None
+        if async_sink:
+            self.pipeline = LogPipeline(logger, **pipeline_kwargs)
+            self.pipeline.start()
+        self.filtered = 0
+        self.event_thread = None
+        if reactor is not None:
+            reactor.add_source("log", self._poll_once)
+        else:
+            self.event_thread = threading.Thread(target=self._react, daemon=True)
+            self.event_thread.start()
 
-    def _react(self):
-        while True:
+    def _is_enabled(self, levelno: int) -> bool:
+        """logger 是否会输出该级别，不支持级别判断的 logger 视为全部输出"""
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        return is_enabled_for is None or is_enabled_for(levelno)
+
+    def _handle_log(self, level: str, message: str):
+        """过滤并输出一条日志"""
+        if self.log_callback:
+            level, message = self.log_callback(level.upper(), message)
+        resolved = resolve_level(level)
+        if resolved is None:
+            return
+        method, levelno = resolved
+        # 在回调之后、格式化之前过滤，避免为不会输出的日志付出代价
+        if not self._is_enabled(levelno):
+            self.filtered += 1
+            return
+        if self.pipeline is not None:
+            self.pipeline.submit(method, levelno, message)
+        else:
+            getattr(self.logger, method)(message)
+
+    def _poll_once(self, max_events: Optional[int] = None) -> int:
+        """
+        取出并处理一批日志
+        
+        参数:
+            max_events: 最多处理的日志条数，默认为 batch_size
+            
+        返回:
+            本次处理的日志条数
+        """
+        limit = self.batch_size if max_events is None else max_events
+        handled = 0
+        while handled < limit:
             level, message = LogEventPoll()
             if not level or not message:
-                time.sleep(0.01)
-                continue
-                
-            level = level.upper()
-            if self.log_callback:
-                level, message = self.log_callback(level, message)
-                
-            if level == "TRACE":
-                self.logger.info(message)
-            elif level == "DEBUG":
-                self.logger.debug(message)
-            elif level == "INFO":
-                self.logger.info(message)
-            elif level == "WARN":
-                self.logger.warning(message)
-            elif level == "ERROR":
-                self.logger.error(message)
-            elif level == "FATAL":
-                self.logger.critical(message)
-            elif level == "UNKNOWN":
-                self.logger.info(message)
+                break
+            handled += 1
+            try:
+                self._handle_log(level, message)
+            except Exception as e:
+                self.logger.error(f"日志处理错误: {e}")
+        return handled
+
+    def _react(self):
+        idle = IdleBackoff(min(0.0005, self.idle_interval), self.idle_interval)
+        while True:
+            if self._poll_once():
+                idle.reset()
+            else:
+                idle.idle()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取日志统计信息
+        
+        返回:
+            被级别过滤的日志数，以及异步输出管线的统计
+        """
+        stats = {"filtered": self.filtered}
+        if self.pipeline is not None:
+            stats.update(self.pipeline.stats())
+        return stats
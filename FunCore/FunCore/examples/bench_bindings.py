@@ -0,0 +1,77 @@
+"""
+go_loader 绑定层微基准
+
+逐个测量每个绑定函数的单次调用耗时(含参数编组与返回值转换)。
+连接相关与会改变游戏状态的绑定默认只在已连接时测量，需设置以下环境变量:
+    FUNCORE_AUTH_SERVER, FUNCORE_AUTH_TOKEN, FUNCORE_SERVER_CODE, FUNCORE_SERVER_PASSCODE
+"""
+import os
+import sys
+import timeit
+from typing import Callable, List, Tuple
+
+from FunCore.go_loader import bind
+from FunCore.go_loader.utils.conversion import toCString, _encodeCached
+
+def bench(name: str, func: Callable[[], object], number: int) -> None:
+    """测量并打印单次调用耗时"""
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<40} {best * 1e9:>10.0f} ns/次")
+
+def offline_cases() -> List[Tuple[str, Callable[[], object], int]]:
+    """无需连接即可调用的绑定"""
+    cmd = "/testfor @a[tag=benchmark]"
+    return [
+        ("toCString(缓存命中)", lambda: toCString(cmd), 200000),
+        ("str.encode(无缓存)", lambda: cmd.encode("utf-8"), 200000),
+        ("GameAvailable", bind.GameAvailable, 100000),
+        ("EventPoll", bind.EventPoll, 100000),
+        ("LogEventPoll", bind.LogEventPoll, 100000),
+        ("ConsumeCommandResponseCB", bind.ConsumeCommandResponseCB, 100000),
+        ("ChangeLanguage", lambda: bind.ChangeLanguage("zh_CN"), 100000),
+        ("FreeMem(NULL)", lambda: bind.FreeMem(None), 100000),
+    ]
+
+def online_cases() -> List[Tuple[str, Callable[[], object], int]]:
+    """需要连接到游戏的绑定"""
+    cmd = "/testfor @s"
+    return [
+        ("SendSettingsCommand", lambda: bind.SendSettingsCommand(cmd), 10000),
+        ("SendTotalSettingsCommand", lambda: bind.SendTotalSettingsCommand(cmd), 10000),
+        ("SendWebSocketCommandOmitResponse", lambda: bind.SendWebSocketCommandOmitResponse(cmd), 10000),
+        ("SendPlayerCommandOmitResponse", lambda: bind.SendPlayerCommandOmitResponse(cmd), 10000),
+        ("SendWebSocketCommandNeedResponse", lambda: bind.SendWebSocketCommandNeedResponse(cmd, "bench"), 10000),
+        ("SendPlayerCommandNeedResponse", lambda: bind.SendPlayerCommandNeedResponse(cmd, "bench"), 10000),
+        ("GetPacketNameIDMapping", bind.GetPacketNameIDMapping, 1000),
+        ("GetUQHolderData", bind.GetUQHolderData, 1000),
+        ("GetUQHolderData(as_buffer)", lambda: bind.GetUQHolderData(as_buffer=True)[0].release(), 1000),
+        ("GetBotDisplayName", bind.GetBotDisplayName, 10000),
+        ("GetBotIdentity", bind.GetBotIdentity, 10000),
+        ("GetBotXUID", bind.GetBotXUID, 10000),
+        ("ListenAllPackets", bind.ListenAllPackets, 1000),
+        ("MoveToPosition", lambda: bind.MoveToPosition(0, 100, 0, 0, 0, 0), 1000),
+        ("GetStructureAsNBT(1x1x1)", lambda: bind.GetStructureAsNBT(0, 0, 0, 1, 1, 1), 100),
+    ]
+
+if __name__ == "__main__":
+    for name, func, number in offline_cases():
+        bench(name, func, number)
+    print(f"编码缓存: {_encodeCached.cache_info()}")
+
+    if not os.environ.get("FUNCORE_AUTH_SERVER"):
+        print("未设置 FUNCORE_AUTH_SERVER，跳过需要连接的绑定")
+        sys.exit(0)
+    if err := bind.ConnectGame(
+        os.environ["FUNCORE_AUTH_SERVER"],
+        os.environ.get("FUNCORE_AUTH_TOKEN", ""),
+        os.environ.get("FUNCORE_SERVER_CODE", ""),
+        os.environ.get("FUNCORE_SERVER_PASSCODE", ""),
+        -30, 0, 30
+    ):
+        print(f"连接失败: {err}")
+        sys.exit(1)
+    try:
+        for name, func, number in online_cases():
+            bench(name, func, number)
+    finally:
+        bind.DisconnectGame()
@@ -0,0 +1,100 @@
+"""
+GameClient 离线基准
+
+以纯 Python 的假运行库(go_loader/fake_runtime)代替 FunCore 动态库，无需租赁服即可测量:
+    数据包分发吞吐: 假运行库每次轮询都提供数据包时，监听器每秒收到的数据包数
+    命令往返时延: 需响应命令在固定的模拟服务器时延下的额外开销分位数
+    断线恢复: 周期性断线时重连监督器的恢复情况
+结果由固定随机种子的场景产生，可在不同版本间对比。
+"""
+import logging
+import statistics
+import threading
+import time
+from typing import Dict, List
+
+from FunCore import GameClient
+from FunCore.go_loader.fake_runtime import FakeScenario, use_fake_runtime
+
+def make_client() -> GameClient:
+    """创建并连接到假运行库的客户端"""
+    logger = logging.getLogger("bench")
+    logger.setLevel(logging.WARNING)
+    if not hasattr(logger, "success"):
+        # 与 LogClient 一致，恢复连接的提示使用 success 级别
+        logger.success = logger.info
+    client = GameClient(logger=logger)
+    client.connect("fake", "fake", "fake", "fake")
+    return client
+
+def bench_packet_throughput(duration: float = 3.0) -> None:
+    """数据包分发吞吐"""
+    lib = use_fake_runtime(FakeScenario(packet_rate=None, packets=[("MovePlayer", {
+        "EntityRuntimeID": 2, "Position": [0.0, 64.0, 0.0], "Pitch": 0.0, "Yaw": 0.0, "HeadYaw": 0.0,
+        "Mode": 0, "OnGround": True, "Tick": 0,
+    })]))
+    client = make_client()
+    received = [0]
+    def on_packet(packet_id, packet):
+        received[0] += 1
+    client.add_packets_listener(client._packet_name_to_id_mapping["MovePlayer"], on_packet)
+    time.sleep(duration)
+    client.disconnect()
+    stats = lib.stats()
+    print(f"数据包分发: {received[0] / duration:>10.0f} 个/秒 (产生 {stats['packets']}，未释放内存块 {stats['live_allocations']})")
+
+def bench_command_latency(number: int = 500, latency: float = 0.005, concurrency: int = 8) -> None:
+    """需响应命令的往返时延"""
+    lib = use_fake_runtime(FakeScenario(packet_rate=200, command_latency=latency))
+    client = make_client()
+    samples: List[float] = []
+    lock = threading.Lock()
+    def worker(count: int) -> None:
+        for _ in range(count):
+            start = time.perf_counter()
+            result = client.send_websocket_command_need_response("/testfor @a", 5)
+            elapsed = time.perf_counter() - start
+            if result is not None:
+                with lock:
+                    samples.append(elapsed - latency)
+    threads = [threading.Thread(target=worker, args=(number // concurrency,)) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    total = time.perf_counter() - start
+    client.disconnect()
+    if not samples:
+        print("命令往返: 没有收到响应")
+        return
+    q = statistics.quantiles(samples, n=100)
+    print(
+        f"命令往返(扣除 {latency * 1000:.0f} ms 模拟时延): "
+        f"p50 {q[49] * 1000:.2f} ms, p99 {q[98] * 1000:.2f} ms, "
+        f"{len(samples) / total:.0f} 条/秒 ({concurrency} 线程，响应 {lib.stats()['responses']})"
+    )
+
+def bench_reconnect(duration: float = 3.0, disconnect_after: float = 0.5) -> Dict[str, int]:
+    """周期性断线时的恢复情况"""
+    lib = use_fake_runtime(FakeScenario(packet_rate=500, disconnect_after=disconnect_after))
+    client = make_client()
+    supervisor = client.start_reconnect_supervisor(check_interval=0.05, grace=0.0, base_delay=0.05)
+    answered = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        if client.send_websocket_command_need_response("/list", 1) is not None:
+            answered += 1
+    client.stop_reconnect_supervisor()
+    client.disconnect()
+    stats = lib.stats()
+    print(
+        f"断线恢复: 断线 {stats['disconnects']} 次，期间收到响应 {answered} 条，"
+        f"丢失响应 {stats['responses_lost']} 条，监督器 {supervisor.stats()}"
+    )
+    return stats
+
+if __name__ == "__main__":
+    bench_packet_throughput()
+    bench_command_latency()
+    bench_reconnect()
@@ -0,0 +1,95 @@
+"""
+谓词与合并键的部分解码基准
+
+对不同大小的数据包比较三种取得谓词/合并键字段的方式:
+    完整解码: msgpack.unpackb 整个数据包
+    部分解码: decode_fields 只读取所需字段
+    按大小选择: 小于 PARTIAL_DECODE_MIN_BYTES 时完整解码，否则部分解码(GameClient 的做法)
+并以大多数数据包不满足谓词、或被合并覆盖的数据流测量总耗时。
+"""
+import timeit
+from typing import Any, Dict, List, Tuple
+
+import msgpack
+
+from FunCore.packets import decode_fields, PARTIAL_DECODE_MIN_BYTES
+
+def sample_packets() -> List[Tuple[str, Dict[str, Any], Tuple[str, ...]]]:
+    """(名称, 数据包, 谓词或合并键字段)"""
+    move = {
+        "EntityRuntimeID": 2, "Position": [0.0, 64.0, 0.0], "Pitch": 0.0, "Yaw": 0.0, "HeadYaw": 0.0,
+        "Mode": 0, "OnGround": True, "RiddenEntityRuntimeID": 0, "TeleportCause": 0,
+        "TeleportSourceEntityType": 0, "Tick": 0,
+    }
+    text = {
+        "TextType": 0, "NeedsTranslation": False, "SourceName": "Steve", "Message": "hello world",
+        "Parameters": [], "XUID": "2535400000000000", "PlatformChatID": "", "FilteredMessage": "",
+    }
+    actor_data = {
+        "EntityRuntimeID": 3, "Tick": 0, "EntityProperties": {},
+        "EntityMetadata": {str(i): {"Type": i % 8, "Value": [i] * 4} for i in range(60)},
+    }
+    add_actor = {
+        "EntityUniqueID": -5, "EntityRuntimeID": 5, "EntityType": "minecraft:zombie",
+        "Position": [0.0, 64.0, 0.0], "Velocity": [0.0, 0.0, 0.0],
+        "Attributes": [{"Name": f"attr{i}", "Min": 0.0, "Value": 1.0, "Max": 20.0} for i in range(30)],
+        "EntityMetadata": {str(i): {"Type": i % 8, "Value": [i] * 8} for i in range(200)},
+    }
+    return [
+        ("Text", text, ("TextType",)),
+        ("MovePlayer", move, ("EntityRuntimeID",)),
+        ("SetActorData", actor_data, ("EntityRuntimeID",)),
+        ("AddActor", add_actor, ("EntityType",)),
+    ]
+
+def full(data, fields) -> Dict[str, Any]:
+    return msgpack.unpackb(data, strict_map_key=False)
+
+def partial(data, fields) -> Dict[str, Any]:
+    return decode_fields(data, fields)
+
+def adaptive(data, fields) -> Dict[str, Any]:
+    if len(data) < PARTIAL_DECODE_MIN_BYTES:
+        return msgpack.unpackb(data, strict_map_key=False)
+    return decode_fields(data, fields)
+
+STRATEGIES = (("完整解码", full), ("部分解码", partial), ("按大小选择", adaptive))
+
+def bench_per_packet(number: int = 50000) -> None:
+    """单个数据包取得字段的耗时"""
+    print(f"部分解码阈值: {PARTIAL_DECODE_MIN_BYTES} 字节")
+    for name, packet, fields in sample_packets():
+        data = memoryview(msgpack.packb(packet))
+        results = []
+        for label, strategy in STRATEGIES:
+            best = min(timeit.repeat(lambda: strategy(data, fields), number=number, repeat=5)) / number
+            results.append(f"{label} {best * 1e9:>8.0f} ns")
+        print(f"{name:<14} {len(data):>6} 字节  " + "  ".join(results))
+
+def bench_stream(names: Tuple[str, ...], count: int = 100000, match_every: int = 10) -> None:
+    """
+    数据流: 每 match_every 个数据包只有一个满足谓词(或未被合并覆盖)，需要完整解码后投递
+
+    与 GameClient 一致，完整解码得到的字典直接用于投递，不再重复解码。
+
+    参数:
+        names: 数据流中轮流出现的数据包名称
+        count: 数据包数
+        match_every: 投递间隔
+    """
+    packets = [(memoryview(msgpack.packb(p)), f) for name, p, f in sample_packets() if name in names]
+    stream = [packets[i % len(packets)] for i in range(count)]
+    for label, strategy in STRATEGIES:
+        def run() -> None:
+            for index, (data, fields) in enumerate(stream):
+                values = strategy(data, fields)
+                if index % match_every == 0 and len(values) <= len(fields):
+                    # 谓词成立且只取得了部分字段，投递前仍需完整解码
+                    msgpack.unpackb(data, strict_map_key=False)
+        elapsed = min(timeit.repeat(run, number=1, repeat=3))
+        print(f"{'+'.join(names)} ({count} 个，1/{match_every} 投递) {label}: {elapsed:.3f} s")
+
+if __name__ == "__main__":
+    bench_per_packet()
+    bench_stream(("Text", "MovePlayer"))
+    bench_stream(("Text", "MovePlayer", "SetActorData"), count=20000)
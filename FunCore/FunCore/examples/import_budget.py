@@ -0,0 +1,67 @@
+"""
+导入耗时预算检查
+
+在全新的解释器中以 -X importtime 导入各模块，统计累计导入耗时，
+并确认导入过程不会加载 FunCore 动态库或不需要的重量级依赖。
+任一模块超出预算时以非零状态码退出。
+"""
+import subprocess
+import sys
+from typing import Dict, Iterable, Tuple
+
+# 模块 -> (耗时预算(秒), 导入后不应出现的模块)
+BUDGETS: Dict[str, Tuple[float, Iterable[str]]] = {
+    "FunCore.utils.uqholder_parser": (0.15, ("msgpack", "nbtlib", "tooldelta")),
+    "FunCore.utils.nbt_writer": (0.6, ("msgpack", "tooldelta")),
+    "FunCore": (0.3, ("msgpack", "nbtlib", "tooldelta")),
+}
+
+CHECK_SCRIPT = """
+import sys
+import {module}
+runtime = sys.modules.get("FunCore.go_loader.runtime")
+assert runtime is None or runtime._lib is None, "导入时加载了动态库"
+loaded = [name for name in {forbidden!r} if name in sys.modules]
+assert not loaded, f"导入时加载了: {{loaded}}"
+"""
+
+def measure(module: str, forbidden: Iterable[str]) -> float:
+    """
+    在子进程中导入模块
+
+    返回:
+        累计导入耗时(秒)
+
+    异常:
+        AssertionError: 导入时加载了动态库或不应出现的模块
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK_SCRIPT.format(module=module, forbidden=tuple(forbidden))],
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        raise AssertionError(proc.stderr.strip().splitlines()[-1])
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # 只累加顶层导入，子模块已计入其父模块的累计耗时
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1e6
+
+if __name__ == "__main__":
+    failed = False
+    for module, (budget, forbidden) in BUDGETS.items():
+        try:
+            elapsed = measure(module, forbidden)
+        except AssertionError as e:
+            print(f"FAIL {module}: {e}")
+            failed = True
+            continue
+        status = "OK  " if elapsed <= budget else "FAIL"
+        failed |= elapsed > budget
+        print(f"{status} {module}: {elapsed * 1000:.1f} ms (预算 {budget * 1000:.0f} ms)")
+    sys.exit(1 if failed else 0)
@@ -1,6 +1,7 @@
 from .utils import (
     FreeMem,
-    ChangeLanguage
+    ChangeLanguage,
+    GoBuffer
 )
 
 from .event_basic import (
@@ -32,6 +33,7 @@ from .commands_async_actions import (
 from. packets_actions import (
     ListenAllPackets,
     GetPacketNameIDMapping,
+    GetPacketNameIDMappingJSON,
     SendGamePacket
 )
 
@@ -1,9 +1,9 @@
-from .init import LIB, CString, toPyString
+from .init import declare, CString, toPyString
 from typing import Optional
 
-LIB.EnterConsole.restype = CString
+_EnterConsole = declare("EnterConsole", [], CString)
 def EnterConsole() -> Optional[str]:
     """进入控制台"""
-    error = LIB.EnterConsole()
+    error = _EnterConsole()
     if error:
         return toPyString(error)
@@ -1,10 +1,9 @@
-from .init import LIB, GoInt32, toGoInt32, toPyInt, toPyString, toPyBytes
+from .init import declare, GoInt32, toPyInt, toPyString
 from .defines import GetStructureAsNBT_return
+from ..utils.go_buffer import GoBuffer, take_go_bytes
 from typing import Tuple, Optional
-import ctypes
 
-LIB.GetStructureAsNBT.argtypes = [GoInt32, GoInt32, GoInt32, GoInt32, GoInt32, GoInt32]
-LIB.GetStructureAsNBT.restype = GetStructureAsNBT_return
+_GetStructureAsNBT = declare("GetStructureAsNBT", [GoInt32] * 6, GetStructureAsNBT_return)
 def GetStructureAsNBT(
     origin_x: int,
     origin_y: int,
@@ -12,7 +11,8 @@ def GetStructureAsNBT(
     size_x: int,
     size_y: int,
     size_z: int,
-) -> Tuple[Optional[bytes], Optional[int], Optional[str]]:
+    as_buffer: bool = False,
+) -> Tuple[Optional[bytes | GoBuffer], Optional[int], Optional[str]]:
     """
     获取一个区域的结构(NBT 形式)
     
@@ -23,18 +23,12 @@ def GetStructureAsNBT(
         size_x: X 长度
         size_y: Y 长度
         size_z: Z 长度
+        as_buffer: 为 True 时返回不复制的 GoBuffer，由调用方负责释放
         
     返回:
         (结构字节, 结构字节长度, 错误信息)
     """
-    result = LIB.GetStructureAsNBT(
-        toGoInt32(origin_x),
-        toGoInt32(origin_y),
-        toGoInt32(origin_z),
-        toGoInt32(size_x),
-        toGoInt32(size_y),
-        toGoInt32(size_z),
-    )
+    result = _GetStructureAsNBT(origin_x, origin_y, origin_z, size_x, size_y, size_z)
     structure_nbt_bytes, length, convert_error = result.structure_nbt_bytes, toPyInt(result.length), toPyString(result.convert_error)
     if convert_error:
         return None, length, convert_error
@@ -43,8 +37,6 @@ def GetStructureAsNBT(
         return None, 0, "无效结构 NBT"
     
     try:
-        # 复制数据并释放原始内存
-        structure_nbt_data_bytes = toPyBytes(ctypes.string_at(structure_nbt_bytes, length))
-        return structure_nbt_data_bytes, length, None
+        return take_go_bytes(structure_nbt_bytes, length, as_buffer), length, None
     except Exception as e:
         return None, 0, f"数据复制错误: {str(e)}"
@@ -1,7 +1,7 @@
-from .init import LIB, CString, toPyString, toGoFloat32
+from .init import declare, CString, GoFloat32, toPyString
 from typing import Optional
 
-LIB.MoveToPosition.restype = CString
+_MoveToPosition = declare("MoveToPosition", [GoFloat32] * 6, CString)
 def MoveToPosition(
         x: float | int,
         y: float | int,
@@ -11,13 +11,6 @@ def MoveToPosition(
         head_yaw: float | int,
 ) -> Optional[str]:
     """移动到一个坐标"""
-    error = LIB.MoveToPosition(
-        toGoFloat32(x),
-        toGoFloat32(y),
-        toGoFloat32(z),
-        toGoFloat32(pitch),
-        toGoFloat32(yaw),
-        toGoFloat32(head_yaw)
-    )
+    error = _MoveToPosition(x, y, z, pitch, yaw, head_yaw)
     if error:
         return toPyString(error)
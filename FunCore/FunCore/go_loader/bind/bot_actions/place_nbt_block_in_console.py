@@ -1,9 +1,8 @@
-from .init import LIB, CString, GoInt, toCString, toGoInt, toPyString, toPyBool, toPyInt
+from .init import declare, CString, GoInt, toCString, toPyString, toPyBool, toPyInt
 from .defines import PlaceNBTBlockInConsole_return
 from typing import Tuple, Optional
 
-LIB.PlaceNBTBlockInConsole.argtypes = [CString, CString, CString, GoInt]
-LIB.PlaceNBTBlockInConsole.restype = PlaceNBTBlockInConsole_return
+_PlaceNBTBlockInConsole = declare("PlaceNBTBlockInConsole", [CString, CString, CString, GoInt], PlaceNBTBlockInConsole_return)
 def PlaceNBTBlockInConsole(
     blockName: str,
     blockStatesString: str,
@@ -20,11 +19,11 @@ def PlaceNBTBlockInConsole(
     返回:
         (是否可快速放置, 唯一 ID, (x 偏移, y 偏移, z 偏移), 错误信息)
     """
-    result = LIB.PlaceNBTBlockInConsole(
+    result = _PlaceNBTBlockInConsole(
         toCString(blockName),
         toCString(blockStatesString),
-        CString(blockNBTCBytes),
-        toGoInt(len(blockNBTCBytes))
+        blockNBTCBytes,
+        len(blockNBTCBytes)
     )
     
     unique_id = toPyString(result.unique_id)
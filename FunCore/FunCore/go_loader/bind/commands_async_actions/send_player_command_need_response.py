@@ -1,6 +1,7 @@
-from .init import LIB, CString, toCString
+from .init import declare, CString, toCString
 
-LIB.SendPlayerCommandNeedResponse.argtypes = [CString, CString]
+_SendPlayerCommandNeedResponse = declare("SendPlayerCommandNeedResponse", [CString, CString])
 def SendPlayerCommandNeedResponse(cmd: str, retriever: str):
     """发送 Player 命令(需要响应)"""
-    LIB.SendPlayerCommandNeedResponse(toCString(cmd), toCString(retriever))
+    # 检索器 ID 每次都不同，不进入编码缓存
+    _SendPlayerCommandNeedResponse(toCString(cmd), retriever.encode("utf-8"))
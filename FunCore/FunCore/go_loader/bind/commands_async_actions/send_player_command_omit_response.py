@@ -1,6 +1,6 @@
-from .init import LIB, CString, toCString
+from .init import declare, CString, toCString
 
-LIB.SendPlayerCommandOmitResponse.argtypes = [CString]
+_SendPlayerCommandOmitResponse = declare("SendPlayerCommandOmitResponse", [CString])
 def SendPlayerCommandOmitResponse(cmd: str):
     """发送 Player 命令(忽略响应)"""
-    LIB.SendPlayerCommandOmitResponse(toCString(cmd))
+    _SendPlayerCommandOmitResponse(toCString(cmd))
@@ -1,6 +1,6 @@
-from .init import LIB, CString, toCString
+from .init import declare, CString, toCString
 
-LIB.SendWOCommand.argtypes = [CString]
+_SendWOCommand = declare("SendWOCommand", [CString])
 def SendSettingsCommand(cmd: str):
     """发送 WO 命令"""
-    LIB.SendWOCommand(toCString(cmd))
+    _SendWOCommand(toCString(cmd))
@@ -1,7 +1,6 @@
-from .init import LIB, CString, GoBool, toPyBool, toCString
+from .init import declare, CString, GoBool, toPyBool, toCString
 
-LIB.SendTotalWOCommand.argtypes = [CString]
-LIB.SendTotalWOCommand.restypes = GoBool
-def SendTotalSettingsCommand(cmds: str) -> bool:
-    """发送大量 WO 命令"""
-    return toPyBool(LIB.SendTotalWOCommand(toCString(cmds)))
+_SendTotalWOCommand = declare("SendTotalWOCommand", [CString], GoBool)
+def SendTotalSettingsCommand(cmds: str | bytes) -> bool:
+    """发送大量 WO 命令(以换行分隔)"""
+    return toPyBool(_SendTotalWOCommand(toCString(cmds)))
@@ -1,6 +1,7 @@
-from .init import LIB, CString, toCString
+from .init import declare, CString, toCString
 
-LIB.SendWebSocketCommandNeedResponse.argtypes = [CString, CString]
+_SendWebSocketCommandNeedResponse = declare("SendWebSocketCommandNeedResponse", [CString, CString])
 def SendWebSocketCommandNeedResponse(cmd: str, retriever: str):
     """发送 WebSocket 命令(需要响应)"""
-    LIB.SendWebSocketCommandNeedResponse(toCString(cmd), toCString(retriever))
+    # 检索器 ID 每次都不同，不进入编码缓存
+    _SendWebSocketCommandNeedResponse(toCString(cmd), retriever.encode("utf-8"))
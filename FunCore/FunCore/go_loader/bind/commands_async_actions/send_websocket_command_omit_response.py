@@ -1,6 +1,6 @@
-from .init import LIB, CString, toCString
+from .init import declare, CString, toCString
 
-LIB.SendWebSocketCommandOmitResponse.argtypes = [CString]
+_SendWebSocketCommandOmitResponse = declare("SendWebSocketCommandOmitResponse", [CString])
 def SendWebSocketCommandOmitResponse(cmd: str):
     """发送 WebSocket 命令(忽略响应)"""
-    LIB.SendWebSocketCommandOmitResponse(toCString(cmd))
+    _SendWebSocketCommandOmitResponse(toCString(cmd))
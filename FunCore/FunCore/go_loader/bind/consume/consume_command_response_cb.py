@@ -1,8 +1,8 @@
-from .init import LIB, CString, toPyString
+from .init import declare, CString, toPyString
 from typing import Optional
 
-LIB.ConsumeCommandResponseCB.restype = CString
+_ConsumeCommandResponseCB = declare("ConsumeCommandResponseCB", [], CString)
 def ConsumeCommandResponseCB() -> Optional[str]:
     """消费命令响应回调"""
-    result = LIB.ConsumeCommandResponseCB()
+    result = _ConsumeCommandResponseCB()
     return toPyString(result) if result else None
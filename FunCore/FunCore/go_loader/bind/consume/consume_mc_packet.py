@@ -1,12 +1,20 @@
-from .init import LIB, toPyInt, toPyString, toPyBytes
+from .init import declare, toPyInt, toPyString
 from .defines import ConsumeMCPacket_return
+from ..utils.go_buffer import GoBuffer, take_go_bytes
 from typing import Tuple, Optional
-import ctypes
 
-LIB.ConsumeMCPacket.restype = ConsumeMCPacket_return
-def ConsumeMCPacket() -> Tuple[Optional[bytes], int, Optional[str]]:
-    """消费 MC 数据包"""
-    result = LIB.ConsumeMCPacket()
+_ConsumeMCPacket = declare("ConsumeMCPacket", [], ConsumeMCPacket_return)
+def ConsumeMCPacket(as_buffer: bool = False) -> Tuple[Optional[bytes | GoBuffer], int, Optional[str]]:
+    """
+    消费 MC 数据包
+    
+    参数:
+        as_buffer: 为 True 时返回不复制的 GoBuffer，由调用方负责释放
+        
+    返回:
+        (数据包字节, 数据长度, 错误信息)
+    """
+    result = _ConsumeMCPacket()
     packet_bytes, length, convert_error = result.packet_bytes, toPyInt(result.length), toPyString(result.convert_error)
     
     if convert_error:
@@ -16,8 +24,6 @@ def ConsumeMCPacket() -> Tuple[Optional[bytes], int, Optional[str]]:
         return None, 0, "无效数据包"
     
     try:
-        # 复制数据并释放原始内存
-        packet_data_bytes = toPyBytes(ctypes.string_at(packet_bytes, length))
-        return packet_data_bytes, length, None
+        return take_go_bytes(packet_bytes, length, as_buffer), length, None
     except Exception as e:
         return None, 0, f"数据复制错误: {str(e)}"
@@ -1,9 +1,9 @@
-from .init import LIB, toPyString
+from .init import declare, toPyString
 from .defines import Event
 from typing import Tuple, Optional
 
-LIB.EventPoll.restype = Event
+_EventPoll = declare("EventPoll", [], Event)
 def EventPoll() -> Tuple[Optional[str], Optional[str]]:
     """轮询事件队列"""
-    event = LIB.EventPoll()
-    return toPyString(event.type), toPyString(event.retriever)
\ No newline at end of file
+    event = _EventPoll()
+    return toPyString(event.type), toPyString(event.retriever)
@@ -1,9 +1,9 @@
-from .init import LIB, toPyString
+from .init import declare, toPyString
 from .defines import LogEvent
 from typing import Tuple, Optional
 
-LIB.LogEventPoll.restype = LogEvent
+_LogEventPoll = declare("LogEventPoll", [], LogEvent)
 def LogEventPoll() -> Tuple[Optional[str], Optional[str]]:
     """轮询日志事件队列"""
-    event = LIB.LogEventPoll()
+    event = _LogEventPoll()
     return toPyString(event.level), toPyString(event.message)
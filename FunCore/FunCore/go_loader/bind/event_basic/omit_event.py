@@ -1,5 +1,6 @@
-from .init import LIB
+from .init import declare
 
+_OmitEvent = declare("OmitEvent")
 def OmitEvent():
     """忽略当前事件"""
-    LIB.OmitEvent()
+    _OmitEvent()
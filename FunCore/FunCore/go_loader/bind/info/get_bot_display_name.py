@@ -1,7 +1,7 @@
-from .init import LIB, CString, toPyString
+from .init import declare, CString, toPyString
 from typing import Optional
 
-LIB.GetBotDisplayName.restype = CString
+_GetBotDisplayName = declare("GetBotDisplayName", [], CString)
 def GetBotDisplayName() -> Optional[str]:
     """获取机器人名称"""
-    return toPyString(LIB.GetBotDisplayName())
+    return toPyString(_GetBotDisplayName())
@@ -1,7 +1,7 @@
-from .init import LIB, CString, toPyString
+from .init import declare, CString, toPyString
 from typing import Optional
 
-LIB.GetBotIdentity.restype = CString
+_GetBotIdentity = declare("GetBotIdentity", [], CString)
 def GetBotIdentity() -> Optional[str]:
     """获取机器人 UUID"""
-    return toPyString(LIB.GetBotIdentity())
+    return toPyString(_GetBotIdentity())
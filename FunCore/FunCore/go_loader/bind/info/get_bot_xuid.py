@@ -1,7 +1,7 @@
-from .init import LIB, CString, toPyString
+from .init import declare, CString, toPyString
 from typing import Optional
 
-LIB.GetBotXUID.restype = CString
+_GetBotXUID = declare("GetBotXUID", [], CString)
 def GetBotXUID() -> Optional[str]:
     """获取机器人 XUID"""
-    return toPyString(LIB.GetBotXUID())
+    return toPyString(_GetBotXUID())
@@ -1,19 +1,28 @@
-from .init import LIB, toPyInt, toPyString, toPyBytes
+from .init import declare, toPyInt, toPyString
 from .defines import MarshalUQHolderData_return
+from ..utils.go_buffer import GoBuffer, take_go_bytes
 from typing import Tuple, Optional
-import ctypes
 
-LIB.GetUQHolderData.restype = MarshalUQHolderData_return
-def GetUQHolderData() -> Tuple[Optional[bytes], int, Optional[str]]:
-    """获取 UQHolder 数据"""
-    result = LIB.GetUQHolderData()
+_GetUQHolderData = declare("GetUQHolderData", [], MarshalUQHolderData_return)
+def GetUQHolderData(as_buffer: bool = False) -> Tuple[Optional[bytes | GoBuffer], int, Optional[str]]:
+    """
+    获取 UQHolder 数据
+    
+    参数:
+        as_buffer: 为 True 时返回不复制的 GoBuffer，由调用方负责释放
+        
+    返回:
+        (UQHolder 字节, 数据长度, 错误信息)
+    """
+    result = _GetUQHolderData()
     uqholder_bytes, length, marshal_error = result.uqholder_bytes, toPyInt(result.length), toPyString(result.marshal_error)
     if marshal_error:
         return None, length, marshal_error
     
+    if not uqholder_bytes or length <= 0:
+        return None, 0, None
+    
     try:
-        # 复制数据并释放原始内存
-        uqholder_data_bytes = toPyBytes(ctypes.string_at(uqholder_bytes, length))
-        return uqholder_data_bytes, length, None
+        return take_go_bytes(uqholder_bytes, length, as_buffer), length, None
     except Exception as e:
         return None, 0, f"数据复制错误: {str(e)}"
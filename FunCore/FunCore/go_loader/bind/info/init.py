@@ -1,3 +1,3 @@
-from ...runtime import LIB
+from ...runtime import LIB, declare
 from ...utils.alias import *
 from ...utils.conversion import *
@@ -1,8 +1,7 @@
-from .init import LIB, CString, GoInt32, toCString, toGoInt32, toPyString
+from .init import declare, CString, GoInt32, toCString, toPyString
 from typing import Optional
 
-LIB.ConnectGame.restype = CString
-LIB.ConnectGame.argtypes = [CString, CString, CString, CString, GoInt32, GoInt32, GoInt32]
+_ConnectGame = declare("ConnectGame", [CString, CString, CString, CString, GoInt32, GoInt32, GoInt32], CString)
 def ConnectGame(
     auth_server: str,   # 验证服务器地址
     auth_token: str,    # 验证服务器 token
@@ -18,14 +17,14 @@ def ConnectGame(
     返回:
         错误信息(成功时为 None)
     """
-    err_ptr = LIB.ConnectGame(
+    err_ptr = _ConnectGame(
         toCString(auth_server),
         toCString(auth_token),
         toCString(server_code),
         toCString(server_passcode),
-        toGoInt32(console_center_x),
-        toGoInt32(console_center_y),
-        toGoInt32(console_center_z),
+        console_center_x,
+        console_center_y,
+        console_center_z,
     )
     
     if err_ptr:
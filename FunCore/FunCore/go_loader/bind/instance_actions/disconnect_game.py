@@ -1,5 +1,6 @@
-from .init import LIB
+from .init import declare
 
+_DisconnectGame = declare("DisconnectGame")
 def DisconnectGame():
     """断开游戏连接"""
-    LIB.DisconnectGame()
+    _DisconnectGame()
@@ -1,6 +1,6 @@
-from .init import LIB, GoBool, toPyBool
+from .init import declare, GoBool
 
-LIB.GameAvailable.restype = GoBool
+_GameAvailable = declare("GameAvailable", [], GoBool)
 def GameAvailable() -> bool:
     """检查实例是否可用"""
-    return toPyBool(LIB.GameAvailable())
+    return _GameAvailable()
@@ -1,3 +1,3 @@
 from .listen_all_packets import ListenAllPackets
-from .get_packet_name_id_mapping import GetPacketNameIDMapping
+from .get_packet_name_id_mapping import GetPacketNameIDMapping, GetPacketNameIDMappingJSON
 from .send_game_packet import SendGamePacket
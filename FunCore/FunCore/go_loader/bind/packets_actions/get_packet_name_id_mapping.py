@@ -1,13 +1,16 @@
-from .init import LIB, CString, toPyString
+from .init import declare, CString, toPyString
 from typing import Dict
 import json
 
-LIB.GetPacketNameIDMapping.restype = CString
+_GetPacketNameIDMapping = declare("GetPacketNameIDMapping", [], CString)
+def GetPacketNameIDMappingJSON() -> str:
+    """获取数据包名称与 ID 映射的原始 JSON"""
+    mapping_ptr = _GetPacketNameIDMapping()
+    if not mapping_ptr:
+        return ""
+    return toPyString(mapping_ptr)
+
 def GetPacketNameIDMapping() -> Dict[str, int]:
     """获取数据包名称与 ID 的映射"""
-    mapping_ptr = LIB.GetPacketNameIDMapping()
-    if not mapping_ptr:
-        return {}
-    
-    mapping_str = toPyString(mapping_ptr)
+    mapping_str = GetPacketNameIDMappingJSON()
     return json.loads(mapping_str) if mapping_str else {}
@@ -1,5 +1,6 @@
-from .init import LIB
+from .init import declare
 
+_ListenAllPackets = declare("ListenAllPackets")
 def ListenAllPackets():
     """监听所有数据包"""
-    LIB.ListenAllPackets()
+    _ListenAllPackets()
@@ -1,8 +1,7 @@
-from .init import LIB, GoInt, CString, toGoInt, toCString
+from .init import declare, GoInt, CString, toCString, toPyString
 from typing import Optional
 
-LIB.SendGamePacket.argtypes = [GoInt, CString]
-LIB.SendGamePacket.restype = CString
+_SendGamePacket = declare("SendGamePacket", [GoInt, CString], CString)
 def SendGamePacket(packetID: int, jsonStr: str) -> Optional[str]:
     """
     发送游戏数据包
@@ -14,7 +13,7 @@ def SendGamePacket(packetID: int, jsonStr: str) -> Optional[str]:
     返回:
         error: 错误信息
     """
-    err_ptr = LIB.SendGamePacket(toGoInt(packetID), toCString(jsonStr))
+    err_ptr = _SendGamePacket(packetID, toCString(jsonStr))
     if err_ptr:
         err_msg = toPyString(err_ptr)
         return err_msg
@@ -1,2 +1,3 @@
 from .free_mem import FreeMem
 from .change_language import ChangeLanguage
+from .go_buffer import GoBuffer, take_go_bytes
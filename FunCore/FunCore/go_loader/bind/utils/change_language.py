@@ -1,6 +1,6 @@
-from .init import LIB, CString, toCString
+from .init import declare, CString, toCString
 
-LIB.ChangeLanguage.argtypes = [CString]
+_ChangeLanguage = declare("ChangeLanguage", [CString])
 def ChangeLanguage(language = "zh_CN"):
     """切换语言"""
-    LIB.ChangeLanguage(toCString(language))
+    _ChangeLanguage(toCString(language))
@@ -1,7 +1,7 @@
-from .init import LIB, CPointer
+from .init import declare, CPointer
 
-LIB.FreeMem.argtypes = [CPointer]
+_FreeMem = declare("FreeMem", [CPointer])
 def FreeMem(pointer: CPointer):
     """释放内存指针"""
     if pointer:
-        LIB.FreeMem(pointer)
+        _FreeMem(pointer)
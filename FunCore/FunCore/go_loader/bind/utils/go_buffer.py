@@ -0,0 +1,133 @@
+import ctypes
+import weakref
+from typing import Optional
+from .free_mem import FreeMem
+from ....utils.buffer_reader import BufferReader
+
+class GoBuffer:
+    """
+    Go 运行时分配的内存缓冲区
+
+    以 memoryview 直接暴露原生内存而不复制，释放时调用 FreeMem 归还内存。
+    支持 with 语句；未显式释放的缓冲区在被回收时自动释放。
+    释放后 view 不可再使用；此前由它切片、转换得到的 memoryview 与 open() 打开的读取器仍然有效，
+    FreeMem 推迟到它们全部被回收后才调用。需要长期保存数据时请调用 tobytes()。
+    Python 3.12+ 上可直接交给 msgpack.unpackb 等接受缓冲区的函数；
+    更早的版本不支持自定义缓冲区协议，需传入 view。
+    """
+
+    __slots__ = ("_length", "_view", "_free")
+
+    def __init__(self, pointer: int, length: int) -> None:
+        """
+        参数:
+            pointer: 内存地址
+            length: 数据长度
+        """
+        self._length = length
+        array = (ctypes.c_char * length).from_address(pointer)
+        # 所有导出的 memoryview(包括切片与转换)共享同一个托管缓冲区，
+        # 它持有 array 的引用，因此 array 被回收即说明内存已无人使用
+        self._free = weakref.finalize(array, _free_mem, pointer)
+        self._free.atexit = False
+        self._view: Optional[memoryview] = memoryview(array).cast("B")
+
+    @property
+    def view(self) -> memoryview:
+        """底层内存的 memoryview(不复制)"""
+        if self._view is None:
+            raise ValueError("GoBuffer 已被释放")
+        return self._view
+
+    @property
+    def released(self) -> bool:
+        """是否已被释放(底层内存可能仍被导出的 memoryview 使用)"""
+        return self._view is None
+
+    @property
+    def freed(self) -> bool:
+        """底层内存是否已归还"""
+        return not self._free.alive
+
+    def tobytes(self) -> bytes:
+        """复制为 Python bytes"""
+        return self.view.tobytes()
+
+    def open(self) -> BufferReader:
+        """打开为只读文件对象(不复制)，可直接交给 NBT 等流式解码器，释放缓冲区后仍可读取"""
+        return BufferReader(self.view[:])
+
+    def release(self):
+        """
+        释放底层内存，可重复调用
+
+        没有其他导出的 memoryview 时立即归还内存，否则推迟到它们全部被回收后归还。
+        """
+        view, self._view = self._view, None
+        if view is None:
+            return
+        try:
+            view.release()
+        except BufferError:
+            # view 本身仍被导出(如正在解码)，丢弃引用后由导出方回收时归还内存
+            pass
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bytes__(self) -> bytes:
+        return self.tobytes()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # 只在 Python 3.12+ 生效(PEP 688)，更早的版本请使用 view
+        return self.view
+
+    def __enter__(self) -> "GoBuffer":
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            # 解释器退出时运行库可能已被卸载
+            pass
+
+    def __repr__(self) -> str:
+        if not self.released:
+            state = f"length={self._length}"
+        else:
+            state = "released" if self.freed else "released, exported"
+        return f"<GoBuffer {state}>"
+
+
+def _free_mem(pointer: int) -> None:
+    """归还 Go 分配的内存"""
+    try:
+        FreeMem(pointer)
+    except Exception:
+        # 解释器退出时运行库可能已被卸载
+        pass
+
+
+def take_go_bytes(pointer, length: int, as_buffer: bool) -> GoBuffer | bytes:
+    """
+    接管 Go 分配的字节数据
+
+    参数:
+        pointer: Go 返回的字节指针
+        length: 数据长度
+        as_buffer: 为 True 时返回不复制的 GoBuffer，否则复制为 bytes 后立即释放原始内存
+
+    返回:
+        GoBuffer 或 bytes
+    """
+    address = ctypes.cast(pointer, ctypes.c_void_p).value
+    if as_buffer:
+        return GoBuffer(address, length)
+    try:
+        return ctypes.string_at(address, length)
+    finally:
+        FreeMem(address)
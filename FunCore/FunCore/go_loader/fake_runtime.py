@@ -0,0 +1,581 @@
+"""
+纯 Python 实现的假运行库
+
+与 FunCore 动态库导出相同的函数，不需要 fc_libs 与租赁服即可驱动 GameClient 的事件循环、
+数据包分发与命令收发，用于离线的吞吐与时延基准。数据包速率、命令响应时延、断线等行为
+由 FakeScenario 描述，并以固定随机种子保证可复现。
+
+设置环境变量 FUNCORE_FAKE_RUNTIME 后 load_library 返回本模块的 FakeLibrary，其值可以是:
+    1 / true             使用默认场景
+    {"packet_rate": ...} 内联 JSON 场景
+    scenario.json        场景 JSON 文件路径
+也可以在首次调用绑定函数之前调用 use_fake_runtime(scenario)。
+"""
+import ctypes
+import heapq
+import json
+import os
+import random
+import threading
+import time
+import uuid as uuid_lib
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..packets.ids import KNOWN_PACKET_IDS
+from ..utils.lazy_import import lazy_import
+
+msgpack = lazy_import("msgpack")
+
+# 数据包内容: 固定字典，或按 (序号, 连接后经过的秒数) 生成字典的函数
+PacketSource = Dict[str, Any] | Callable[[int, float], Dict[str, Any]]
+
+DEFAULT_PACKETS: List[Tuple[str, PacketSource]] = [
+    ("MovePlayer", {
+        "EntityRuntimeID": 2, "Position": [0.0, 64.0, 0.0], "Pitch": 0.0, "Yaw": 0.0, "HeadYaw": 0.0,
+        "Mode": 0, "OnGround": True, "RiddenEntityRuntimeID": 0, "TeleportCause": 0,
+        "TeleportSourceEntityType": 0, "Tick": 0,
+    }),
+    ("Text", {
+        "TextType": 1, "NeedsTranslation": False, "SourceName": "FakePlayer", "Message": "hello",
+        "Parameters": [], "XUID": "", "PlatformChatID": "", "FilteredMessage": "",
+    }),
+    ("SetActorData", {"EntityRuntimeID": 3, "EntityMetadata": {}, "EntityProperties": {}, "Tick": 0}),
+]
+
+
+def default_response(cmd: str) -> Dict[str, Any]:
+    """默认的命令响应: 成功一次，参数为命令本身"""
+    return {
+        "CommandOrigin": {"Origin": 5, "UUID": "", "RequestID": "", "PlayerUniqueID": 0},
+        "OutputType": 3,
+        "SuccessCount": 1,
+        "OutputMessages": [{"Success": True, "Message": "commands.fake.success", "Parameters": [cmd]}],
+        "DataSet": "",
+    }
+
+
+class FakeScenario:
+    """假运行库的行为脚本"""
+
+    def __init__(
+        self,
+        packet_rate: Optional[float] = 1000.0,
+        packets: Optional[Sequence[Tuple[int | str, PacketSource]]] = None,
+        packet_limit: Optional[int] = None,
+        command_latency: float | Tuple[float, float] | Callable[[str], float] = 0.02,
+        responses: Optional[Dict[str, Dict[str, Any] | str | None]] = None,
+        responder: Optional[Callable[[str], Dict[str, Any] | str | None]] = None,
+        log_rate: float = 0.0,
+        disconnect_after: Optional[float] = None,
+        connect_failures: int = 0,
+        connect_latency: float = 0.0,
+        max_queue: int = 65536,
+        players: Sequence[str] = ("FakePlayer",),
+        bot_name: str = "FakeBot",
+        tps: float = 20.0,
+        structure: Optional[Callable[[Tuple[int, int, int], Tuple[int, int, int]], bytes]] = None,
+        seed: int = 0
+    ) -> None:
+        """
+        参数:
+            packet_rate: 每秒产生的数据包数，为 None 时每次轮询都有数据包(测量最大吞吐)
+            packets: 轮流发送的 (数据包 ID 或名称, 内容) 列表，默认为 MovePlayer、Text、SetActorData
+            packet_limit: 每次连接最多产生的数据包数，为 None 时不限
+            command_latency: 需响应命令的响应时延(秒)，可以是固定值、(最小, 最大) 均匀分布或按命令计算的函数
+            responses: 命令前缀 -> 响应，响应为 None 时不响应(调用方超时)
+            responder: 按命令生成响应的函数，优先于 responses，返回 None 时不响应
+            log_rate: 每秒产生的日志数
+            disconnect_after: 每次连接后经过该秒数断线，为 None 时不断线
+            connect_failures: 前若干次 ConnectGame 返回错误
+            connect_latency: ConnectGame 的耗时(秒)
+            max_queue: 事件队列容量，积压超过容量的事件被丢弃
+            players: 在线玩家名
+            bot_name: 机器人名称
+            tps: ExtendInfo 中 CurrentTick 的增长速度
+            structure: 按 (起点, 大小) 生成结构 NBT 的函数，为 None 时 GetStructureAsNBT 返回错误
+            seed: 随机种子
+        """
+        self.packet_rate = packet_rate
+        self.packets = list(packets) if packets is not None else list(DEFAULT_PACKETS)
+        self.packet_limit = packet_limit
+        self.command_latency = command_latency
+        self.responses = dict(responses or {})
+        self.responder = responder
+        self.log_rate = log_rate
+        self.disconnect_after = disconnect_after
+        self.connect_failures = connect_failures
+        self.connect_latency = connect_latency
+        self.max_queue = max_queue
+        self.players = list(players)
+        self.bot_name = bot_name
+        self.tps = tps
+        self.structure = structure
+        self.seed = seed
+
+    @classmethod
+    def from_env(cls, value: str) -> "FakeScenario":
+        """
+        由环境变量的值创建场景
+
+        参数:
+            value: "1"/"true"、内联 JSON 或 JSON 文件路径
+
+        异常:
+            ValueError: 无法解析场景
+        """
+        value = value.strip()
+        if value.lower() in ("1", "true", "yes", "on"):
+            return cls()
+        if not value.startswith("{"):
+            with open(value, "r", encoding="utf-8") as f:
+                value = f.read()
+        try:
+            options = json.loads(value)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"无法解析假运行库场景: {e}") from e
+        if isinstance(options.get("command_latency"), list):
+            options["command_latency"] = tuple(options["command_latency"])
+        return cls(**options)
+
+
+class _FakeFunction:
+    """假运行库的导出函数，可像 ctypes 函数指针一样设置 argtypes 与 restype"""
+
+    __slots__ = ("name", "impl", "library", "argtypes", "restype")
+
+    def __init__(self, name: str, impl: Callable[..., Any], library: "FakeLibrary") -> None:
+        self.name = name
+        self.impl = impl
+        self.library = library
+        self.argtypes: List[Any] = []
+        self.restype: Any = None
+
+    def __call__(self, *args):
+        self.library.calls[self.name] = self.library.calls.get(self.name, 0) + 1
+        return self.library._to_c(self.impl(*args), self.restype)
+
+
+def _arg(value: Any) -> Any:
+    """把绑定层传入的 ctypes 参数还原为 Python 值"""
+    if isinstance(value, ctypes._SimpleCData):
+        value = value.value
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="surrogateescape")
+    return value
+
+
+class FakeLibrary:
+    """
+    假运行库
+
+    事件在轮询时按经过的时间产生，不使用后台线程；返回给绑定层的字节数据分配在
+    ctypes 缓冲区中，直到 FreeMem 才释放，live_allocations 可用于检查内存泄漏。
+    """
+
+    def __init__(self, scenario: Optional[FakeScenario] = None) -> None:
+        """
+        参数:
+            scenario: 行为脚本，默认为 FakeScenario()
+        """
+        self._lock = threading.RLock()
+        self._functions: Dict[str, _FakeFunction] = {}
+        self._allocations: Dict[int, Any] = {}
+        self.configure(scenario or FakeScenario())
+
+    @classmethod
+    def from_env(cls, value: str) -> "FakeLibrary":
+        """由环境变量 FUNCORE_FAKE_RUNTIME 的值创建"""
+        return cls(FakeScenario.from_env(value))
+
+    def configure(self, scenario: FakeScenario) -> None:
+        """更换场景并重置连接状态与统计信息"""
+        with self._lock:
+            self.scenario = scenario
+            self._rng = random.Random(scenario.seed)
+            self._mapping = dict(KNOWN_PACKET_IDS)
+            self._packets = [
+                (self._mapping[pid] if isinstance(pid, str) else pid, source)
+                for pid, source in scenario.packets
+            ]
+            # 固定内容的数据包只编码一次
+            self._encoded = [
+                msgpack.packb(source, use_bin_type=True) if not callable(source) else None
+                for _, source in self._packets
+            ]
+            self._connected = False
+            self._connected_at = 0.0
+            self._connect_attempts = 0
+            self._events: Deque[Tuple[str, str, Any]] = deque()
+            self._logs: Deque[Tuple[str, str]] = deque()
+            self._pending: List[Tuple[float, int, str, Optional[str]]] = []
+            self._pending_seq = 0
+            self._current: Optional[Tuple[str, str, Any]] = None
+            self._emitted_packets = 0
+            self._emitted_logs = 0
+            self.calls: Dict[str, int] = {}
+            self.commands: Deque[Tuple[str, str]] = deque(maxlen=1000)
+            self.stats_counters = {
+                "packets": 0, "packets_consumed": 0, "events_omitted": 0, "events_dropped": 0,
+                "responses": 0, "responses_lost": 0, "disconnects": 0, "game_packets_sent": 0,
+            }
+
+    def __getattr__(self, name: str) -> _FakeFunction:
+        impl = getattr(type(self), f"_export_{name}", None)
+        if impl is None:
+            raise AttributeError(f"假运行库没有导出函数 {name}")
+        function = self._functions.get(name)
+        if function is None:
+            function = self._functions[name] = _FakeFunction(name, impl.__get__(self), self)
+        return function
+
+    @property
+    def live_allocations(self) -> int:
+        """尚未 FreeMem 的字节数据块数"""
+        return len(self._allocations)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            产生/消费/忽略/丢弃的事件数、响应数、断线次数、未释放的内存块数与各导出函数的调用次数
+        """
+        with self._lock:
+            return {
+                **self.stats_counters,
+                "queued": len(self._events),
+                "pending_responses": len(self._pending),
+                "live_allocations": len(self._allocations),
+                "calls": dict(self.calls),
+            }
+
+    def disconnect(self) -> None:
+        """立即模拟断线"""
+        with self._lock:
+            self._drop_connection()
+
+    # 内部实现
+
+    def _alloc(self, data: bytes) -> Any:
+        buffer = ctypes.create_string_buffer(data, len(data))
+        self._allocations[ctypes.addressof(buffer)] = buffer
+        return ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char))
+
+    def _to_c(self, value: Any, restype: Any) -> Any:
+        """按 restype 把实现的返回值转换为 ctypes 调用的返回值"""
+        if restype is None:
+            return None
+        if restype is ctypes.c_char_p:
+            return value.encode("utf-8") if isinstance(value, str) else value
+        if isinstance(restype, type) and issubclass(restype, ctypes.Structure):
+            result = restype()
+            for field, field_type in restype._fields_:
+                item = (value or {}).get(field)
+                if item is None:
+                    continue
+                if field_type is ctypes.c_char_p and isinstance(item, str):
+                    item = item.encode("utf-8")
+                elif field_type is ctypes.POINTER(ctypes.c_char):
+                    item = self._alloc(item)
+                setattr(result, field, item)
+            return result
+        return value
+
+    def _drop_connection(self) -> None:
+        if not self._connected:
+            return
+        self._connected = False
+        self.stats_counters["disconnects"] += 1
+        self.stats_counters["events_dropped"] += len(self._events)
+        self.stats_counters["responses_lost"] += len(self._pending)
+        self._events.clear()
+        self._pending.clear()
+        self._current = None
+
+    def _check_connection(self, now: float) -> bool:
+        limit = self.scenario.disconnect_after
+        if self._connected and limit is not None and now - self._connected_at >= limit:
+            self._drop_connection()
+        return self._connected
+
+    def _enqueue(self, event: Tuple[str, str, Any]) -> None:
+        if len(self._events) >= self.scenario.max_queue:
+            self.stats_counters["events_dropped"] += 1
+            return
+        self._events.append(event)
+
+    def _packet_due(self, now: float) -> int:
+        scenario = self.scenario
+        if not self._packets:
+            return 0
+        if scenario.packet_rate is None:
+            due = 0 if self._events else 64
+        else:
+            due = int((now - self._connected_at) * scenario.packet_rate) - self._emitted_packets
+        if scenario.packet_limit is not None:
+            due = min(due, scenario.packet_limit - self._emitted_packets)
+        return max(0, due)
+
+    def _pump(self, now: float) -> None:
+        """把到期的命令响应与数据包放入事件队列"""
+        pending = self._pending
+        while pending and pending[0][0] <= now:
+            _, _, retriever, response = heapq.heappop(pending)
+            self._enqueue(("CommandResponseCB", retriever, response))
+            self.stats_counters["responses"] += 1
+        for _ in range(self._packet_due(now)):
+            seq = self._emitted_packets
+            index = seq % len(self._packets)
+            packet_id, source = self._packets[index]
+            data = self._encoded[index]
+            if data is None:
+                data = msgpack.packb(source(seq, now - self._connected_at), use_bin_type=True)
+            self._enqueue(("MCPacket", str(packet_id), data))
+            self._emitted_packets += 1
+            self.stats_counters["packets"] += 1
+
+    def _latency(self, cmd: str) -> float:
+        latency = self.scenario.command_latency
+        if callable(latency):
+            return latency(cmd)
+        if isinstance(latency, tuple):
+            return self._rng.uniform(*latency)
+        return latency
+
+    def _respond(self, cmd: str) -> Optional[str]:
+        scenario = self.scenario
+        if scenario.responder is not None:
+            response = scenario.responder(cmd)
+        else:
+            stripped = cmd.lstrip("/")
+            for prefix, value in scenario.responses.items():
+                if stripped.startswith(prefix.lstrip("/")):
+                    response = value
+                    break
+            else:
+                response = default_response(cmd)
+        if response is None or isinstance(response, str):
+            return response
+        return json.dumps(response, ensure_ascii=False)
+
+    def _need_response(self, kind: str, cmd: Any, retriever: Any) -> None:
+        cmd, retriever = _arg(cmd), _arg(retriever)
+        with self._lock:
+            self.commands.append((kind, cmd))
+            if not self._check_connection(time.monotonic()):
+                return
+            response = self._respond(cmd)
+            if response is None:
+                return
+            self._pending_seq += 1
+            heapq.heappush(
+                self._pending,
+                (time.monotonic() + self._latency(cmd), self._pending_seq, retriever, response)
+            )
+
+    def _omit_response(self, kind: str, cmd: Any) -> None:
+        with self._lock:
+            self.commands.append((kind, _arg(cmd)))
+
+    def _uqholder(self) -> bytes:
+        scenario = self.scenario
+        players = {}
+        for index, name in enumerate(scenario.players):
+            player_uuid = uuid_lib.uuid5(uuid_lib.NAMESPACE_OID, name)
+            players[player_uuid.bytes] = {
+                "EntityUniqueID": -(index + 2), "knownEntityUniqueID": True,
+                "Username": name, "knownUsername": True,
+                "XUID": str(2535400000000000 + index), "knownXUID": True,
+            }
+        elapsed = time.monotonic() - self._connected_at if self._connected else 0.0
+        current_tick = int(elapsed * scenario.tps)
+        holders = {
+            "BotBasicInfoHolder": {
+                "BotName": scenario.bot_name, "BotRuntimeID": 1, "BotUniqueID": -1, "BotIdentity": "fake",
+            },
+            "PlayersInfoHolder": players,
+            "ExtendInfo": {
+                "CurrentTick": current_tick, "knownCurrentTick": True,
+                "Time": current_tick % 24000, "knownTime": True,
+                "DayTime": current_tick % 24000, "knownDayTime": True,
+                "Dimension": 0, "knownDimension": True,
+                "currentContainerOpened": False,
+            },
+        }
+        return msgpack.packb({k: msgpack.packb(v, use_bin_type=True) for k, v in holders.items()}, use_bin_type=True)
+
+    # 导出函数，名称与动态库一致
+
+    def _export_FreeMem(self, pointer: Any) -> None:
+        address = _arg(pointer)
+        if address:
+            with self._lock:
+                self._allocations.pop(address, None)
+
+    def _export_ChangeLanguage(self, language: Any) -> None:
+        pass
+
+    def _export_ConnectGame(self, *args: Any) -> Optional[str]:
+        scenario = self.scenario
+        if scenario.connect_latency:
+            time.sleep(scenario.connect_latency)
+        with self._lock:
+            self._connect_attempts += 1
+            if self._connect_attempts <= scenario.connect_failures:
+                return f"假运行库: 第 {self._connect_attempts} 次连接失败"
+            self._connected = True
+            self._connected_at = time.monotonic()
+            self._emitted_packets = 0
+            self._emitted_logs = 0
+            self._logs.append(("INFO", f"假运行库: 已连接 {_arg(args[2]) if len(args) > 2 else ''}"))
+        return None
+
+    def _export_DisconnectGame(self) -> None:
+        with self._lock:
+            self._drop_connection()
+
+    def _export_GameAvailable(self) -> bool:
+        with self._lock:
+            return self._check_connection(time.monotonic())
+
+    def _export_ListenAllPackets(self) -> None:
+        pass
+
+    def _export_GetPacketNameIDMapping(self) -> str:
+        return json.dumps(self._mapping)
+
+    def _export_EventPoll(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._current is not None:
+                # 上一个事件未被消费也未被忽略
+                self.stats_counters["events_omitted"] += 1
+                self._current = None
+            now = time.monotonic()
+            if not self._check_connection(now):
+                return {}
+            self._pump(now)
+            if not self._events:
+                return {}
+            event = self._current = self._events.popleft()
+            return {"type": event[0], "retriever": event[1]}
+
+    def _export_OmitEvent(self) -> None:
+        with self._lock:
+            if self._current is not None:
+                self.stats_counters["events_omitted"] += 1
+                self._current = None
+
+    def _export_ConsumeMCPacket(self) -> Dict[str, Any]:
+        with self._lock:
+            event = self._current
+            if event is None or event[0] != "MCPacket":
+                return {"convert_error": "没有待消费的数据包"}
+            self._current = None
+            self.stats_counters["packets_consumed"] += 1
+            return {"packet_bytes": event[2], "length": len(event[2])}
+
+    def _export_ConsumeCommandResponseCB(self) -> Optional[str]:
+        with self._lock:
+            event = self._current
+            if event is None or event[0] != "CommandResponseCB":
+                return None
+            self._current = None
+            return event[2]
+
+    def _export_LogEventPoll(self) -> Dict[str, Any]:
+        with self._lock:
+            scenario = self.scenario
+            if self._connected and scenario.log_rate > 0:
+                due = int((time.monotonic() - self._connected_at) * scenario.log_rate) - self._emitted_logs
+                for _ in range(max(0, due)):
+                    self._emitted_logs += 1
+                    self._logs.append(("INFO", f"假运行库日志 {self._emitted_logs}"))
+            if not self._logs:
+                return {}
+            level, message = self._logs.popleft()
+            return {"level": level, "message": message}
+
+    def _export_SendWebSocketCommandNeedResponse(self, cmd: Any, retriever: Any) -> None:
+        self._need_response("websocket", cmd, retriever)
+
+    def _export_SendPlayerCommandNeedResponse(self, cmd: Any, retriever: Any) -> None:
+        self._need_response("player", cmd, retriever)
+
+    def _export_SendWebSocketCommandOmitResponse(self, cmd: Any) -> None:
+        self._omit_response("websocket", cmd)
+
+    def _export_SendPlayerCommandOmitResponse(self, cmd: Any) -> None:
+        self._omit_response("player", cmd)
+
+    def _export_SendWOCommand(self, cmd: Any) -> None:
+        self._omit_response("settings", cmd)
+
+    def _export_SendTotalWOCommand(self, cmds: Any) -> bool:
+        with self._lock:
+            for cmd in _arg(cmds).splitlines():
+                if cmd:
+                    self.commands.append(("settings", cmd))
+        return True
+
+    def _export_SendGamePacket(self, packet_id: Any, content: Any) -> Optional[str]:
+        with self._lock:
+            if not self._connected:
+                return "假运行库: 未连接"
+            self.stats_counters["game_packets_sent"] += 1
+        return None
+
+    def _export_GetUQHolderData(self) -> Dict[str, Any]:
+        with self._lock:
+            data = self._uqholder()
+        return {"uqholder_bytes": data, "length": len(data)}
+
+    def _export_GetBotDisplayName(self) -> str:
+        return self.scenario.bot_name
+
+    def _export_GetBotIdentity(self) -> str:
+        return "fake"
+
+    def _export_GetBotXUID(self) -> str:
+        return "2535499999999999"
+
+    def _export_EnterConsole(self) -> Optional[str]:
+        return None
+
+    def _export_MoveToPosition(self, *args: Any) -> Optional[str]:
+        return None
+
+    def _export_PlaceNBTBlockInConsole(self, *args: Any) -> Dict[str, Any]:
+        return {"can_fast": True, "unique_id": "", "offset_x": 0, "offset_y": 0, "offset_z": 0}
+
+    def _export_GetStructureAsNBT(self, *args: Any) -> Dict[str, Any]:
+        structure = self.scenario.structure
+        if structure is None:
+            return {"convert_error": "假运行库: 未提供结构"}
+        values = [_arg(a) for a in args]
+        data = structure(tuple(values[:3]), tuple(values[3:]))
+        return {"structure_nbt_bytes": data, "length": len(data)}
+
+
+def use_fake_runtime(scenario: Optional[FakeScenario] = None) -> FakeLibrary:
+    """
+    使用假运行库，需要在首次调用绑定函数之前调用；已在使用假运行库时更换场景
+
+    参数:
+        scenario: 行为脚本，默认为 FakeScenario()
+
+    返回:
+        假运行库，可查看统计信息或调用 disconnect() 模拟断线
+
+    异常:
+        RuntimeError: 已加载真实的动态库
+    """
+    from . import runtime
+    with runtime._lib_lock:
+        if isinstance(runtime._lib, FakeLibrary):
+            runtime._lib.configure(scenario or FakeScenario())
+        elif runtime._lib is not None:
+            raise RuntimeError("已加载 FunCore 动态库，无法切换为假运行库")
+        else:
+            runtime._lib = FakeLibrary(scenario)
+        return runtime._lib
@@ -1,7 +1,82 @@
 import ctypes
+import os
+import threading
+from typing import Any, Optional, Sequence
 from .utils.name import lib_path, sys_type
 
-try:
-    LIB = ctypes.CDLL(lib_path) if sys_type != "Windows" else ctypes.cdll.LoadLibrary(lib_path)
-except OSError as e:
-    raise RuntimeError(f"无法加载 FunCore: {e}") from e
+_lib = None
+_lib_lock = threading.Lock()
+
+def load_library():
+    """
+    加载 FunCore 动态库(只在首次调用时真正加载)
+    
+    设置环境变量 FUNCORE_FAKE_RUNTIME 时改为加载纯 Python 的假运行库(见 fake_runtime)，
+    用于离线基准测试。
+    
+    异常:
+        RuntimeError: 无法加载动态库
+    """
+    global _lib
+    if _lib is None:
+        with _lib_lock:
+            if _lib is None:
+                fake = os.environ.get("FUNCORE_FAKE_RUNTIME")
+                if fake:
+                    from .fake_runtime import FakeLibrary
+                    _lib = FakeLibrary.from_env(fake)
+                    return _lib
+                try:
+                    _lib = ctypes.CDLL(lib_path) if sys_type != "Windows" else ctypes.cdll.LoadLibrary(lib_path)
+                except OSError as e:
+                    raise RuntimeError(f"无法加载 FunCore: {e}") from e
+    return _lib
+
+class _LazyLibrary:
+    """首次访问导出函数时才加载动态库的代理"""
+    
+    def __getattr__(self, name: str):
+        return getattr(load_library(), name)
+
+LIB = _LazyLibrary()
+
+class LazyFunction:
+    """首次调用时才加载动态库并声明参数与返回类型的导出函数"""
+    
+    __slots__ = ("name", "argtypes", "restype", "_func")
+    
+    def __init__(self, name: str, argtypes: Sequence[Any], restype: Optional[Any]) -> None:
+        self.name = name
+        self.argtypes = list(argtypes)
+        self.restype = restype
+        self._func = None
+    
+    def _resolve(self):
+        """取得函数指针并声明类型"""
+        func = getattr(load_library(), self.name)
+        func.argtypes = self.argtypes
+        func.restype = self.restype
+        self._func = func
+        return func
+    
+    def __call__(self, *args):
+        func = self._func
+        if func is None:
+            func = self._resolve()
+        return func(*args)
+
+def declare(name: str, argtypes: Sequence[Any] = (), restype: Optional[Any] = None) -> LazyFunction:
+    """
+    声明导出函数的参数与返回类型
+    
+    动态库与函数指针都在首次调用时才解析，导入绑定模块不会加载动态库。
+    
+    参数:
+        name: 导出函数名
+        argtypes: 参数类型
+        restype: 返回类型，None 表示无返回值
+        
+    返回:
+        可直接调用的导出函数，绑定模块应在模块级保存
+    """
+    return LazyFunction(name, argtypes, restype)
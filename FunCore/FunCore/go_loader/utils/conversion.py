@@ -1,5 +1,8 @@
 from .alias import GoInt, GoInt32, CString, GoFloat32
-import ctypes
+import functools
+
+# 超过该长度的字符串不进入编码缓存
+CACHED_CSTRING_MAX_LENGTH = 256
 
 # 类型转换辅助函数
 def toGoInt(i: int) -> GoInt:
@@ -10,9 +13,22 @@ def toGoInt32(i: int) -> GoInt32:
     """Python int -> Go int32"""
     return GoInt32(i)
 
-def toCString(string: str) -> CString:
-    """Python str -> C string"""
-    return ctypes.c_char_p(string.encode("utf-8"))
+@functools.lru_cache(maxsize=1024)
+def _encodeCached(string: str) -> bytes:
+    """带缓存的 UTF-8 编码"""
+    return string.encode("utf-8")
+
+def toCString(string: str | bytes) -> bytes:
+    """
+    Python str / 已编码的 bytes -> 可直接传给 CString 参数的 bytes
+
+    重复出现的短字符串(如常用命令)会命中编码缓存。
+    """
+    if isinstance(string, bytes):
+        return string
+    if len(string) <= CACHED_CSTRING_MAX_LENGTH:
+        return _encodeCached(string)
+    return string.encode("utf-8")
 
 def toPyInt(i: GoInt) -> int:
     """Go int -> Python int"""
@@ -0,0 +1,6 @@
+from .base import PacketMirror
+from .entities import EntityTracker, TrackedEntity
+from .regions import RegionWatch, Block
+from .scoreboard import ScoreboardMirror, Objective
+from .inventory import InventoryMirror, Container, Item
+from .clock import TickClock, TickScheduler
@@ -0,0 +1,81 @@
+import threading
+from typing import Any, ClassVar, Dict
+
+from ..packets.ids import resolve_packet_id
+
+
+class PacketMirror:
+    """
+    数据包镜像基类
+
+    通过 add_packets_listener 订阅 handlers 中列出的数据包，在本地维护服务器状态，
+    读取时无需发送命令。数据包 ID 优先由连接后获取的名称映射解析。
+    子类在 handlers 中声明 数据包名称 -> 处理方法名，处理方法在 _lock 内调用。
+    订阅期间每次(重新)连接后在 _lock 内调用 _reset()，子类覆盖它以丢弃断线前的状态。
+    """
+
+    # 数据包名称 -> 处理方法名
+    handlers: ClassVar[Dict[str, str]] = {}
+
+    def __init__(self, client) -> None:
+        """
+        参数:
+            client: GameClient 实例
+        """
+        self.client = client
+        self._lock = threading.RLock()
+        self._packet_handlers: Dict[int, Any] = {}
+        self.packets = 0
+
+    @property
+    def started(self) -> bool:
+        """是否已开始订阅"""
+        return bool(self._packet_handlers)
+
+    def start(self) -> "PacketMirror":
+        """
+        开始订阅数据包
+
+        返回:
+            自身，便于链式调用
+        """
+        if self.started:
+            return self
+        mapping = self.client._packet_name_to_id_mapping
+        self._packet_handlers = {
+            resolve_packet_id(name, mapping): getattr(self, method)
+            for name, method in self.handlers.items()
+        }
+        self.client.add_packets_listener(list(self._packet_handlers), self._on_packet)
+        self.client.add_connect_listener(self._on_connect)
+        return self
+
+    def stop(self) -> None:
+        """停止订阅数据包，已镜像的状态保留"""
+        self.client.remove_connect_listener(self._on_connect)
+        for packet_id in self._packet_handlers:
+            self.client.remove_packet_listener(packet_id, self._on_packet)
+        self._packet_handlers = {}
+
+    def _reset(self) -> None:
+        """(重新)连接后重置镜像，默认不做任何事"""
+
+    def _on_connect(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _on_packet(self, packet_id: int, packet: Dict[str, Any]) -> None:
+        handler = self._packet_handlers.get(packet_id)
+        if handler is None:
+            return
+        with self._lock:
+            self.packets += 1
+            handler(packet)
+
+
+def vec3(value: Any) -> tuple:
+    """把数据包中的坐标(列表或带 X/Y/Z 键的映射)转换为 (x, y, z)"""
+    if isinstance(value, dict):
+        return (value.get("X", 0), value.get("Y", 0), value.get("Z", 0))
+    x, y, z = value
+    return (x, y, z)
@@ -0,0 +1,348 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from ..utils.timer_wheel import TimerTask, TimerWheel
+from .base import PacketMirror
+
+NOMINAL_TPS = 20.0
+
+
+class TickClock(PacketMirror):
+    """
+    服务器刻时钟
+
+    连接时由 ExtendInfo 的 CurrentTick、Time 与 DayTime 取得初值，此后由 MovePlayer、
+    CorrectPlayerMovePrediction 携带的刻与 SetTime 校准，按最近 window 秒内的样本估计 TPS，
+    读取时按估计的 TPS 外推，无需反复获取 UQHolder。
+    """
+
+    handlers = {
+        "MovePlayer": "_handle_tick_packet",
+        "CorrectPlayerMovePrediction": "_handle_tick_packet",
+        "SetTime": "_handle_set_time",
+    }
+
+    def __init__(self, client, window: float = 10.0, sample_interval: float = 0.05) -> None:
+        """
+        初始化服务器刻时钟
+
+        参数:
+            client: GameClient 实例
+            window: 估计 TPS 使用的样本时间范围(秒)
+            sample_interval: 两个样本之间的最短间隔(秒)，更频繁的数据包只用于校准当前刻
+        """
+        super().__init__(client)
+        self.window = window
+        self.sample_interval = sample_interval
+        # (单调时间, 刻)
+        self._samples: Deque[Tuple[float, int]] = deque()
+        self._tps = NOMINAL_TPS
+        self._last_reported = 0
+        self._time: Optional[Tuple[float, int]] = None
+        self._time_advancing = True
+        self.resets = 0
+
+    def start(self) -> "TickClock":
+        """开始订阅数据包，并由 ExtendInfo 取得初值"""
+        super().start()
+        extend_info = self.client.get_extend_info() or {}
+        now = time.monotonic()
+        with self._lock:
+            if extend_info.get("knownCurrentTick", True) and extend_info.get("CurrentTick"):
+                self._observe(int(extend_info["CurrentTick"]), now)
+            if extend_info.get("knownTime", True) and extend_info.get("Time") is not None:
+                self._time = (now, int(extend_info["Time"]))
+        return self
+
+    @property
+    def tps(self) -> float:
+        """估计的每秒刻数，样本不足时为 20"""
+        return self._tps
+
+    @property
+    def synced(self) -> bool:
+        """是否已取得服务器刻"""
+        return bool(self._samples)
+
+    def current_tick(self) -> Optional[int]:
+        """
+        估计当前服务器刻
+
+        返回:
+            服务器刻，尚未取得时返回 None；两次读取之间不会倒退(除非服务器刻被重置)
+        """
+        with self._lock:
+            if not self._samples:
+                return None
+            at, tick = self._samples[-1]
+            estimate = max(tick + int((time.monotonic() - at) * self._tps), self._last_reported)
+            self._last_reported = estimate
+            return estimate
+
+    def day_time(self) -> Optional[int]:
+        """
+        估计当前一天中的时间(0~23999)
+
+        返回:
+            游戏内时间，尚未取得时返回 None
+        """
+        with self._lock:
+            if self._time is None:
+                return None
+            at, value = self._time
+            if self._time_advancing:
+                value += int((time.monotonic() - at) * self._tps)
+            return value % 24000
+
+    def seconds_until(self, tick: int) -> float:
+        """按估计的 TPS 计算距离指定服务器刻还有多少秒，已过去时返回 0"""
+        current = self.current_tick()
+        if current is None:
+            return 0.0
+        return max(0.0, (tick - current) / max(self._tps, 1e-3))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            已处理的数据包数、样本数、估计的 TPS、当前刻与刻重置次数
+        """
+        return {
+            "packets": self.packets,
+            "samples": len(self._samples),
+            "tps": round(self._tps, 3),
+            "tick": self.current_tick(),
+            "resets": self.resets,
+        }
+
+    def _observe(self, tick: int, now: float) -> None:
+        samples = self._samples
+        if samples:
+            last_at, last_tick = samples[-1]
+            if tick < last_tick:
+                # 重连或换服后刻被重置
+                samples.clear()
+                self._last_reported = 0
+                self._tps = NOMINAL_TPS
+                self.resets += 1
+            elif len(samples) > 1 and now - samples[-2][0] < self.sample_interval:
+                # 间隔过短时只更新最新样本
+                samples[-1] = (now, tick)
+                return
+        samples.append((now, tick))
+        while len(samples) > 2 and now - samples[0][0] > self.window:
+            samples.popleft()
+        first_at, first_tick = samples[0]
+        span = now - first_at
+        if span >= 1.0:
+            self._tps = max(0.0, (tick - first_tick) / span)
+
+    def _handle_tick_packet(self, packet: Dict[str, Any]) -> None:
+        tick = packet.get("Tick")
+        if tick:
+            self._observe(int(tick), time.monotonic())
+
+    def _handle_set_time(self, packet: Dict[str, Any]) -> None:
+        value = packet.get("Time")
+        if value is None:
+            return
+        now = time.monotonic()
+        if self._time is not None:
+            # doDaylightCycle 关闭时时间不前进，不再外推
+            self._time_advancing = int(value) != self._time[1]
+        self._time = (now, int(value))
+
+
+class TickScheduler:
+    """
+    按刻调度的任务执行器
+
+    以 TickClock 估计的服务器刻推进分层时间轮，在单个线程中执行到期任务，
+    用于替代插件中各自 time.sleep 的轮询线程。服务器刻不可用或跳变时按估计的 TPS 与墙钟推进。
+    任务在调度线程中执行，耗时较长的任务应自行交给其他线程。
+    """
+
+    def __init__(self, clock: Optional[TickClock] = None, max_jump: int = 1200, logger=None) -> None:
+        """
+        初始化调度器
+
+        参数:
+            clock: 服务器刻时钟，为 None 时按 20 TPS 的墙钟计刻
+            max_jump: 服务器刻单次前进超过该值时视为跳变
+            logger: 日志记录器
+        """
+        self.clock = clock
+        self.max_jump = max_jump
+        self.logger = logger
+        self._wheel = TimerWheel()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server_tick: Optional[int] = None
+        self._wall: Optional[float] = None
+        self._fraction = 0.0
+
+        # 统计信息
+        self.executed = 0
+        self.errors = 0
+        self.max_lag = 0
+
+    @property
+    def tick(self) -> int:
+        """调度器启动以来经过的刻数"""
+        return self._wheel.tick
+
+    @property
+    def running(self) -> bool:
+        """调度线程是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def call_later(self, ticks: int, callback: Callable[..., Any], *args: Any) -> TimerTask:
+        """
+        在指定刻数后执行一次
+
+        参数:
+            ticks: 延迟刻数，不大于 0 时在下一刻执行
+            callback: 任务函数
+            *args: 传给任务函数的参数
+
+        返回:
+            定时任务，可调用 cancel() 取消
+        """
+        with self._lock:
+            task = self._wheel.schedule(TimerTask(callback, args, self._wheel.tick + ticks))
+        self._wakeup.set()
+        return task
+
+    def call_every(
+        self,
+        interval: int,
+        callback: Callable[..., Any],
+        *args: Any,
+        delay: Optional[int] = None
+    ) -> TimerTask:
+        """
+        每隔指定刻数重复执行
+
+        参数:
+            interval: 间隔刻数
+            callback: 任务函数
+            *args: 传给任务函数的参数
+            delay: 首次执行前的刻数，默认等于 interval
+
+        返回:
+            定时任务，可调用 cancel() 停止重复
+        """
+        if interval <= 0:
+            raise ValueError("interval 必须大于 0")
+        first = interval if delay is None else delay
+        with self._lock:
+            task = self._wheel.schedule(TimerTask(callback, args, self._wheel.tick + first, interval))
+        self._wakeup.set()
+        return task
+
+    def call_at(self, server_tick: int, callback: Callable[..., Any], *args: Any) -> TimerTask:
+        """
+        在指定服务器刻执行一次
+
+        参数:
+            server_tick: 服务器刻，需要 clock 已取得服务器刻
+            callback: 任务函数
+            *args: 传给任务函数的参数
+
+        异常:
+            RuntimeError: 尚未取得服务器刻
+        """
+        current = self.clock.current_tick() if self.clock is not None else None
+        if current is None:
+            raise RuntimeError("尚未取得服务器刻")
+        return self.call_later(server_tick - current, callback, *args)
+
+    def start(self) -> "TickScheduler":
+        """启动调度线程"""
+        if self.running:
+            return self
+        self._stop_event.clear()
+        self._server_tick = None
+        self._wall = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 2.0) -> None:
+        """停止调度线程，未到期的任务保留"""
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            当前刻、待执行任务数、已执行数、出错数与最大延迟刻数
+        """
+        with self._lock:
+            pending = len(self._wheel)
+        return {
+            "tick": self.tick,
+            "pending": pending,
+            "executed": self.executed,
+            "errors": self.errors,
+            "max_lag": self.max_lag,
+        }
+
+    def _elapsed_ticks(self) -> int:
+        """计算上次推进以来经过的刻数"""
+        now = time.monotonic()
+        wall, self._wall = self._wall, now
+        server_tick = self.clock.current_tick() if self.clock is not None else None
+        previous, self._server_tick = self._server_tick, server_tick
+        if server_tick is not None and previous is not None and 0 <= server_tick - previous <= self.max_jump:
+            self._fraction = 0.0
+            return server_tick - previous
+        if wall is None:
+            return 0
+        tps = self.clock.tps if self.clock is not None else NOMINAL_TPS
+        self._fraction += (now - wall) * tps
+        whole = int(self._fraction)
+        self._fraction -= whole
+        return whole
+
+    def _run(self) -> None:
+        """调度线程主循环"""
+        while not self._stop_event.is_set():
+            elapsed = self._elapsed_ticks()
+            with self._lock:
+                target = self._wheel.tick + elapsed
+                due = self._wheel.advance(target)
+                idle = len(self._wheel) == 0
+            for task in due:
+                self.max_lag = max(self.max_lag, target - task.due)
+                try:
+                    task.callback(*task.args)
+                except Exception as e:
+                    self.errors += 1
+                    if self.logger is not None:
+                        self.logger.error(f"定时任务错误: {e}")
+                self.executed += 1
+                if task.interval and not task.cancelled:
+                    task.due += task.interval
+                    with self._lock:
+                        self._wheel.schedule(task)
+                    idle = False
+            if idle:
+                # 没有任务时等待新任务，期间经过的时间不计入
+                self._wakeup.wait()
+                self._wall = None
+                self._server_tick = None
+                self._fraction = 0.0
+            else:
+                tps = self.clock.tps if self.clock is not None else NOMINAL_TPS
+                self._wakeup.wait(1.0 / max(tps, 1.0))
+            self._wakeup.clear()
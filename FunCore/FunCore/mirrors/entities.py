@@ -0,0 +1,299 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.spatial_hash import SpatialHash, Vec3
+from .base import PacketMirror, vec3
+
+PLAYER_TYPE = "minecraft:player"
+
+# MoveActorDelta 的字段标志
+_DELTA_HAS_X = 1 << 0
+_DELTA_HAS_Y = 1 << 1
+_DELTA_HAS_Z = 1 << 2
+_DELTA_HAS_ROT_X = 1 << 3
+_DELTA_HAS_ROT_Y = 1 << 4
+_DELTA_HAS_ROT_Z = 1 << 5
+
+
+class TrackedEntity:
+    """实体表中的一个实体"""
+
+    __slots__ = (
+        "runtime_id", "unique_id", "type", "name", "uuid",
+        "position", "pitch", "yaw", "head_yaw", "updated_at"
+    )
+
+    def __init__(
+        self,
+        runtime_id: int,
+        unique_id: Optional[int],
+        type: str,
+        position: Vec3,
+        name: Optional[str] = None,
+        uuid: Optional[str] = None
+    ) -> None:
+        self.runtime_id = runtime_id
+        self.unique_id = unique_id
+        self.type = type
+        self.name = name
+        self.uuid = uuid
+        self.position = position
+        self.pitch = 0.0
+        self.yaw = 0.0
+        self.head_yaw = 0.0
+        self.updated_at = time.monotonic()
+
+    @property
+    def is_player(self) -> bool:
+        return self.type == PLAYER_TYPE
+
+    def __repr__(self) -> str:
+        label = self.name or self.type
+        return f"<TrackedEntity {self.runtime_id} {label} at {self.position}>"
+
+
+class EntityTracker(PacketMirror):
+    """
+    实体镜像
+
+    由 AddPlayer、AddActor、MoveActorAbsolute、MoveActorDelta、MovePlayer 与 RemoveActor
+    数据包维护机器人视野内的实体表，并以均匀网格空间哈希支持半径、包围盒与 k 近邻查询，
+    无需 /querytarget 等命令往返。玩家坐标与数据包一致，为眼睛高度。
+    切换维度(ChangeDimension)与重连后实体表被清空，由服务器重新发送的数据包重建。
+    """
+
+    handlers = {
+        "AddPlayer": "_handle_add_player",
+        "AddActor": "_handle_add_actor",
+        "RemoveActor": "_handle_remove_actor",
+        "MoveActorAbsolute": "_handle_move_actor_absolute",
+        "MoveActorDelta": "_handle_move_actor_delta",
+        "MovePlayer": "_handle_move_player",
+        "ChangeDimension": "_handle_change_dimension",
+    }
+
+    def __init__(self, client, cell_size: float = 16.0) -> None:
+        """
+        初始化实体镜像
+
+        参数:
+            client: GameClient 实例
+            cell_size: 空间哈希的格子边长
+        """
+        super().__init__(client)
+        self._entities: Dict[int, TrackedEntity] = {}
+        self._by_unique_id: Dict[int, int] = {}
+        self._players_by_name: Dict[str, int] = {}
+        self._grid = SpatialHash(cell_size)
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get(self, runtime_id: int) -> Optional[TrackedEntity]:
+        """按运行时 ID 获取实体"""
+        return self._entities.get(runtime_id)
+
+    def find_player(self, name: str) -> Optional[TrackedEntity]:
+        """按玩家名获取玩家"""
+        with self._lock:
+            runtime_id = self._players_by_name.get(name)
+            return self._entities.get(runtime_id) if runtime_id is not None else None
+
+    def entities(self, type: Optional[str] = None) -> List[TrackedEntity]:
+        """
+        获取所有实体
+
+        参数:
+            type: 实体类型，如 "minecraft:zombie"，为 None 时不过滤
+        """
+        with self._lock:
+            return [e for e in self._entities.values() if type is None or e.type == type]
+
+    def players(self) -> List[TrackedEntity]:
+        """获取所有玩家"""
+        return self.entities(PLAYER_TYPE)
+
+    def within_radius(
+        self,
+        center: Vec3,
+        radius: float,
+        type: Optional[str] = None
+    ) -> List[Tuple[float, TrackedEntity]]:
+        """
+        查询球形范围内的实体
+
+        返回:
+            按距离升序排列的 (距离, 实体) 列表
+        """
+        with self._lock:
+            return [
+                (distance, self._entities[rid])
+                for distance, rid in self._grid.query_radius(center, radius)
+                if type is None or self._entities[rid].type == type
+            ]
+
+    def within_box(self, low: Vec3, high: Vec3, type: Optional[str] = None) -> List[TrackedEntity]:
+        """查询包围盒内的实体"""
+        with self._lock:
+            return [
+                self._entities[rid] for rid in self._grid.query_box(low, high)
+                if type is None or self._entities[rid].type == type
+            ]
+
+    def nearest(
+        self,
+        center: Vec3,
+        k: int = 1,
+        type: Optional[str] = None,
+        max_radius: Optional[float] = None
+    ) -> List[Tuple[float, TrackedEntity]]:
+        """
+        查询最近的 k 个实体
+
+        参数:
+            center: 查询坐标
+            k: 数量
+            type: 实体类型，为 None 时不过滤
+            max_radius: 最大搜索半径
+
+        返回:
+            按距离升序排列的 (距离, 实体) 列表
+        """
+        with self._lock:
+            accept = None if type is None else (lambda rid: self._entities[rid].type == type)
+            return [
+                (distance, self._entities[rid])
+                for distance, rid in self._grid.nearest(center, k, max_radius, accept)
+            ]
+
+    def nearest_player(self, center: Vec3, max_radius: Optional[float] = None) -> Optional[TrackedEntity]:
+        """查询最近的玩家，没有时返回 None"""
+        found = self.nearest(center, 1, PLAYER_TYPE, max_radius)
+        return found[0][1] if found else None
+
+    def clear(self) -> None:
+        """清空实体表"""
+        with self._lock:
+            self._entities.clear()
+            self._by_unique_id.clear()
+            self._players_by_name.clear()
+            self._grid.clear()
+
+    def _reset(self) -> None:
+        """重连后服务器会重新发送视野内的实体，丢弃断线前的状态"""
+        self.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取统计信息
+
+        返回:
+            已处理的数据包数、实体数与玩家数
+        """
+        with self._lock:
+            return {
+                "packets": self.packets,
+                "entities": len(self._entities),
+                "players": len(self._players_by_name),
+            }
+
+    def _add(self, entity: TrackedEntity) -> None:
+        old = self._entities.get(entity.runtime_id)
+        if old is not None:
+            self._forget(old)
+        self._entities[entity.runtime_id] = entity
+        if entity.unique_id is not None:
+            self._by_unique_id[entity.unique_id] = entity.runtime_id
+        if entity.name:
+            self._players_by_name[entity.name] = entity.runtime_id
+        self._grid.update(entity.runtime_id, entity.position)
+
+    def _forget(self, entity: TrackedEntity) -> None:
+        self._entities.pop(entity.runtime_id, None)
+        if entity.unique_id is not None and self._by_unique_id.get(entity.unique_id) == entity.runtime_id:
+            del self._by_unique_id[entity.unique_id]
+        if entity.name and self._players_by_name.get(entity.name) == entity.runtime_id:
+            del self._players_by_name[entity.name]
+        self._grid.remove(entity.runtime_id)
+
+    def _move(self, runtime_id: int, position: Vec3) -> Optional[TrackedEntity]:
+        entity = self._entities.get(runtime_id)
+        if entity is None:
+            return None
+        entity.position = position
+        entity.updated_at = time.monotonic()
+        self._grid.update(runtime_id, position)
+        return entity
+
+    def _handle_add_player(self, packet: Dict[str, Any]) -> None:
+        ability_data = packet.get("AbilityData") or {}
+        entity = TrackedEntity(
+            packet["EntityRuntimeID"],
+            ability_data.get("EntityUniqueID"),
+            PLAYER_TYPE,
+            vec3(packet["Position"]),
+            name=packet.get("Username"),
+            uuid=str(packet["UUID"]) if packet.get("UUID") is not None else None
+        )
+        entity.pitch = packet.get("Pitch", 0.0)
+        entity.yaw = packet.get("Yaw", 0.0)
+        entity.head_yaw = packet.get("HeadYaw", 0.0)
+        self._add(entity)
+
+    def _handle_add_actor(self, packet: Dict[str, Any]) -> None:
+        entity = TrackedEntity(
+            packet["EntityRuntimeID"],
+            packet.get("EntityUniqueID"),
+            packet.get("EntityType", ""),
+            vec3(packet["Position"])
+        )
+        entity.pitch = packet.get("Pitch", 0.0)
+        entity.yaw = packet.get("Yaw", 0.0)
+        entity.head_yaw = packet.get("HeadYaw", 0.0)
+        self._add(entity)
+
+    def _handle_remove_actor(self, packet: Dict[str, Any]) -> None:
+        runtime_id = self._by_unique_id.get(packet.get("EntityUniqueID"))
+        entity = self._entities.get(runtime_id) if runtime_id is not None else None
+        if entity is not None:
+            self._forget(entity)
+
+    def _handle_move_actor_absolute(self, packet: Dict[str, Any]) -> None:
+        entity = self._move(packet["EntityRuntimeID"], vec3(packet["Position"]))
+        if entity is not None and packet.get("Rotation") is not None:
+            entity.pitch, entity.yaw, entity.head_yaw = vec3(packet["Rotation"])
+
+    def _handle_move_actor_delta(self, packet: Dict[str, Any]) -> None:
+        entity = self._entities.get(packet["EntityRuntimeID"])
+        if entity is None:
+            return
+        flags = packet.get("Flags", 0)
+        # 未设置标志的分量保持不变，已设置的分量为绝对值
+        x, y, z = entity.position
+        nx, ny, nz = vec3(packet.get("Position") or (x, y, z))
+        position = (
+            nx if flags & _DELTA_HAS_X else x,
+            ny if flags & _DELTA_HAS_Y else y,
+            nz if flags & _DELTA_HAS_Z else z,
+        )
+        if flags & (_DELTA_HAS_ROT_X | _DELTA_HAS_ROT_Y | _DELTA_HAS_ROT_Z) and packet.get("Rotation") is not None:
+            pitch, yaw, head_yaw = vec3(packet["Rotation"])
+            if flags & _DELTA_HAS_ROT_X:
+                entity.pitch = pitch
+            if flags & _DELTA_HAS_ROT_Y:
+                entity.yaw = yaw
+            if flags & _DELTA_HAS_ROT_Z:
+                entity.head_yaw = head_yaw
+        if position != entity.position:
+            self._move(entity.runtime_id, position)
+
+    def _handle_move_player(self, packet: Dict[str, Any]) -> None:
+        entity = self._move(packet["EntityRuntimeID"], vec3(packet["Position"]))
+        if entity is not None:
+            entity.pitch = packet.get("Pitch", entity.pitch)
+            entity.yaw = packet.get("Yaw", entity.yaw)
+            entity.head_yaw = packet.get("HeadYaw", entity.head_yaw)
+
+    def _handle_change_dimension(self, packet: Dict[str, Any]) -> None:
+        # 新维度的实体会由 AddActor、AddPlayer 重新发送
+        self.clear()
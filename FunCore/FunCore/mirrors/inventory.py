@@ -0,0 +1,299 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .base import PacketMirror, vec3
+
+# 固定窗口 ID
+WINDOW_INVENTORY = 0
+WINDOW_OFFHAND = 119
+WINDOW_ARMOUR = 120
+WINDOW_UI = 124
+FIXED_WINDOWS = frozenset((WINDOW_INVENTORY, WINDOW_OFFHAND, WINDOW_ARMOUR, WINDOW_UI))
+
+# (窗口 ID, 槽位)
+SlotRef = Tuple[int, int]
+
+
+class Item:
+    """槽位中的物品堆"""
+
+    __slots__ = ("network_id", "metadata", "count", "block_runtime_id", "nbt", "stack_id", "name")
+
+    def __init__(
+        self,
+        network_id: int,
+        count: int,
+        metadata: int = 0,
+        block_runtime_id: int = 0,
+        nbt: Optional[Dict[str, Any]] = None,
+        stack_id: int = 0,
+        name: Optional[str] = None
+    ) -> None:
+        self.network_id = network_id
+        self.count = count
+        self.metadata = metadata
+        self.block_runtime_id = block_runtime_id
+        self.nbt = nbt
+        self.stack_id = stack_id
+        self.name = name
+
+    @property
+    def custom_name(self) -> Optional[str]:
+        """由铁砧等设置的物品名称"""
+        display = (self.nbt or {}).get("display")
+        return display.get("Name") if isinstance(display, dict) else None
+
+    def __repr__(self) -> str:
+        label = self.name or f"#{self.network_id}:{self.metadata}"
+        return f"<Item {label} x{self.count}>"
+
+
+class Container:
+    """一个窗口中的全部槽位"""
+
+    __slots__ = ("window_id", "container_type", "position", "entity_unique_id", "size", "slots")
+
+    def __init__(
+        self,
+        window_id: int,
+        container_type: Optional[int] = None,
+        position: Optional[Tuple[int, int, int]] = None,
+        entity_unique_id: Optional[int] = None
+    ) -> None:
+        self.window_id = window_id
+        self.container_type = container_type
+        self.position = position
+        self.entity_unique_id = entity_unique_id
+        self.size = 0
+        # 槽位 -> 物品，空槽位不记录
+        self.slots: Dict[int, Item] = {}
+
+    def empty_slots(self) -> List[int]:
+        """已知大小内的空槽位"""
+        return [slot for slot in range(self.size) if slot not in self.slots]
+
+    def __repr__(self) -> str:
+        return f"<Container {self.window_id} ({len(self.slots)}/{self.size})>"
+
+
+class InventoryMirror(PacketMirror):
+    """
+    背包与容器镜像
+
+    由 InventoryContent、InventorySlot、ContainerOpen 与 ContainerClose 数据包维护机器人的
+    背包、盔甲、副手以及当前打开的容器，按槽位或物品读取均无需命令往返。
+    物品以网络 ID 为索引；提供 item_resolver 时同时以物品名称为索引。
+    """
+
+    handlers = {
+        "InventoryContent": "_handle_inventory_content",
+        "InventorySlot": "_handle_inventory_slot",
+        "ContainerOpen": "_handle_container_open",
+        "ContainerClose": "_handle_container_close",
+    }
+
+    def __init__(
+        self,
+        client,
+        item_resolver: Optional[Callable[[int, int], Optional[str]]] = None
+    ) -> None:
+        """
+        初始化背包与容器镜像
+
+        参数:
+            client: GameClient 实例
+            item_resolver: 把 (网络 ID, 数据值) 转换为物品名称的函数
+        """
+        super().__init__(client)
+        self.item_resolver = item_resolver
+        self._windows: Dict[int, Container] = {}
+        self._open_window: Optional[int] = None
+        # 网络 ID 或物品名称 -> 所在槽位
+        self._index: Dict[Any, Set[SlotRef]] = {}
+        self.slot_updates = 0
+
+    def start(self) -> "InventoryMirror":
+        """开始订阅数据包，并从 ExtendInfo 取得订阅前已打开的容器"""
+        super().start()
+        extend_info = self.client.get_extend_info() or {}
+        opened = extend_info.get("currentOpenedContainer")
+        if extend_info.get("currentContainerOpened") and opened:
+            with self._lock:
+                if self._open_window is None:
+                    self._handle_container_open(opened)
+        return self
+
+    @property
+    def inventory(self) -> Container:
+        """机器人背包"""
+        return self.window(WINDOW_INVENTORY)
+
+    @property
+    def open_container(self) -> Optional[Container]:
+        """当前打开的容器，没有时返回 None"""
+        window_id = self._open_window
+        return self._windows.get(window_id) if window_id is not None else None
+
+    def window(self, window_id: int) -> Container:
+        """获取窗口，尚未收到内容时返回空容器"""
+        with self._lock:
+            container = self._windows.get(window_id)
+            if container is None:
+                container = self._windows[window_id] = Container(window_id)
+            return container
+
+    def slot(self, slot: int, window_id: int = WINDOW_INVENTORY) -> Optional[Item]:
+        """
+        获取槽位中的物品
+
+        参数:
+            slot: 槽位
+            window_id: 窗口 ID，默认为背包
+
+        返回:
+            物品，空槽位或未知时返回 None
+        """
+        container = self._windows.get(window_id)
+        return container.slots.get(slot) if container is not None else None
+
+    def find(self, item: int | str, window_id: Optional[int] = None) -> List[Tuple[int, int, Item]]:
+        """
+        查找物品
+
+        参数:
+            item: 网络 ID 或物品名称(需要 item_resolver)
+            window_id: 只在该窗口中查找，为 None 时查找所有窗口
+
+        返回:
+            按 (窗口 ID, 槽位) 排序的 (窗口 ID, 槽位, 物品) 列表
+        """
+        with self._lock:
+            refs = self._index.get(item, ())
+            return [
+                (wid, slot, self._windows[wid].slots[slot])
+                for wid, slot in sorted(refs)
+                if window_id is None or wid == window_id
+            ]
+
+    def count(self, item: int | str, window_id: Optional[int] = WINDOW_INVENTORY) -> int:
+        """统计物品总数，默认只统计背包"""
+        return sum(stack.count for _, _, stack in self.find(item, window_id))
+
+    def first_empty(self, window_id: int = WINDOW_INVENTORY) -> Optional[int]:
+        """获取第一个空槽位，没有时返回 None"""
+        with self._lock:
+            container = self._windows.get(window_id)
+            if container is None:
+                return None
+            return next(iter(container.empty_slots()), None)
+
+    def clear(self) -> None:
+        """清空镜像"""
+        with self._lock:
+            self._windows.clear()
+            self._index.clear()
+            self._open_window = None
+
+    def _reset(self) -> None:
+        """重连后服务器会重新发送背包内容，丢弃断线前的状态"""
+        self.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            已处理的数据包数、槽位更新数、已知窗口数、当前打开的窗口与索引的物品种类数
+        """
+        with self._lock:
+            return {
+                "packets": self.packets,
+                "slot_updates": self.slot_updates,
+                "windows": len(self._windows),
+                "open_window": self._open_window,
+                "indexed_items": len(self._index),
+            }
+
+    def _keys(self, item: Item) -> Iterator[Any]:
+        yield item.network_id
+        if item.name is not None:
+            yield item.name
+
+    def _set_slot(self, container: Container, slot: int, item: Optional[Item]) -> None:
+        ref = (container.window_id, slot)
+        old = container.slots.pop(slot, None)
+        if old is not None:
+            for key in self._keys(old):
+                refs = self._index.get(key)
+                if refs is not None:
+                    refs.discard(ref)
+                    if not refs:
+                        del self._index[key]
+        if item is not None:
+            container.slots[slot] = item
+            for key in self._keys(item):
+                self._index.setdefault(key, set()).add(ref)
+        self.slot_updates += 1
+
+    def _drop_window(self, window_id: int) -> None:
+        container = self._windows.pop(window_id, None)
+        if container is not None:
+            for slot in list(container.slots):
+                self._set_slot(container, slot, None)
+
+    def _item(self, instance: Dict[str, Any]) -> Optional[Item]:
+        stack = instance.get("Stack", instance)
+        # ItemType 可能被展开到物品堆中
+        item_type = stack.get("ItemType", stack)
+        network_id = item_type.get("NetworkID", 0)
+        count = stack.get("Count", 0)
+        if not network_id or count <= 0:
+            return None
+        metadata = item_type.get("MetadataValue", 0)
+        return Item(
+            network_id,
+            count,
+            metadata,
+            stack.get("BlockRuntimeID", 0),
+            stack.get("NBTData") or None,
+            instance.get("StackNetworkID", 0),
+            self.item_resolver(network_id, metadata) if self.item_resolver is not None else None
+        )
+
+    def _container(self, window_id: int) -> Container:
+        container = self._windows.get(window_id)
+        if container is None:
+            container = self._windows[window_id] = Container(window_id)
+        return container
+
+    def _handle_inventory_content(self, packet: Dict[str, Any]) -> None:
+        container = self._container(packet.get("WindowID", 0))
+        content = packet.get("Content") or ()
+        for slot in [s for s in container.slots if s >= len(content)]:
+            self._set_slot(container, slot, None)
+        for slot, instance in enumerate(content):
+            self._set_slot(container, slot, self._item(instance))
+        container.size = len(content)
+
+    def _handle_inventory_slot(self, packet: Dict[str, Any]) -> None:
+        container = self._container(packet.get("WindowID", 0))
+        slot = packet.get("Slot", 0)
+        self._set_slot(container, slot, self._item(packet.get("NewItem") or {}))
+        container.size = max(container.size, slot + 1)
+
+    def _handle_container_open(self, packet: Dict[str, Any]) -> None:
+        window_id = packet.get("WindowID", 0)
+        if self._open_window is not None and self._open_window != window_id:
+            self._drop_window(self._open_window)
+        container = self._container(window_id)
+        container.container_type = packet.get("ContainerType")
+        position = packet.get("ContainerPosition")
+        container.position = tuple(int(v) for v in vec3(position)) if position is not None else None
+        container.entity_unique_id = packet.get("ContainerEntityUniqueID")
+        self._open_window = window_id
+
+    def _handle_container_close(self, packet: Dict[str, Any]) -> None:
+        window_id = packet.get("WindowID", 0)
+        if window_id not in FIXED_WINDOWS:
+            self._drop_window(window_id)
+        if self._open_window == window_id:
+            self._open_window = None
@@ -0,0 +1,400 @@
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..utils.buffer_reader import open_reader
+from ..utils.lazy_import import lazy_import
+from .base import PacketMirror, vec3
+
+# SubChunk 条目中带有方块数据的结果: 成功、成功且全部为空气
+_SUB_CHUNK_SUCCESS = 1
+_SUB_CHUNK_RESULTS_WITH_DATA = (_SUB_CHUNK_SUCCESS, 6)
+
+nbtlib = lazy_import("nbtlib")
+
+BlockPos = Tuple[int, int, int]
+
+
+class Block:
+    """
+    方块状态
+
+    由结构 NBT 得到的方块带有名称与方块状态；仅由数据包得到的方块只有运行时 ID，
+    重新同步后会学习运行时 ID 与名称的对应关系。
+    """
+
+    __slots__ = ("name", "states", "runtime_id")
+
+    def __init__(
+        self,
+        name: Optional[str],
+        states: Tuple[Tuple[str, Any], ...] = (),
+        runtime_id: Optional[int] = None
+    ) -> None:
+        self.name = name
+        self.states = states
+        self.runtime_id = runtime_id
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Block):
+            return NotImplemented
+        if self.name is None or other.name is None:
+            return self.name is other.name and self.runtime_id == other.runtime_id
+        return self.name == other.name and self.states == other.states
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.states) if self.name is not None else (None, self.runtime_id))
+
+    def __repr__(self) -> str:
+        if self.name is None:
+            return f"Block(runtime_id={self.runtime_id})"
+        if self.states:
+            states = ",".join(f"{k}={v}" for k, v in self.states)
+            return f"Block({self.name}[{states}])"
+        return f"Block({self.name})"
+
+
+class RegionWatch(PacketMirror):
+    """
+    区域方块镜像
+
+    用 get_structure_as_nbt 取得一次区域内的全部方块，此后由 UpdateBlock、UpdateSubChunkBlocks
+    与 BlockActorData 数据包保持同步，方块查询为 O(1) 且无需命令往返。
+    重连或区域所在区块被重新发送(LevelChunk、SubChunk)时认为可能漏掉了更新，自动重新同步；
+    区块触发的同步按区域去抖，同步期间与冷却期内的触发被忽略。
+    """
+
+    handlers = {
+        "UpdateBlock": "_handle_update_block",
+        "UpdateSubChunkBlocks": "_handle_update_sub_chunk_blocks",
+        "BlockActorData": "_handle_block_actor_data",
+        "LevelChunk": "_handle_level_chunk",
+        "SubChunk": "_handle_sub_chunk",
+    }
+
+    def __init__(
+        self,
+        client,
+        origin: BlockPos,
+        size: BlockPos,
+        resync_delay: float = 0.5,
+        block_resolver: Optional[Callable[[int], Optional[Block]]] = None,
+        resync_cooldown: float = 5.0
+    ) -> None:
+        """
+        初始化区域方块镜像
+
+        参数:
+            client: GameClient 实例
+            origin: 区域最小角坐标
+            size: 区域大小 (x, y, z)
+            resync_delay: 检测到可能漏掉更新后等待多久再重新同步(秒)，期间的多次触发只同步一次
+            block_resolver: 把方块运行时 ID 转换为 Block 的函数，返回 None 时使用学习到的对应关系
+            resync_cooldown: 同步期间与同步完成后多久内(秒)忽略区块重新发送触发的同步，
+                取得结构 NBT 本身也会使服务器重新发送区块，避免反复同步
+        """
+        super().__init__(client)
+        self.origin = tuple(origin)
+        self.size = tuple(size)
+        self.resync_delay = resync_delay
+        self.resync_cooldown = resync_cooldown
+        self.block_resolver = block_resolver
+        self._palette: List[Block] = []
+        self._palette_index: Dict[Block, int] = {}
+        self._cells = array("i")
+        self._block_entities: Dict[BlockPos, Any] = {}
+        self._runtime_blocks: Dict[int, Block] = {}
+        self._callbacks: List[Callable[[BlockPos, Optional[Block], Block], None]] = []
+        self._seeding = False
+        self._seed_finished_at: Optional[float] = None
+        self._pending_updates: List[Tuple[BlockPos, Block]] = []
+        self._resync_event = threading.Event()
+        self._resync_thread: Optional[threading.Thread] = None
+
+        # 统计信息
+        self.seeds = 0
+        self.updates = 0
+        self.changes = 0
+        self.skipped_resyncs = 0
+        self.last_seed_at: Optional[float] = None
+
+    def start(self) -> "RegionWatch":
+        """取得区域方块并开始订阅数据包"""
+        super().start()
+        self.resync()
+        return self
+
+    def on_change(self, callback: Callable[[BlockPos, Optional[Block], Block], None]) -> None:
+        """
+        注册方块变化回调
+
+        参数:
+            callback: 参数为(坐标, 原方块, 新方块)，在数据包分发线程中调用
+        """
+        self._callbacks.append(callback)
+
+    def contains(self, x: int, y: int, z: int) -> bool:
+        """坐标是否在区域内"""
+        ox, oy, oz = self.origin
+        sx, sy, sz = self.size
+        return 0 <= x - ox < sx and 0 <= y - oy < sy and 0 <= z - oz < sz
+
+    def _index(self, x: int, y: int, z: int) -> int:
+        # 与 mcstructure 的 block_indices 顺序一致: x 最高位，z 最低位
+        ox, oy, oz = self.origin
+        _, sy, sz = self.size
+        return ((x - ox) * sy + (y - oy)) * sz + (z - oz)
+
+    def get(self, x: int, y: int, z: int) -> Optional[Block]:
+        """
+        获取方块
+
+        返回:
+            方块，区域外或尚未同步时返回 None
+        """
+        if not self.contains(x, y, z) or not self._cells:
+            return None
+        index = self._cells[self._index(x, y, z)]
+        return self._palette[index] if index >= 0 else None
+
+    def block_entity(self, x: int, y: int, z: int) -> Any:
+        """获取方块实体 NBT，没有时返回 None"""
+        return self._block_entities.get((x, y, z))
+
+    def find(self, name: str) -> List[BlockPos]:
+        """
+        查找区域内指定名称的方块
+
+        参数:
+            name: 方块名称，如 "minecraft:chest"
+
+        返回:
+            坐标列表
+        """
+        with self._lock:
+            indices = {i for i, block in enumerate(self._palette) if block.name == name}
+            if not indices:
+                return []
+            ox, oy, oz = self.origin
+            _, sy, sz = self.size
+            result = []
+            for offset, index in enumerate(self._cells):
+                if index in indices:
+                    rest, dz = divmod(offset, sz)
+                    dx, dy = divmod(rest, sy)
+                    result.append((ox + dx, oy + dy, oz + dz))
+            return result
+
+    def resync(self, wait: bool = True) -> None:
+        """
+        重新取得区域方块
+
+        参数:
+            wait: 为 False 时在后台线程中延迟 resync_delay 后同步
+        """
+        if wait:
+            self._seed()
+            return
+        self._resync_event.set()
+        if not (self._resync_thread and self._resync_thread.is_alive()):
+            self._resync_thread = threading.Thread(target=self._resync_loop, daemon=True)
+            self._resync_thread.start()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            同步次数、处理的方块更新数、实际变化数、冷却期内忽略的同步触发数、调色板大小、
+            学习到的运行时 ID 数与上次同步时间
+        """
+        return {
+            "packets": self.packets,
+            "seeds": self.seeds,
+            "updates": self.updates,
+            "changes": self.changes,
+            "skipped_resyncs": self.skipped_resyncs,
+            "palette": len(self._palette),
+            "learned_runtime_ids": len(self._runtime_blocks),
+            "last_seed_at": self.last_seed_at,
+        }
+
+    def _resync_loop(self) -> None:
+        while True:
+            if not self._resync_event.wait(1.0):
+                if not self.started:
+                    return
+                continue
+            # 合并短时间内的多次触发
+            time.sleep(self.resync_delay)
+            self._resync_event.clear()
+            try:
+                self._seed()
+            except Exception as e:
+                self.client.logger.error(f"区域方块重新同步失败: {e}")
+
+    def _palette_id(self, block: Block) -> int:
+        index = self._palette_index.get(block)
+        if index is None:
+            index = self._palette_index[block] = len(self._palette)
+            self._palette.append(block)
+        return index
+
+    def _seed(self) -> None:
+        """通过结构 NBT 取得区域方块"""
+        with self._lock:
+            self._seeding = True
+            self._pending_updates.clear()
+        try:
+            data = self.client.get_structure_as_nbt(self.origin, self.size)
+            if data is None:
+                raise ConnectionError("获取结构 NBT 失败")
+            palette, indices, block_entities = self._parse_structure(data)
+        except Exception:
+            with self._lock:
+                self._seeding = False
+                self._seed_finished_at = time.monotonic()
+            raise
+        with self._lock:
+            old_cells = self._cells
+            old_palette = self._palette
+            self._palette = []
+            self._palette_index = {}
+            mapping = [self._palette_id(block) for block in palette]
+            self._cells = array("i", (mapping[i] if i >= 0 else -1 for i in indices))
+            self._block_entities = block_entities
+            # 把此前只有运行时 ID 的方块与同步结果对应起来
+            if old_cells:
+                for offset, old_index in enumerate(old_cells):
+                    old = old_palette[old_index] if old_index >= 0 else None
+                    new_index = self._cells[offset]
+                    if old is not None and old.name is None and new_index >= 0:
+                        self._runtime_blocks[old.runtime_id] = self._palette[new_index]
+            self._seeding = False
+            self._seed_finished_at = time.monotonic()
+            self.seeds += 1
+            self.last_seed_at = time.time()
+            # 同步期间收到的更新可能晚于快照，重新应用
+            pending, self._pending_updates = self._pending_updates, []
+            for pos, block in pending:
+                self._apply(pos, block)
+
+    def _parse_structure(self, data) -> Tuple[List[Block], List[int], Dict[BlockPos, Any]]:
+        """解析 mcstructure 格式的结构 NBT"""
+        root = nbtlib.File.parse(open_reader(data), byteorder="little")
+        structure = root["structure"]
+        layer = structure["block_indices"][0]
+        default = structure["palette"]["default"]
+        palette = [
+            Block(str(entry["name"]), tuple(sorted((str(k), v) for k, v in entry.get("states", {}).items())))
+            for entry in default["block_palette"]
+        ]
+        indices = [int(i) for i in layer]
+        block_entities: Dict[BlockPos, Any] = {}
+        ox, oy, oz = self.origin
+        _, sy, sz = self.size
+        for offset, position_data in default.get("block_position_data", {}).items():
+            if "block_entity_data" in position_data:
+                rest, dz = divmod(int(offset), sz)
+                dx, dy = divmod(rest, sy)
+                block_entities[(ox + dx, oy + dy, oz + dz)] = position_data["block_entity_data"]
+        return palette, indices, block_entities
+
+    def _resolve(self, runtime_id: int) -> Block:
+        """把运行时 ID 转换为方块"""
+        if self.block_resolver is not None:
+            block = self.block_resolver(runtime_id)
+            if block is not None:
+                return block
+        block = self._runtime_blocks.get(runtime_id)
+        return block if block is not None else Block(None, runtime_id=runtime_id)
+
+    def _normalize(self, block: Optional[Block]) -> Optional[Block]:
+        """把只有运行时 ID 的方块换成已学习到的带名称方块，使同一方块的两种形式比较相等"""
+        if block is not None and block.name is None:
+            learned = self._runtime_blocks.get(block.runtime_id)
+            if learned is not None:
+                return learned
+        return block
+
+    def _chunk_resent(self) -> None:
+        """区块被重新发送时安排重新同步，同步期间与冷却期内的触发被忽略"""
+        finished = self._seed_finished_at
+        if self._seeding or (finished is not None and time.monotonic() - finished < self.resync_cooldown):
+            self.skipped_resyncs += 1
+            return
+        self.resync(wait=False)
+
+    def _reset(self) -> None:
+        """断线期间方块可能已变化，安排重新同步(不受冷却期限制)"""
+        self.resync(wait=False)
+
+    def _update(self, pos: BlockPos, runtime_id: int) -> None:
+        if not self.contains(*pos):
+            return
+        self.updates += 1
+        block = self._resolve(runtime_id)
+        if self._seeding:
+            self._pending_updates.append((pos, block))
+        if self._cells:
+            self._apply(pos, block)
+
+    def _apply(self, pos: BlockPos, block: Block) -> None:
+        offset = self._index(*pos)
+        old_index = self._cells[offset]
+        old = self._normalize(self._palette[old_index]) if old_index >= 0 else None
+        block = self._normalize(block)
+        if old == block:
+            return
+        self._cells[offset] = self._palette_id(block)
+        self.changes += 1
+        for callback in self._callbacks:
+            try:
+                callback(pos, old, block)
+            except Exception as e:
+                self.client.logger.error(f"方块变化回调错误: {e}")
+
+    def _handle_update_block(self, packet: Dict[str, Any]) -> None:
+        # 只镜像主层，含水等附加层忽略
+        if packet.get("Layer", 0) != 0:
+            return
+        self._update(vec3(packet["Position"]), packet["NewBlockRuntimeID"])
+
+    def _handle_update_sub_chunk_blocks(self, packet: Dict[str, Any]) -> None:
+        for entry in packet.get("Blocks") or ():
+            self._update(vec3(entry["BlockPos"]), entry["BlockRuntimeID"])
+
+    def _handle_block_actor_data(self, packet: Dict[str, Any]) -> None:
+        pos = vec3(packet["Position"])
+        if self.contains(*pos):
+            self._block_entities[pos] = packet.get("NBTData")
+
+    def _chunk_overlaps(self, cx: int, cz: int) -> bool:
+        ox, _, oz = self.origin
+        sx, _, sz = self.size
+        return ox >> 4 <= cx <= (ox + sx - 1) >> 4 and oz >> 4 <= cz <= (oz + sz - 1) >> 4
+
+    def _sub_chunk_overlaps(self, cx: int, cy: int, cz: int) -> bool:
+        oy = self.origin[1]
+        sy = self.size[1]
+        return self._chunk_overlaps(cx, cz) and oy >> 4 <= cy <= (oy + sy - 1) >> 4
+
+    def _handle_level_chunk(self, packet: Dict[str, Any]) -> None:
+        position = packet.get("Position") or ()
+        if len(position) >= 2 and self._chunk_overlaps(position[0], position[1]):
+            self._chunk_resent()
+
+    def _handle_sub_chunk(self, packet: Dict[str, Any]) -> None:
+        # Position 为请求的中心子区块，各条目的实际位置为中心加上 Offset
+        position = packet.get("Position")
+        if position is None:
+            return
+        cx, cy, cz = vec3(position)
+        for entry in packet.get("SubChunkEntries") or ():
+            if entry.get("Result", _SUB_CHUNK_SUCCESS) not in _SUB_CHUNK_RESULTS_WITH_DATA:
+                continue
+            dx, dy, dz = vec3(entry.get("Offset") or (0, 0, 0))
+            if self._sub_chunk_overlaps(cx + dx, cy + dy, cz + dz):
+                self._chunk_resent()
+                return
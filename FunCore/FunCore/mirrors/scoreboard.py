@@ -0,0 +1,400 @@
+import heapq
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .base import PacketMirror
+
+# SetScore 与 SetScoreboardIdentity 的操作类型
+_ACTION_MODIFY = 0
+_ACTION_REMOVE = 1
+
+# SetScore 条目的身份类型
+IDENTITY_PLAYER = 1
+IDENTITY_ENTITY = 2
+IDENTITY_FAKE_PLAYER = 3
+
+# SetDisplayObjective 的排序方式
+SORT_ASCENDING = 0
+SORT_DESCENDING = 1
+
+
+class Objective:
+    """计分板项目"""
+
+    __slots__ = ("name", "display_name", "criteria", "sort_order", "display_slots", "scores", "_ranking")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.display_name = name
+        self.criteria = "dummy"
+        self.sort_order = SORT_DESCENDING
+        self.display_slots: Set[str] = set()
+        # 分数持有者名称 -> 分数
+        self.scores: Dict[str, int] = {}
+        self._ranking: Optional[List[Tuple[str, int]]] = None
+
+    def set(self, holder: str, score: int) -> None:
+        if self.scores.get(holder) != score:
+            self.scores[holder] = score
+            self._ranking = None
+
+    def remove(self, holder: str) -> None:
+        if self.scores.pop(holder, None) is not None:
+            self._ranking = None
+
+    def top(self, n: int, descending: bool) -> List[Tuple[str, int]]:
+        """排名前 n 的 (名称, 分数)，排名在下次变化前缓存"""
+        ranking = self._ranking
+        if ranking is None:
+            if n * 4 < len(self.scores):
+                # 只取前几名时不必整体排序
+                pick = heapq.nlargest if descending else heapq.nsmallest
+                return pick(n, self.scores.items(), key=lambda item: item[1])
+            ranking = self._ranking = sorted(self.scores.items(), key=lambda item: item[1], reverse=True)
+        if descending:
+            return ranking[:n]
+        return ranking[:-n - 1:-1] if n > 0 else []
+
+    def __repr__(self) -> str:
+        return f"<Objective {self.name} ({len(self.scores)} 条分数)>"
+
+
+class ScoreboardMirror(PacketMirror):
+    """
+    计分板镜像
+
+    由 SetScore、SetDisplayObjective、RemoveObjective、SetScoreboardIdentity 与 PlayerList
+    数据包维护计分板，按玩家或按项目读取分数均为 O(1)，并提供排行榜查询。
+    服务器只为显示中的项目发送分数，其他分数用 /scoreboard players list * 一次性取得。
+    get 与 top 读取显示中的项目时不需要命令往返；读取未显示或未见过的项目时，
+    若距上次取得已超过 fetch_ttl 秒则先重新取得(一次命令往返)，刚出现或刚停止显示的项目总是重新取得。
+    scores_of、displayed 与 fetch=False 的读取只使用本地状态。
+    """
+
+    handlers = {
+        "SetScore": "_handle_set_score",
+        "SetDisplayObjective": "_handle_set_display_objective",
+        "RemoveObjective": "_handle_remove_objective",
+        "SetScoreboardIdentity": "_handle_set_scoreboard_identity",
+        "PlayerList": "_handle_player_list",
+    }
+
+    def __init__(self, client, fetch_timeout: int = 5, fetch_ttl: float = 1.0) -> None:
+        """
+        初始化计分板镜像
+
+        参数:
+            client: GameClient 实例
+            fetch_timeout: 通过命令取得分数时的超时时间(秒)
+            fetch_ttl: 未显示项目的分数取得后的有效期(秒)，过期后读取时重新取得
+        """
+        super().__init__(client)
+        self.fetch_timeout = fetch_timeout
+        self.fetch_ttl = fetch_ttl
+        self._objectives: Dict[str, Objective] = {}
+        # 分数持有者名称 -> {项目名: 分数}
+        self._by_holder: Dict[str, Dict[str, int]] = {}
+        # 计分板条目 ID -> (持有者名称, 项目名)
+        self._entries: Dict[int, Tuple[str, str]] = {}
+        self._unique_id_names: Dict[int, str] = {}
+        # 上次用命令取得分数的时间
+        self._fetched_at: Optional[float] = None
+        # 需要重新取得分数的项目名
+        self._stale: Set[str] = set()
+        self.fetches = 0
+
+    def start(self) -> "ScoreboardMirror":
+        """从 UQHolder 取得订阅前已在线玩家的名称，然后开始订阅数据包"""
+        players = self.client.get_players_info() or {}
+        with self._lock:
+            for player in players.values():
+                if player.get("Username") and player.get("EntityUniqueID") is not None:
+                    self._unique_id_names.setdefault(player["EntityUniqueID"], player["Username"])
+        super().start()
+        return self
+
+    def objectives(self) -> List[str]:
+        """已知的项目名"""
+        with self._lock:
+            return list(self._objectives)
+
+    def objective(self, name: str) -> Optional[Objective]:
+        """获取项目，未见过时返回 None"""
+        return self._objectives.get(name)
+
+    def get(self, objective: str, holder: str, fetch: bool = True) -> Optional[int]:
+        """
+        获取分数
+
+        参数:
+            objective: 项目名
+            holder: 玩家名或假玩家名
+            fetch: 项目的分数可能已过期时是否用命令重新取得
+
+        返回:
+            分数，没有时返回 None
+        """
+        if fetch and self._needs_fetch(objective):
+            self.fetch(force=True)
+        obj = self._objectives.get(objective)
+        return obj.scores.get(holder) if obj is not None else None
+
+    def scores_of(self, holder: str) -> Dict[str, int]:
+        """获取某个持有者在所有项目中的分数"""
+        with self._lock:
+            return dict(self._by_holder.get(holder, {}))
+
+    def top(
+        self,
+        objective: str,
+        n: int = 10,
+        descending: Optional[bool] = None,
+        fetch: bool = True
+    ) -> List[Tuple[str, int]]:
+        """
+        获取排行榜
+
+        参数:
+            objective: 项目名
+            n: 名次数
+            descending: 是否降序，默认按项目的显示排序方式
+            fetch: 项目的分数可能已过期时是否用命令重新取得
+
+        返回:
+            (名称, 分数) 列表
+        """
+        if fetch and self._needs_fetch(objective):
+            self.fetch(force=True)
+        with self._lock:
+            obj = self._objectives.get(objective)
+            if obj is None:
+                return []
+            if descending is None:
+                descending = obj.sort_order == SORT_DESCENDING
+            return obj.top(n, descending)
+
+    def displayed(self, slot: str) -> Optional[str]:
+        """获取显示位置(sidebar、list、belowname)当前显示的项目名"""
+        with self._lock:
+            for obj in self._objectives.values():
+                if slot in obj.display_slots:
+                    return obj.name
+        return None
+
+    def fetch(self, force: bool = False) -> bool:
+        """
+        用 /scoreboard players list * 取得全部分数
+
+        未显示的项目以取得结果替换原有分数；显示中的项目由数据包保持最新，只补充数据包中未出现过的分数。
+
+        参数:
+            force: 是否在已取得过时再次取得
+
+        返回:
+            是否成功
+        """
+        if self._fetched_at is not None and not force:
+            return True
+        result = self.client.send_websocket_command_need_response(
+            "/scoreboard players list *", self.fetch_timeout
+        )
+        if not isinstance(result, Mapping):
+            return False
+        fetched = parse_players_list(result)
+        with self._lock:
+            self._fetched_at = time.monotonic()
+            self._stale.clear()
+            self.fetches += 1
+            holders: Dict[str, Set[str]] = {}
+            for (holder, objective), score in fetched.items():
+                holders.setdefault(objective, set()).add(holder)
+                obj = self._objectives.get(objective)
+                if obj is None:
+                    obj = self._objectives[objective] = Objective(objective)
+                elif obj.display_slots and holder in obj.scores:
+                    # 显示中的项目由数据包保持最新
+                    continue
+                self._set(obj, holder, score)
+            # 未显示的项目中已不在列表里的分数已被重置
+            for obj in self._objectives.values():
+                if obj.display_slots:
+                    continue
+                present = holders.get(obj.name, ())
+                for holder in [h for h in obj.scores if h not in present]:
+                    self._unset(obj.name, holder)
+        return True
+
+    def clear(self) -> None:
+        """清空镜像"""
+        with self._lock:
+            self._objectives.clear()
+            self._by_holder.clear()
+            self._entries.clear()
+            self._fetched_at = None
+            self._stale.clear()
+
+    def _reset(self) -> None:
+        """重连后服务器会重新发送显示中的计分项，丢弃断线前的状态"""
+        self.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取统计信息
+
+        返回:
+            已处理的数据包数、项目数、分数持有者数与命令取得次数
+        """
+        with self._lock:
+            return {
+                "packets": self.packets,
+                "objectives": len(self._objectives),
+                "holders": len(self._by_holder),
+                "fetches": self.fetches,
+            }
+
+    def _needs_fetch(self, objective: str) -> bool:
+        """读取项目前是否需要用命令重新取得分数"""
+        fetched_at = self._fetched_at
+        if fetched_at is None or objective in self._stale:
+            return True
+        obj = self._objectives.get(objective)
+        if obj is not None and obj.display_slots:
+            return False
+        # 未显示的项目不会收到分数更新
+        return time.monotonic() - fetched_at >= self.fetch_ttl
+
+    def _set(self, obj: Objective, holder: str, score: int) -> None:
+        obj.set(holder, score)
+        self._by_holder.setdefault(holder, {})[obj.name] = score
+
+    def _unset(self, objective: str, holder: str) -> None:
+        obj = self._objectives.get(objective)
+        if obj is not None:
+            obj.remove(holder)
+        scores = self._by_holder.get(holder)
+        if scores is not None:
+            scores.pop(objective, None)
+            if not scores:
+                del self._by_holder[holder]
+
+    def _holder_name(self, entry: Dict[str, Any]) -> str:
+        identity = entry.get("IdentityType")
+        if identity == IDENTITY_FAKE_PLAYER and entry.get("DisplayName"):
+            return entry["DisplayName"]
+        unique_id = entry.get("EntityUniqueID")
+        name = self._unique_id_names.get(unique_id)
+        if name is not None:
+            return name
+        # 未知的玩家与实体以条目 ID 表示
+        return f"#{entry.get('EntryID')}"
+
+    def _handle_set_score(self, packet: Dict[str, Any]) -> None:
+        action = packet.get("ActionType", _ACTION_MODIFY)
+        for entry in packet.get("Entries") or ():
+            entry_id = entry.get("EntryID")
+            if action == _ACTION_REMOVE:
+                known = self._entries.pop(entry_id, None)
+                if known is not None:
+                    self._unset(known[1], known[0])
+                continue
+            objective = entry.get("ObjectiveName", "")
+            obj = self._objectives.get(objective)
+            if obj is None:
+                obj = self._objectives[objective] = Objective(objective)
+            holder = self._holder_name(entry)
+            self._entries[entry_id] = (holder, objective)
+            self._set(obj, holder, entry.get("Score", 0))
+
+    def _handle_set_display_objective(self, packet: Dict[str, Any]) -> None:
+        slot = packet.get("DisplaySlot", "")
+        name = packet.get("ObjectiveName", "")
+        for obj in self._objectives.values():
+            if slot in obj.display_slots:
+                obj.display_slots.discard(slot)
+                if not obj.display_slots and obj.name != name:
+                    # 不再显示的项目不再收到分数更新
+                    self._stale.add(obj.name)
+        if not name:
+            # 项目名为空表示清空该显示位置
+            return
+        obj = self._objectives.get(name)
+        if obj is None:
+            # 首次取得之后创建的项目，下次读取时重新取得
+            obj = self._objectives[name] = Objective(name)
+            self._stale.add(name)
+        obj.display_name = packet.get("DisplayName") or name
+        obj.criteria = packet.get("CriteriaName") or obj.criteria
+        obj.sort_order = packet.get("SortOrder", obj.sort_order)
+        obj.display_slots.add(slot)
+
+    def _handle_remove_objective(self, packet: Dict[str, Any]) -> None:
+        name = packet.get("ObjectiveName", "")
+        obj = self._objectives.pop(name, None)
+        self._stale.discard(name)
+        if obj is None:
+            return
+        for holder in list(obj.scores):
+            scores = self._by_holder.get(holder)
+            if scores is not None:
+                scores.pop(name, None)
+                if not scores:
+                    del self._by_holder[holder]
+        self._entries = {k: v for k, v in self._entries.items() if v[1] != name}
+
+    def _handle_set_scoreboard_identity(self, packet: Dict[str, Any]) -> None:
+        if packet.get("ActionType", _ACTION_MODIFY) != _ACTION_MODIFY:
+            return
+        # 条目与玩家绑定后，把以条目 ID 表示的分数改为玩家名
+        for entry in packet.get("Entries") or ():
+            name = self._unique_id_names.get(entry.get("EntityUniqueID"))
+            known = self._entries.get(entry.get("EntryID"))
+            if name is None or known is None or known[0] == name:
+                continue
+            old_holder, objective = known
+            score = self._by_holder.get(old_holder, {}).get(objective)
+            self._unset(objective, old_holder)
+            self._entries[entry["EntryID"]] = (name, objective)
+            obj = self._objectives.get(objective)
+            if obj is not None and score is not None:
+                self._set(obj, name, score)
+
+    def _handle_player_list(self, packet: Dict[str, Any]) -> None:
+        if packet.get("ActionType", 0) != 0:
+            return
+        for entry in packet.get("Entries") or ():
+            if entry.get("Username") and entry.get("EntityUniqueID") is not None:
+                self._unique_id_names[entry["EntityUniqueID"]] = entry["Username"]
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+
+def parse_players_list(output: Dict[str, Any]) -> Dict[Tuple[str, str], int]:
+    """
+    解析 /scoreboard players list * 的命令输出
+
+    参数:
+        output: 命令响应，包含 OutputMessages
+
+    返回:
+        (持有者名称, 项目名) -> 分数
+    """
+    result: Dict[Tuple[str, str], int] = {}
+    holder: Optional[str] = None
+    for message in output.get("OutputMessages") or ():
+        key = message.get("Message", "")
+        params = message.get("Parameters") or []
+        if key.endswith("players.list.player.count") and len(params) >= 2:
+            # 参数为 [分数条数, 持有者名称]
+            holder = params[1]
+        elif key.endswith("players.list.player.entry") and holder is not None and len(params) >= 3:
+            # 参数为 [分数, 项目显示名, 项目名]
+            score = _to_int(params[0])
+            if score is not None:
+                result[(holder, params[2])] = score
+    return result
@@ -0,0 +1,27 @@
+from .ids import KNOWN_PACKET_IDS, resolve_packet_id, resolve_packet_name
+from .base import Packet
+from .types import (
+    PACKET_TYPES,
+    register_packet_type,
+    packet_type_for,
+    MovePlayer,
+    Text,
+    SetActorData,
+    UpdateBlock,
+    CommandOutput
+)
+from .listener import ListenerSpec, PacketRoute
+from .lazy import LazyPacket
+from .predicates import (
+    FieldPredicate,
+    Equals,
+    In,
+    Prefix,
+    Regex,
+    Where,
+    compile_where,
+    decode_fields,
+    PARTIAL_DECODE_MIN_BYTES
+)
+from .conflation import ConflatingSubscription
+from .listener_queue import ListenerQueue, OverflowPolicy
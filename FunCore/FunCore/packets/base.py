@@ -0,0 +1,77 @@
+from typing import Any, Callable, ClassVar, Dict, FrozenSet
+
+from ..utils.lazy_import import lazy_import
+
+msgpack = lazy_import("msgpack")
+
+
+class Packet:
+    """
+    带 __slots__ 的数据包基类
+
+    子类以 __slots__ 声明需要的顶层字段，字段名与数据包字典的键相同。
+    解码时由 msgpack 的 C 实现解析，再以为每个子类生成的构造函数填充字段，
+    数据中缺失的字段为 None。实例比字典小得多，适合长期保存；
+    支持 packet["字段"] 与 packet.get("字段") 以兼容按字典编写的监听器。
+    """
+
+    __slots__ = ()
+
+    # 数据包名称，与名称映射一致
+    name: ClassVar[str] = ""
+    _field_set: ClassVar[FrozenSet[str]] = frozenset()
+    _from_map: ClassVar[Callable[[Dict[str, Any]], "Packet"]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.__slots__)
+        # 为字段逐个生成赋值语句，避免通用 setattr 循环的开销
+        body = "".join(f"    packet.{field} = get({field!r})\n" for field in cls.__slots__)
+        source = (
+            "def _from_map(data, new=object.__new__, cls=cls):\n"
+            "    packet = new(cls)\n"
+            "    get = data.get\n"
+            f"{body}"
+            "    return packet\n"
+        )
+        namespace: Dict[str, Any] = {"cls": cls}
+        exec(source, namespace)
+        cls._from_map = staticmethod(namespace["_from_map"])
+
+    @classmethod
+    def decode(cls, data) -> "Packet":
+        """
+        从 msgpack 数据解码
+
+        参数:
+            data: 支持缓冲区协议的 msgpack 数据(bytes、memoryview 等)
+
+        返回:
+            数据包实例
+        """
+        return cls._from_map(msgpack.unpackb(data, strict_map_key=False))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Packet":
+        """从已解码的数据包字典构造"""
+        return cls._from_map(data)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._field_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._field_set
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """按字段名取值，未声明的字段返回 default"""
+        return getattr(self, key) if key in self._field_set else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
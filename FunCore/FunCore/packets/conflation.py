@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .lazy import LazyPacket
+
+
+class ConflatingSubscription:
+    """
+    最新值合并订阅
+
+    按 (数据包ID, 键字段值) 只保留最新的数据包，以不超过 rate 的频率把各键的最新数据包交给回调。
+    较大的被覆盖数据包只读取过键字段，从未完整解码，其 Go 内存直接释放；
+    小数据包在读取键字段时已完整解码，投递时复用解码结果。
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[int, Any], None],
+        key: str = "EntityRuntimeID",
+        rate: float = 20.0,
+        typed: bool = False,
+        logger=None
+    ) -> None:
+        """
+        初始化合并订阅
+
+        参数:
+            callback: 回调函数，参数为(数据包ID, 数据包内容)
+            key: 用于区分状态的顶层字段名，如实体运行时 ID
+            rate: 每秒最多投递的轮数，每轮投递所有有更新的键
+            typed: 是否投递类型化数据包
+            logger: 日志记录器
+        """
+        if rate <= 0:
+            raise ValueError("rate 必须大于 0")
+        self.callback = callback
+        self.key = key
+        self.interval = 1.0 / rate
+        self.typed = typed
+        self.logger = logger
+        self._pending: Dict[Tuple[int, Hashable], LazyPacket] = {}
+        self._cond = threading.Condition()
+        self._running = True
+
+        # 统计信息
+        self.received = 0
+        self.superseded = 0
+        self.delivered = 0
+        self.rounds = 0
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def offer(self, packet_id: int, key_value: Any, packet: LazyPacket) -> None:
+        """
+        提交一个数据包，覆盖同一键尚未投递的数据包
+
+        参数:
+            packet_id: 数据包 ID
+            key_value: 键字段的值
+            packet: 延迟解码的数据包
+        """
+        try:
+            slot = (packet_id, key_value)
+            hash(slot)
+        except TypeError:
+            # 不可哈希的键值(如列表)按其表示区分
+            slot = (packet_id, repr(key_value))
+        with self._cond:
+            self.received += 1
+            if slot in self._pending:
+                self.superseded += 1
+            self._pending[slot] = packet
+            self._cond.notify()
+
+    @property
+    def conflation_ratio(self) -> float:
+        """收到的数据包数与投递数之比，越大说明合并掉的越多"""
+        return self.received / self.delivered if self.delivered else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            收到、被覆盖、已投递的数据包数，投递轮数，待投递的键数与合并比
+        """
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            "received": self.received,
+            "superseded": self.superseded,
+            "delivered": self.delivered,
+            "rounds": self.rounds,
+            "pending": pending,
+            "conflation_ratio": self.conflation_ratio,
+        }
+
+    def stop(self) -> None:
+        """停止投递，丢弃尚未投递的数据包"""
+        with self._cond:
+            self._running = False
+            self._pending.clear()
+            self._cond.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        """投递主循环"""
+        last_round: Optional[float] = None
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+            if last_round is not None:
+                delay = last_round + self.interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            last_round = time.monotonic()
+            self.rounds += 1
+            for (packet_id, _), packet in batch.items():
+                try:
+                    self.callback(packet_id, packet.packet if self.typed else packet.value)
+                    self.delivered += 1
+                except Exception as e:
+                    if self.logger is not None:
+                        self.logger.error(f"合并订阅回调错误: {e}")
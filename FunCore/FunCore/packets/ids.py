@@ -0,0 +1,81 @@
+from typing import Dict, Optional
+
+# 常用数据包的基岩版 ID，在无法获取名称映射时使用
+KNOWN_PACKET_IDS: Dict[str, int] = {
+    "Text": 9,
+    "SetTime": 10,
+    "AddPlayer": 12,
+    "AddActor": 13,
+    "RemoveActor": 14,
+    "MoveActorAbsolute": 18,
+    "MovePlayer": 19,
+    "UpdateBlock": 21,
+    "SetActorData": 39,
+    "ContainerOpen": 46,
+    "ContainerClose": 47,
+    "InventoryContent": 49,
+    "InventorySlot": 50,
+    "BlockActorData": 56,
+    "LevelChunk": 58,
+    "ChangeDimension": 61,
+    "PlayerList": 63,
+    "CommandOutput": 79,
+    "RemoveObjective": 106,
+    "SetDisplayObjective": 107,
+    "SetScore": 108,
+    "MoveActorDelta": 111,
+    "SetScoreboardIdentity": 112,
+    "CorrectPlayerMovePrediction": 161,
+    "UpdateSubChunkBlocks": 172,
+    "SubChunk": 174,
+}
+
+KNOWN_PACKET_NAMES: Dict[int, str] = {pid: name for name, pid in KNOWN_PACKET_IDS.items()}
+
+
+def _normalize(name: str) -> str:
+    """去掉名称映射中可能出现的 ID 前缀与 Packet 后缀"""
+    if name.startswith("ID") and name[2:3].isupper():
+        name = name[2:]
+    if name.endswith("Packet"):
+        name = name[:-len("Packet")]
+    return name
+
+
+def resolve_packet_id(name: str, name_to_id: Optional[Dict[str, int]] = None) -> int:
+    """
+    按名称获取数据包 ID
+
+    参数:
+        name: 数据包名称，如 "Text"
+        name_to_id: 连接后获取的名称 -> ID 映射，优先使用
+
+    返回:
+        数据包 ID
+
+    异常:
+        KeyError: 未知的数据包名称
+    """
+    if name_to_id:
+        if name in name_to_id:
+            return name_to_id[name]
+        for mapped_name, pid in name_to_id.items():
+            if _normalize(mapped_name) == name:
+                return pid
+    return KNOWN_PACKET_IDS[name]
+
+
+def resolve_packet_name(packet_id: int, id_to_name: Optional[Dict[int, str]] = None) -> Optional[str]:
+    """
+    按 ID 获取数据包名称
+
+    参数:
+        packet_id: 数据包 ID
+        id_to_name: 连接后获取的 ID -> 名称映射，优先使用
+
+    返回:
+        去掉前后缀的数据包名称，未知时返回 None
+    """
+    if id_to_name and packet_id in id_to_name:
+        return _normalize(id_to_name[packet_id])
+    return KNOWN_PACKET_NAMES.get(packet_id)
@@ -0,0 +1,126 @@
+import threading
+from typing import Any, Dict, Iterator, Optional, Type
+
+from ..utils.lazy_import import lazy_import
+from .base import Packet
+
+msgpack = lazy_import("msgpack")
+
+_UNSET = object()
+
+
+class LazyPacket:
+    """
+    延迟解码的数据包
+
+    持有 Go 内存中的原始数据，首次访问字段时才解码，解码结果在同一数据包的所有监听器间共享。
+    解码后立即归还原始内存；从未解码的数据包在不再被引用时由 GoBuffer 自动释放，
+    因此监听器可以保存 LazyPacket 稍后再访问。
+    """
+
+    __slots__ = ("packet_id", "_buffer", "_size", "_packet_type", "_value", "_packet")
+
+    # 所有数据包共用一把锁，只在首次解码时竞争
+    _decode_lock = threading.Lock()
+
+    def __init__(self, packet_id: int, buffer, packet_type: Optional[Type[Packet]] = None) -> None:
+        """
+        参数:
+            packet_id: 数据包 ID
+            buffer: 原始 msgpack 数据(GoBuffer 或 bytes)
+            packet_type: 类型化数据包类，为 None 时 packet 属性与 value 相同
+        """
+        self.packet_id = packet_id
+        self._buffer = buffer
+        self._size = len(buffer)
+        self._packet_type = packet_type
+        self._value: Any = _UNSET
+        self._packet: Any = _UNSET
+
+    @property
+    def size(self) -> int:
+        """原始数据长度(字节)"""
+        return self._size
+
+    @property
+    def decoded(self) -> bool:
+        """是否已解码"""
+        return self._value is not _UNSET
+
+    @property
+    def raw(self) -> bytes:
+        """
+        原始 msgpack 数据的副本
+
+        异常:
+            ValueError: 已解码，原始数据已被释放
+        """
+        buffer = self._buffer
+        if buffer is None:
+            raise ValueError("数据包已解码，原始数据已被释放")
+        return bytes(buffer)
+
+    @property
+    def value(self) -> Any:
+        """解码后的数据包字典"""
+        value = self._value
+        if value is _UNSET:
+            with self._decode_lock:
+                value = self._value
+                if value is _UNSET:
+                    buffer = self._buffer
+                    try:
+                        data = buffer.view if hasattr(buffer, "view") else buffer
+                        value = self._value = msgpack.unpackb(data, strict_map_key=False)
+                    finally:
+                        self._buffer = None
+                        if hasattr(buffer, "release"):
+                            buffer.release()
+        return value
+
+    @property
+    def packet(self) -> Any:
+        """类型化数据包对象，类型未注册时为数据包字典"""
+        packet = self._packet
+        if packet is _UNSET:
+            value = self.value
+            packet = self._packet = self._packet_type.from_dict(value) if self._packet_type else value
+        return packet
+
+    def _set_value(self, value: Any) -> None:
+        """写入已解码的数据包字典并释放原始数据"""
+        with self._decode_lock:
+            buffer, self._buffer = self._buffer, None
+            self._value = value
+        if hasattr(buffer, "release"):
+            buffer.release()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.value[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """按键取值，首次调用时解码"""
+        return self.value.get(key, default)
+
+    def keys(self):
+        return self.value.keys()
+
+    def items(self):
+        return self.value.items()
+
+    def to_dict(self) -> Dict[Any, Any]:
+        """解码后的数据包字典"""
+        return self.value
+
+    def __repr__(self) -> str:
+        state = "decoded" if self.decoded else f"size={self._size}"
+        return f"<LazyPacket id={self.packet_id} {state}>"
@@ -0,0 +1,87 @@
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from .predicates import Where
+from .conflation import ConflatingSubscription
+from .listener_queue import ListenerQueue
+
+
+class ListenerSpec:
+    """数据包监听器的注册信息"""
+
+    __slots__ = ("callback", "typed", "lazy", "where", "conflation", "queue")
+
+    def __init__(
+        self,
+        callback: Callable[[int, Any], None],
+        typed: bool = False,
+        lazy: bool = False,
+        where: Optional[Where] = None,
+        conflation: Optional[ConflatingSubscription] = None,
+        queue: Optional[ListenerQueue] = None
+    ) -> None:
+        """
+        参数:
+            callback: 回调函数，参数为(数据包ID, 数据包内容)
+            typed: 是否接收类型化数据包，未注册类型的数据包仍以字典传入
+            lazy: 是否接收首次访问时才解码的 LazyPacket
+            where: 顶层字段谓词，不满足时不调用回调
+            conflation: 最新值合并订阅，指定时数据包交给它而不是直接调用回调
+            queue: 监听器专属队列，指定时数据包入队后由其工作线程调用回调
+        """
+        self.callback = callback
+        self.typed = typed
+        self.lazy = lazy
+        self.where = where
+        self.conflation = conflation
+        self.queue = queue
+
+
+class PacketRoute:
+    """
+    单个数据包 ID 的分发表
+
+    无条件的监听器与按谓词归类的监听器分开存放，相同谓词的监听器共用一次求值。
+    监听器变化时整体重建。
+    """
+
+    __slots__ = ("always", "groups", "fields", "any_typed", "eager_always")
+
+    def __init__(self, specs: Iterable[ListenerSpec]) -> None:
+        always: List[ListenerSpec] = []
+        groups: Dict[Where, List[ListenerSpec]] = {}
+        for spec in specs:
+            if spec.where is None:
+                always.append(spec)
+            else:
+                groups.setdefault(spec.where, []).append(spec)
+        self.always: Tuple[ListenerSpec, ...] = tuple(always)
+        self.groups: Tuple[Tuple[Where, Tuple[ListenerSpec, ...]], ...] = tuple(
+            (where, tuple(group)) for where, group in groups.items()
+        )
+        # 谓词与合并键需要的全部字段，部分解码时只读取这些字段
+        conflation_keys = {
+            spec.conflation.key for spec in (*always, *(s for g in groups.values() for s in g))
+            if spec.conflation is not None
+        }
+        self.fields: FrozenSet[str] = frozenset(conflation_keys).union(*(where.fields for where in groups))
+        self.any_typed = any(spec.typed for spec in always) or any(
+            spec.typed for _, group in self.groups for spec in group
+        )
+        # 无条件监听器中有需要完整解码的，谓词可直接在完整数据上求值
+        self.eager_always = any(not spec.lazy for spec in always)
+
+    def select(self, values: Mapping[str, Any]) -> List[ListenerSpec]:
+        """
+        选出需要调用的监听器
+
+        参数:
+            values: 至少包含 fields 中字段的映射
+
+        返回:
+            无条件监听器与谓词成立的监听器
+        """
+        selected = list(self.always)
+        for where, group in self.groups:
+            if where.matches(values):
+                selected.extend(group)
+        return selected
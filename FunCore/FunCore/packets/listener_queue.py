@@ -0,0 +1,180 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from ..utils.concurrency_window import percentile
+
+
+class OverflowPolicy(str, Enum):
+    """监听器队列满时的处理方式"""
+    DROP_OLDEST = "drop_oldest"   # 丢弃最旧的数据包
+    DROP_NEWEST = "drop_newest"   # 丢弃新到的数据包
+    BLOCK = "block"               # 阻塞事件分发线程直到队列有空位
+    DISCONNECT = "disconnect"     # 移除该监听器
+
+
+class ListenerQueue:
+    """
+    监听器专属的有界队列
+
+    数据包在事件分发线程中入队，由独立的工作线程调用回调，
+    慢速或卡住的监听器只会填满自己的队列而不会拖慢事件循环。
+    记录队列深度、高水位、丢弃数以及排队与处理耗时的百分位数。
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[int, Any], None],
+        maxsize: int = 1024,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        on_disconnect: Optional[Callable[["ListenerQueue"], None]] = None,
+        logger=None,
+        sample_size: int = 1024
+    ) -> None:
+        """
+        初始化监听器队列
+
+        参数:
+            callback: 回调函数，参数为(数据包ID, 数据包内容)
+            maxsize: 队列容量
+            overflow: 队列满时的处理方式
+            on_disconnect: DISCONNECT 策略触发时调用，用于移除监听器
+            logger: 日志记录器
+            sample_size: 保留的耗时样本数
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize 必须大于 0")
+        self.callback = callback
+        self.name = getattr(callback, "__qualname__", repr(callback))
+        self.maxsize = maxsize
+        self.overflow = OverflowPolicy(overflow)
+        self.on_disconnect = on_disconnect
+        self.logger = logger
+        self._items: Deque[Tuple[int, Any, float]] = deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self.disconnected = False
+
+        # 统计信息
+        self.handled = 0
+        self.errors = 0
+        self.dropped = 0
+        self.high_water = 0
+        self._wait_samples: Deque[float] = deque(maxlen=sample_size)
+        self._handle_samples: Deque[float] = deque(maxlen=sample_size)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        """当前队列深度"""
+        return len(self._items)
+
+    def put(self, packet_id: int, payload: Any) -> bool:
+        """
+        数据包入队
+
+        参数:
+            packet_id: 数据包 ID
+            payload: 数据包内容
+
+        返回:
+            是否已入队
+        """
+        disconnect = False
+        with self._cond:
+            if not self._running:
+                return False
+            if len(self._items) >= self.maxsize:
+                if self.overflow is OverflowPolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                elif self.overflow is OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                elif self.overflow is OverflowPolicy.BLOCK:
+                    while self._running and len(self._items) >= self.maxsize:
+                        self._cond.wait()
+                    if not self._running:
+                        return False
+                else:
+                    self.dropped += 1
+                    self.disconnected = True
+                    disconnect = True
+            if not disconnect:
+                self._items.append((packet_id, payload, time.monotonic()))
+                self.high_water = max(self.high_water, len(self._items))
+                self._cond.notify_all()
+        if disconnect:
+            if self.logger is not None:
+                self.logger.warning(f"数据包监听器 {self.name} 处理过慢，队列已满，已被移除")
+            if self.on_disconnect is not None:
+                self.on_disconnect(self)
+            return False
+        return True
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        停止工作线程，丢弃尚未处理的数据包
+
+        参数:
+            wait: 是否等待正在执行的回调结束，卡住的监听器应传入 False
+        """
+        with self._cond:
+            self._running = False
+            self._items.clear()
+            self._cond.notify_all()
+        if wait and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            队列深度、高水位、已处理/丢弃/出错数，以及排队与处理耗时(秒)的 p50/p90/p99
+        """
+        with self._cond:
+            waits = sorted(self._wait_samples)
+            handles = sorted(self._handle_samples)
+            depth = len(self._items)
+        return {
+            "name": self.name,
+            "depth": depth,
+            "high_water": self.high_water,
+            "maxsize": self.maxsize,
+            "overflow": self.overflow.value,
+            "handled": self.handled,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "disconnected": self.disconnected,
+            **{f"wait_p{p}": percentile(waits, p) for p in (50, 90, 99)},
+            **{f"handle_p{p}": percentile(handles, p) for p in (50, 90, 99)},
+        }
+
+    def _run(self) -> None:
+        """工作线程主循环"""
+        while True:
+            with self._cond:
+                while self._running and not self._items:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                packet_id, payload, enqueued_at = self._items.popleft()
+                # 唤醒因队列满而阻塞的分发线程
+                self._cond.notify_all()
+            started = time.monotonic()
+            try:
+                self.callback(packet_id, payload)
+            except Exception as e:
+                self.errors += 1
+                if self.logger is not None:
+                    self.logger.error(f"数据包监听器错误: {e}")
+            finished = time.monotonic()
+            with self._cond:
+                self.handled += 1
+                self._wait_samples.append(started - enqueued_at)
+                self._handle_samples.append(finished - started)
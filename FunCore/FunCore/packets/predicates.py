@@ -0,0 +1,191 @@
+import re
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+from ..utils.lazy_import import lazy_import
+
+msgpack = lazy_import("msgpack")
+
+_MISSING = object()
+
+# 部分解码需要逐个键在 Python 中跳过，小数据包(如 Text、MovePlayer)完整解码反而更快，
+# 只有数据不小于该字节数时才值得部分解码，见 examples/bench_partial_decode.py
+PARTIAL_DECODE_MIN_BYTES = 256
+
+
+class FieldPredicate:
+    """顶层字段谓词基类，相同参数的谓词相等，便于按谓词归类监听器"""
+
+    __slots__ = ()
+
+    def __call__(self, value: Any) -> bool:
+        raise NotImplementedError
+
+    def _key(self) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._key()))
+
+
+class Equals(FieldPredicate):
+    """字段等于指定值"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self, value: Any) -> bool:
+        return value == self.value
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.value,)
+
+    def __repr__(self) -> str:
+        return f"Equals({self.value!r})"
+
+
+class In(FieldPredicate):
+    """字段属于指定集合"""
+
+    __slots__ = ("values",)
+
+    def __init__(self, *values: Any) -> None:
+        self.values = frozenset(values)
+
+    def __call__(self, value: Any) -> bool:
+        try:
+            return value in self.values
+        except TypeError:
+            # 不可哈希的值(列表、字典)不可能属于集合
+            return False
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.values,)
+
+    def __repr__(self) -> str:
+        return f"In({', '.join(map(repr, self.values))})"
+
+
+class Prefix(FieldPredicate):
+    """字符串字段以指定前缀开头"""
+
+    __slots__ = ("prefix",)
+
+    def __init__(self, *prefix: str) -> None:
+        self.prefix = prefix
+
+    def __call__(self, value: Any) -> bool:
+        return isinstance(value, str) and value.startswith(self.prefix)
+
+    def _key(self) -> Tuple[Any, ...]:
+        return self.prefix
+
+    def __repr__(self) -> str:
+        return f"Prefix({', '.join(map(repr, self.prefix))})"
+
+
+class Regex(FieldPredicate):
+    """字符串字段匹配正则表达式(re.search)"""
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern: str | re.Pattern, flags: int = 0) -> None:
+        self.pattern = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+
+    def __call__(self, value: Any) -> bool:
+        return isinstance(value, str) and self.pattern.search(value) is not None
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.pattern.pattern, self.pattern.flags)
+
+    def __repr__(self) -> str:
+        return f"Regex({self.pattern.pattern!r})"
+
+
+class Where:
+    """
+    多个顶层字段谓词的合取
+
+    相同条件的 Where 相等且哈希相同，数据包分发时每组条件只求值一次。
+    """
+
+    __slots__ = ("conditions", "fields")
+
+    def __init__(self, conditions: Mapping[str, Any]) -> None:
+        """
+        参数:
+            conditions: 字段名 -> 谓词；普通值视为 Equals，list/tuple/set 视为 In
+        """
+        compiled = []
+        for field, predicate in conditions.items():
+            if not isinstance(predicate, FieldPredicate):
+                if isinstance(predicate, (list, tuple, set, frozenset)):
+                    predicate = In(*predicate)
+                else:
+                    predicate = Equals(predicate)
+            compiled.append((field, predicate))
+        self.conditions: Tuple[Tuple[str, FieldPredicate], ...] = tuple(sorted(compiled, key=lambda c: c[0]))
+        self.fields: FrozenSet[str] = frozenset(field for field, _ in self.conditions)
+
+    def matches(self, values: Mapping[str, Any]) -> bool:
+        """
+        判断字段值是否满足全部谓词，缺失的字段视为不满足
+
+        参数:
+            values: 至少包含 fields 中字段的映射
+        """
+        for field, predicate in self.conditions:
+            value = values.get(field, _MISSING)
+            if value is _MISSING or not predicate(value):
+                return False
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Where) and self.conditions == other.conditions
+
+    def __hash__(self) -> int:
+        return hash(self.conditions)
+
+    def __repr__(self) -> str:
+        return f"Where({', '.join(f'{f}={p!r}' for f, p in self.conditions)})"
+
+
+def compile_where(where: Optional[Mapping[str, Any] | Where]) -> Optional[Where]:
+    """将 where 参数转换为 Where，None 或空条件返回 None"""
+    if where is None or isinstance(where, Where):
+        return where
+    return Where(where) if where else None
+
+
+def decode_fields(data, fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    只解码 msgpack 映射中指定的顶层字段
+
+    其余字段直接跳过而不构造对象，找齐所需字段后立即停止。
+    逐键跳过有固定开销，数据小于 PARTIAL_DECODE_MIN_BYTES 时应直接完整解码。
+
+    参数:
+        data: 顶层为映射的 msgpack 数据
+        fields: 需要的字段名
+
+    返回:
+        字段名 -> 值，数据中缺失的字段不出现在结果中
+    """
+    wanted = set(fields)
+    unpacker = msgpack.Unpacker(strict_map_key=False)
+    unpacker.feed(data)
+    result: Dict[str, Any] = {}
+    for _ in range(unpacker.read_map_header()):
+        key = unpacker.unpack()
+        if key in wanted:
+            result[key] = unpacker.unpack()
+            wanted.discard(key)
+            if not wanted:
+                break
+        else:
+            unpacker.skip()
+    return result
@@ -0,0 +1,69 @@
+from typing import Dict, Optional, Type
+
+from .base import Packet
+from .ids import resolve_packet_name
+
+# 数据包名称 -> 类型化数据包类
+PACKET_TYPES: Dict[str, Type[Packet]] = {}
+
+
+def register_packet_type(cls: Type[Packet]) -> Type[Packet]:
+    """注册类型化数据包类，可作为装饰器使用"""
+    PACKET_TYPES[cls.name] = cls
+    return cls
+
+
+def packet_type_for(packet_id: int, id_to_name: Optional[Dict[int, str]] = None) -> Optional[Type[Packet]]:
+    """
+    获取数据包 ID 对应的类型化数据包类
+
+    参数:
+        packet_id: 数据包 ID
+        id_to_name: 连接后获取的 ID -> 名称映射
+
+    返回:
+        已注册的数据包类，未注册时返回 None
+    """
+    name = resolve_packet_name(packet_id, id_to_name)
+    return PACKET_TYPES.get(name) if name else None
+
+
+@register_packet_type
+class MovePlayer(Packet):
+    """玩家移动"""
+    name = "MovePlayer"
+    __slots__ = (
+        "EntityRuntimeID", "Position", "Pitch", "Yaw", "HeadYaw", "Mode", "OnGround",
+        "RiddenEntityRuntimeID", "TeleportCause", "TeleportSourceEntityType", "Tick"
+    )
+
+
+@register_packet_type
+class Text(Packet):
+    """聊天与系统消息"""
+    name = "Text"
+    __slots__ = (
+        "TextType", "NeedsTranslation", "SourceName", "Message", "Parameters",
+        "XUID", "PlatformChatID", "FilteredMessage"
+    )
+
+
+@register_packet_type
+class SetActorData(Packet):
+    """实体元数据"""
+    name = "SetActorData"
+    __slots__ = ("EntityRuntimeID", "EntityMetadata", "EntityProperties", "Tick")
+
+
+@register_packet_type
+class UpdateBlock(Packet):
+    """方块更新"""
+    name = "UpdateBlock"
+    __slots__ = ("Position", "NewBlockRuntimeID", "Flags", "Layer")
+
+
+@register_packet_type
+class CommandOutput(Packet):
+    """命令输出"""
+    name = "CommandOutput"
+    __slots__ = ("CommandOrigin", "OutputType", "SuccessCount", "OutputMessages", "DataSet")
@@ -0,0 +1,67 @@
+import io
+from typing import Optional
+
+
+class BufferReader(io.RawIOBase):
+    """基于 memoryview 的只读文件对象，打开时不复制底层数据"""
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self._view = view.cast("B") if view.format != "B" else view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """读取至多 size 个字节(仅复制读取到的部分)"""
+        start = self._pos
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), start + size)
+        self._pos = max(start, end)
+        return self._view[start:end].tobytes()
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"无效的 whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"无效的偏移: {pos}")
+        self._pos = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def getbuffer(self) -> memoryview:
+        """获取底层 memoryview(不复制)"""
+        return self._view
+
+
+def open_reader(data) -> io.RawIOBase | io.BytesIO:
+    """
+    为字节数据打开只读文件对象
+
+    参数:
+        data: bytes、memoryview，或具有 open() 方法的缓冲区(如 GoBuffer)
+
+    返回:
+        文件对象，memoryview 与缓冲区不会被整体复制
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return io.BytesIO(data)
+    if isinstance(data, memoryview):
+        return BufferReader(data)
+    return data.open()
@@ -0,0 +1,154 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class SettingsCommandBatcher:
+    """WO 命令微批处理器，在短时间窗口内合并命令后批量发送"""
+
+    def __init__(
+        self,
+        flush_func: Callable[[List[str]], Any],
+        window: float = 0.02,
+        max_batch: int = 256,
+        logger=None
+    ) -> None:
+        """
+        初始化微批处理器
+
+        参数:
+            flush_func: 批量发送函数，参数为按提交顺序排列的命令列表
+            window: 第一条命令入队后最长等待时间(秒)
+            max_batch: 单批最多命令条数，达到后立即发送
+            logger: 记录后台线程发送失败的批次
+        """
+        self.window = window
+        self.max_batch = max_batch
+        self.logger = logger
+        self._flush_func = flush_func
+        self._pending: List[str] = []
+        self._first_at: Optional[float] = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # 保证各批次按取出顺序发送
+        self._flush_lock = threading.Lock()
+
+        # 统计信息
+        self._batches = 0
+        self._commands = 0
+        self._max_batch_size = 0
+        self._last_flush_latency = 0.0
+        self._total_flush_latency = 0.0
+        self._max_flush_latency = 0.0
+        self._max_queue_delay = 0.0
+        self._failed_batches = 0
+        self._failed_commands = 0
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, cmd: str) -> None:
+        """
+        提交一条命令
+
+        参数:
+            cmd: 命令字符串
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("微批处理器已关闭")
+            self._pending.append(cmd)
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+                self._wakeup.notify()
+            full = len(self._pending) >= self.max_batch
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        立即发送所有已提交的命令
+
+        返回:
+            本次发送的命令条数
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                first_at, self._first_at = self._first_at, None
+            if not batch:
+                return 0
+            start = time.monotonic()
+            try:
+                self._flush_func(batch)
+            except Exception:
+                self._failed_batches += 1
+                self._failed_commands += len(batch)
+                raise
+            finally:
+                end = time.monotonic()
+                latency = end - start
+                self._batches += 1
+                self._commands += len(batch)
+                self._max_batch_size = max(self._max_batch_size, len(batch))
+                self._last_flush_latency = latency
+                self._total_flush_latency += latency
+                self._max_flush_latency = max(self._max_flush_latency, latency)
+                if first_at is not None:
+                    self._max_queue_delay = max(self._max_queue_delay, end - first_at)
+        return len(batch)
+
+    def close(self) -> None:
+        """发送剩余命令并停止后台线程"""
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        self._thread.join()
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """待发送的命令条数"""
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            批次数、命令数、发送失败的批次数与命令数、批大小与发送延迟(秒)等统计
+        """
+        batches = self._batches
+        return {
+            "batches": batches,
+            "commands": self._commands,
+            "pending": self.pending,
+            "failed_batches": self._failed_batches,
+            "failed_commands": self._failed_commands,
+            "avg_batch_size": self._commands / batches if batches else 0.0,
+            "max_batch_size": self._max_batch_size,
+            "last_flush_latency": self._last_flush_latency,
+            "avg_flush_latency": self._total_flush_latency / batches if batches else 0.0,
+            "max_flush_latency": self._max_flush_latency,
+            "max_queue_delay": self._max_queue_delay,
+        }
+
+    def _run(self) -> None:
+        """时间窗口到期后发送"""
+        while True:
+            with self._lock:
+                while not self._closed and self._first_at is None:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                delay = self._first_at + self.window - time.monotonic()
+                if delay > 0:
+                    self._wakeup.wait(delay)
+                    continue
+            try:
+                self.flush()
+            except Exception as e:
+                # 发送失败的批次不重试，避免阻塞后续命令
+                if self.logger:
+                    self.logger.error(f"WO 命令批次发送失败，已丢弃该批次: {e}")
@@ -0,0 +1,139 @@
+import json
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_UNSET = object()
+
+# 字符串中的引号均被转义，以下模式只会匹配到真正的键
+_SUCCESS_COUNT = re.compile(r'"SuccessCount"\s*:\s*(-?\d+)')
+_FIRST_SUCCESS = re.compile(r'"OutputMessages"\s*:\s*\[\s*\{\s*"Success"\s*:\s*(true|false)')
+_FIRST_MESSAGE = re.compile(r'"OutputMessages"\s*:\s*\[\s*\{[^{}\[]*?"Message"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+class CommandResult(Mapping):
+    """
+    延迟解析的命令响应
+
+    保留命令响应的原始 JSON 字符串，按键访问时才完整解析(有 orjson 时使用 orjson)，
+    success、success_count 与 message 优先用正则从原始字符串中取得，无需完整解析。
+    与字典一样支持 result["OutputMessages"][0]["Success"] 等写法。
+
+    注意它是只读映射而不是 dict: isinstance(result, dict)、json.dumps(result) 与
+    result[key] = value 均不可用，需要 dict 时请调用 to_dict()。
+    """
+
+    __slots__ = ("raw", "_data")
+
+    def __init__(self, raw: str | bytes) -> None:
+        """
+        参数:
+            raw: 命令响应的 JSON 字符串
+        """
+        self.raw = raw.decode() if isinstance(raw, bytes) else raw
+        self._data: Any = _UNSET
+
+    @staticmethod
+    def looks_like_json(raw: str) -> bool:
+        """是否为 JSON 对象格式的响应，不是时应直接使用原始字符串"""
+        return raw.lstrip()[:1] == "{"
+
+    @property
+    def parsed(self) -> bool:
+        """是否已完整解析"""
+        return self._data is not _UNSET
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """完整解析后的响应字典，无法解析时为空字典"""
+        data = self._data
+        if data is _UNSET:
+            try:
+                data = _loads(self.raw)
+            except ValueError:
+                data = None
+            if not isinstance(data, dict):
+                data = {}
+            self._data = data
+        return data
+
+    @property
+    def success_count(self) -> int:
+        """成功执行的次数"""
+        if self._data is _UNSET:
+            match = _SUCCESS_COUNT.search(self.raw)
+            if match is not None:
+                return int(match.group(1))
+        return self.data.get("SuccessCount") or 0
+
+    @property
+    def success(self) -> bool:
+        """第一条输出消息是否成功，没有输出消息时按成功次数判断"""
+        if self._data is _UNSET:
+            match = _FIRST_SUCCESS.search(self.raw)
+            if match is not None:
+                return match.group(1) == "true"
+        messages = self.data.get("OutputMessages")
+        if messages:
+            return bool(messages[0].get("Success"))
+        return self.success_count > 0
+
+    @property
+    def message(self) -> Optional[str]:
+        """第一条输出消息的翻译键，如 "commands.tp.success"，没有时返回 None"""
+        if self._data is _UNSET:
+            match = _FIRST_MESSAGE.search(self.raw)
+            if match is not None:
+                text = match.group(1)
+                return json.loads(f'"{text}"') if "\\" in text else text
+        messages = self.data.get("OutputMessages")
+        return messages[0].get("Message") if messages else None
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """全部输出消息"""
+        return self.data.get("OutputMessages") or []
+
+    @property
+    def parameters(self) -> List[Any]:
+        """第一条输出消息的参数"""
+        messages = self.messages
+        return messages[0].get("Parameters") or [] if messages else []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        转换为 dict
+
+        返回:
+            重新解析得到的独立字典，修改它不影响本对象及共用同一响应的其他调用方
+        """
+        try:
+            data = _loads(self.raw)
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __bool__(self) -> bool:
+        # 与空字典一致: 无法解析的响应为假
+        if self._data is _UNSET and _SUCCESS_COUNT.search(self.raw) is not None:
+            return True
+        return bool(self.data)
+
+    def __repr__(self) -> str:
+        raw = self.raw if len(self.raw) <= 200 else self.raw[:200] + "..."
+        return f"CommandResult({raw})"
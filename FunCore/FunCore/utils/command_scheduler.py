@@ -0,0 +1,323 @@
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple
+
+from .token_bucket import TokenBucket
+
+
+class CommandPriority(IntEnum):
+    """命令优先级，数值越小越优先"""
+    INTERACTIVE = 0  # 交互命令，如聊天回复、玩家传送
+    NORMAL = 1       # 普通命令
+    BULK = 2         # 批量任务，如建筑导入
+
+
+class ScheduledCommand:
+    """已提交到调度器的命令"""
+
+    __slots__ = (
+        "func", "args", "priority", "tag", "cost", "awaited", "submitted_at", "dispatched_at",
+        "_lock", "_done", "_cancelled", "_dequeued", "_result", "_error"
+    )
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        priority: CommandPriority,
+        tag: str,
+        cost: float,
+        awaited: bool,
+        lock: threading.Condition
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.priority = priority
+        self.tag = tag
+        self.cost = cost
+        # 调用方会通过 result() 取得结果(包括异常)
+        self.awaited = awaited
+        self.submitted_at = time.monotonic()
+        self.dispatched_at: Optional[float] = None
+        self._lock = lock
+        self._done = threading.Event()
+        self._cancelled = False
+        # 已被调度器取出，即将或正在发送
+        self._dequeued = False
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+
+    def cancel(self) -> bool:
+        """
+        取消仍在排队的命令
+
+        返回:
+            是否取消成功，命令已被取出发送时返回 False
+        """
+        with self._lock:
+            if self._dequeued:
+                return False
+            self._cancelled = True
+            return True
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已取消"""
+        return self._cancelled
+
+    @property
+    def done(self) -> bool:
+        """是否已发送"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待命令被发送
+
+        参数:
+            timeout: 超时时间(秒)，默认一直等待
+
+        返回:
+            是否已发送
+        """
+        return self._done.wait(timeout)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        等待并获取发送函数的返回值
+
+        参数:
+            timeout: 超时时间(秒)，默认一直等待
+
+        异常:
+            TimeoutError: 超时仍未发送
+            其他: 发送函数抛出的异常
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("等待命令调度超时")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _run(self) -> None:
+        """执行发送函数"""
+        self.dispatched_at = time.monotonic()
+        try:
+            self._result = self.func(*self.args)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._done.set()
+
+
+class CommandScheduler:
+    """
+    命令优先级调度器
+
+    不同优先级之间严格按优先级发送，每个优先级有独立的令牌桶限速；
+    同一优先级内按调用方标签做加权公平排队，避免单个插件的批量任务占满发送通道。
+    """
+
+    DEFAULT_RATES: Dict[CommandPriority, Tuple[Optional[float], Optional[float]]] = {
+        CommandPriority.INTERACTIVE: (None, None),
+        CommandPriority.NORMAL: (500.0, 100.0),
+        CommandPriority.BULK: (2000.0, 4096.0),
+    }
+
+    def __init__(
+        self,
+        rates: Optional[Dict[CommandPriority, Tuple[Optional[float], Optional[float]]]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        logger=None
+    ) -> None:
+        """
+        初始化调度器
+
+        参数:
+            rates: 各优先级的 (每秒命令数, 突发容量)，速率为 None 表示不限速
+            weights: 调用方标签的权重，未配置的标签权重为 1
+            logger: 记录无人等待的发送错误
+
+        异常:
+            ValueError: 速率不为 None 且不大于 0
+        """
+        rates = {**self.DEFAULT_RATES, **(rates or {})}
+        for priority, (rate, _) in rates.items():
+            if rate is not None and rate <= 0:
+                raise ValueError(f"{CommandPriority(priority).name} 的速率必须大于 0，不限速请使用 None")
+        self.weights: Dict[str, float] = dict(weights or {})
+        self.logger = logger
+        self._buckets = {p: TokenBucket(*rates[p]) for p in CommandPriority}
+        # 每个优先级一个按虚拟完成时间排序的堆
+        self._heaps: Dict[CommandPriority, List[Tuple[float, int, ScheduledCommand]]] = {p: [] for p in CommandPriority}
+        self._virtual_time: Dict[CommandPriority, float] = {p: 0.0 for p in CommandPriority}
+        self._last_finish: Dict[CommandPriority, Dict[str, float]] = {p: {} for p in CommandPriority}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = True
+
+        # 统计信息
+        self._dispatched: Dict[CommandPriority, int] = {p: 0 for p in CommandPriority}
+        self._max_wait: Dict[CommandPriority, float] = {p: 0.0 for p in CommandPriority}
+        self._total_wait: Dict[CommandPriority, float] = {p: 0.0 for p in CommandPriority}
+        self._tag_dispatched: DefaultDict[str, int] = defaultdict(int)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def set_weight(self, tag: str, weight: float) -> None:
+        """
+        设置调用方标签的权重
+
+        参数:
+            tag: 调用方标签
+            weight: 权重，越大分得的发送份额越多
+        """
+        if weight <= 0:
+            raise ValueError("权重必须大于 0")
+        with self._cond:
+            self.weights[tag] = weight
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...] = (),
+        priority: CommandPriority = CommandPriority.NORMAL,
+        tag: str = "default",
+        cost: float = 1.0,
+        awaited: bool = False
+    ) -> ScheduledCommand:
+        """
+        提交一个发送任务
+
+        参数:
+            func: 发送函数
+            args: 发送函数参数
+            priority: 优先级
+            tag: 调用方标签，用于同优先级内的公平排队
+            cost: 消耗的令牌数，一般为命令条数
+            awaited: 调用方是否会等待结果，为 True 时发送错误只由 result() 抛出，不再记录日志
+
+        返回:
+            已提交的命令
+
+        异常:
+            RuntimeError: 调度器已停止
+        """
+        job = ScheduledCommand(func, args, CommandPriority(priority), tag, cost, awaited, self._cond)
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("命令调度器已停止")
+            priority = job.priority
+            last_finish = self._last_finish[priority]
+            start = max(self._virtual_time[priority], last_finish.get(tag, 0.0))
+            finish = start + cost / self.weights.get(tag, 1.0)
+            last_finish[tag] = finish
+            heapq.heappush(self._heaps[priority], (finish, next(self._seq), job))
+            self._cond.notify()
+        return job
+
+    def stop(self) -> List[ScheduledCommand]:
+        """
+        停止调度，取消仍在排队的命令
+
+        剩余命令不会绕过限速立即发送，而是标记为已取消并交还调用方，
+        等待其结果的 result() 会抛出 RuntimeError。
+
+        返回:
+            按优先级排列的未发送命令
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join()
+        remaining = []
+        with self._cond:
+            for priority in CommandPriority:
+                heap = self._heaps[priority]
+                while heap:
+                    _, _, job = heapq.heappop(heap)
+                    if not job.cancelled:
+                        job._cancelled = True
+                        job._error = RuntimeError("命令调度器已停止，命令未发送")
+                        job._done.set()
+                        remaining.append(job)
+        return remaining
+
+    def queued(self) -> Dict[CommandPriority, int]:
+        """各优先级排队中的命令数"""
+        with self._cond:
+            return {p: len(h) for p, h in self._heaps.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            各优先级的排队数、已发送数与排队等待时间(秒)，以及各标签的已发送数
+        """
+        with self._cond:
+            classes = {}
+            for p in CommandPriority:
+                dispatched = self._dispatched[p]
+                classes[p.name] = {
+                    "queued": len(self._heaps[p]),
+                    "dispatched": dispatched,
+                    "avg_wait": self._total_wait[p] / dispatched if dispatched else 0.0,
+                    "max_wait": self._max_wait[p],
+                }
+            return {"classes": classes, "tags": dict(self._tag_dispatched)}
+
+    def _next_job(self) -> Tuple[Optional[ScheduledCommand], Optional[float]]:
+        """
+        选出下一个可发送的命令
+
+        返回:
+            (命令, 无可发送命令时需等待的时间)
+        """
+        wait = None
+        for priority in CommandPriority:
+            heap = self._heaps[priority]
+            while heap and heap[0][2].cancelled:
+                heapq.heappop(heap)
+            if not heap:
+                continue
+            bucket = self._buckets[priority]
+            if bucket.ready():
+                finish, _, job = heapq.heappop(heap)
+                job._dequeued = True
+                bucket.consume(job.cost)
+                self._virtual_time[priority] = finish
+                return job, None
+            delay = bucket.time_until_ready()
+            wait = delay if wait is None else min(wait, delay)
+        return None, wait
+
+    def _execute(self, job: ScheduledCommand) -> None:
+        """执行命令并记录统计信息"""
+        waited = time.monotonic() - job.submitted_at
+        job._run()
+        with self._cond:
+            self._dispatched[job.priority] += 1
+            self._total_wait[job.priority] += waited
+            self._max_wait[job.priority] = max(self._max_wait[job.priority], waited)
+            self._tag_dispatched[job.tag] += 1
+        # 调用方等待结果时错误会由 result() 抛出，不重复记录
+        if job._error is not None and not job.awaited and self.logger:
+            self.logger.error(f"调度命令发送错误: {job._error}")
+
+    def _run(self) -> None:
+        """调度主循环"""
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                job, wait = self._next_job()
+                if job is None:
+                    self._cond.wait(wait)
+                    continue
+            self._execute(job)
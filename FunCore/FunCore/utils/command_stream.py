@@ -0,0 +1,149 @@
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class TotalSettingsCommandProgress:
+    """大量 WO 命令分块发送的进度句柄"""
+
+    def __init__(self) -> None:
+        self.sent_commands = 0
+        self.sent_chunks = 0
+        self.failed_commands = 0
+        # 失败的块: (块序号, 块内命令数)
+        self.failed_chunks: List[Tuple[int, int]] = []
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self._cancelled = False
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    def _record_chunk(self, index: int, count: int, ok: bool) -> None:
+        """记录一个块的发送结果"""
+        with self._lock:
+            self.sent_chunks += 1
+            if ok:
+                self.sent_commands += count
+            else:
+                self.failed_commands += count
+                self.failed_chunks.append((index, count))
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        """标记发送结束"""
+        with self._lock:
+            self.error = error
+            self.finished_at = time.monotonic()
+        self._done.set()
+
+    @property
+    def done(self) -> bool:
+        """是否已发送结束"""
+        return self._done.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已被取消"""
+        return self._cancelled
+
+    @property
+    def success(self) -> bool:
+        """是否全部发送成功"""
+        return self.done and not self._cancelled and self.error is None and not self.failed_chunks
+
+    @property
+    def elapsed(self) -> float:
+        """已耗时(秒)"""
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """发送吞吐量(条/秒)"""
+        elapsed = self.elapsed
+        return self.sent_commands / elapsed if elapsed > 0 else 0.0
+
+    def cancel(self) -> None:
+        """取消剩余块的发送"""
+        self._cancelled = True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待发送结束
+
+        参数:
+            timeout: 超时时间(秒)，默认一直等待
+
+        返回:
+            是否已结束
+        """
+        return self._done.wait(timeout)
+
+    def __bool__(self) -> bool:
+        return self.success
+
+    def __repr__(self) -> str:
+        return (
+            f"<TotalSettingsCommandProgress sent={self.sent_commands} "
+            f"failed={self.failed_commands} chunks={self.sent_chunks} "
+            f"done={self.done} throughput={self.throughput:.1f}/s>"
+        )
+
+
+def iter_command_lines(cmds: str | Iterable[str]) -> Iterator[str]:
+    """
+    逐条迭代命令，不为整段字符串创建行列表
+
+    参数:
+        cmds: 以换行分隔的命令字符串，或命令的可迭代对象
+
+    返回:
+        非空命令的迭代器
+    """
+    if not isinstance(cmds, str):
+        for cmd in cmds:
+            if cmd:
+                yield cmd
+        return
+    start = 0
+    while True:
+        end = cmds.find("\n", start)
+        if end < 0:
+            if start < len(cmds):
+                yield cmds[start:]
+            return
+        if end > start:
+            yield cmds[start:end]
+        start = end + 1
+
+
+def iter_command_chunks(
+    cmds: str | Iterable[str],
+    max_commands: int = 4096,
+    max_bytes: int = 1 << 20
+) -> Iterator[Tuple[bytes, int]]:
+    """
+    将命令按条数和字节数切分为块
+
+    单条超过 max_bytes 的命令会独占一个块。
+
+    参数:
+        cmds: 以换行分隔的命令字符串，或命令的可迭代对象
+        max_commands: 每块最多命令条数
+        max_bytes: 每块最多 UTF-8 字节数
+
+    返回:
+        (以换行连接的块字节, 块内命令数) 的迭代器
+    """
+    parts: List[bytes] = []
+    size = 0
+    for cmd in iter_command_lines(cmds):
+        encoded = cmd.encode("utf-8")
+        if parts and (len(parts) >= max_commands or size + len(encoded) > max_bytes):
+            yield b"\n".join(parts), len(parts)
+            parts = []
+            size = 0
+        parts.append(encoded)
+        size += len(encoded) + 1
+    if parts:
+        yield b"\n".join(parts), len(parts)
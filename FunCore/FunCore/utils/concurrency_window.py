@@ -0,0 +1,240 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+
+def command_type(cmd: str) -> str:
+    """
+    获取命令类型(命令名)
+
+    参数:
+        cmd: 命令字符串
+
+    返回:
+        去掉前导斜杠并转为小写的第一个词，如 "/tp @s ~ ~ ~" -> "tp"
+    """
+    cmd = cmd.lstrip().lstrip("/")
+    end = cmd.find(" ")
+    return (cmd if end < 0 else cmd[:end]).lower()
+
+
+def percentile(sorted_samples: list, p: float) -> float:
+    """
+    计算已排序样本的百分位数(最近秩法)
+
+    参数:
+        sorted_samples: 升序排列的样本
+        p: 百分位(0-100)
+
+    返回:
+        百分位数，无样本时为 0
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = math.ceil(p / 100 * len(sorted_samples))
+    return sorted_samples[min(len(sorted_samples), max(rank, 1)) - 1]
+
+
+class _CommandTypeStats:
+    """单个命令类型的往返时延统计"""
+
+    __slots__ = ("samples", "count", "timeouts", "_window_min")
+
+    def __init__(self, sample_size: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+        self.count = 0
+        self.timeouts = 0
+        # 基线窗口内的 (时间, 往返时延)，往返时延单调递增，队首即窗口内最小值
+        self._window_min: Deque[Tuple[float, float]] = deque()
+
+    def add_sample(self, now: float, rtt: float, baseline_window: float) -> None:
+        """记录一个成功响应的往返时延，并丢弃基线窗口外的样本"""
+        self.samples.append(rtt)
+        window_min = self._window_min
+        while window_min and window_min[-1][1] >= rtt:
+            window_min.pop()
+        window_min.append((now, rtt))
+        while window_min[0][0] < now - baseline_window:
+            window_min.popleft()
+
+    @property
+    def min_rtt(self) -> Optional[float]:
+        """基线窗口内的最小往返时延"""
+        return self._window_min[0][1] if self._window_min else None
+
+
+class AdaptiveConcurrencyWindow:
+    """
+    需响应命令的自适应并发窗口(AIMD)
+
+    时延稳定时每收到一个窗口的响应，窗口加性增长；出现超时或时延突增时窗口乘性减小。
+    时延突增以该命令类型近期(baseline_window 秒内)成功响应的最小往返时延为基线判断，
+    避免慢命令被误判为拥塞，也使基线能跟随网络路径的变化。
+    """
+
+    def __init__(
+        self,
+        initial_window: float = 8,
+        min_window: float = 1,
+        max_window: float = 256,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        spike_ratio: float = 3.0,
+        sample_size: int = 512,
+        baseline_window: float = 10.0
+    ) -> None:
+        """
+        初始化并发窗口
+
+        参数:
+            initial_window: 初始窗口大小
+            min_window: 最小窗口大小
+            max_window: 最大窗口大小
+            increase: 每收到一个窗口的正常响应后的增长量
+            decrease: 拥塞时的窗口缩小系数
+            spike_ratio: 往返时延超过基线的多少倍视为时延突增
+            sample_size: 每个命令类型保留的往返时延样本数
+            baseline_window: 时延基线取最小值的时间窗口(秒)
+        """
+        self.min_window = min_window
+        self.max_window = max_window
+        self.increase = increase
+        self.decrease = decrease
+        self.spike_ratio = spike_ratio
+        self.sample_size = sample_size
+        self.baseline_window = baseline_window
+        self._window = float(min(max(initial_window, min_window), max_window))
+        self._inflight = 0
+        self._last_decrease = 0.0
+        self._smoothed_rtt: Optional[float] = None
+        self._aborted = 0
+        self._stats: Dict[str, _CommandTypeStats] = {}
+        self._cond = threading.Condition()
+
+    @property
+    def window(self) -> float:
+        """当前窗口大小"""
+        return self._window
+
+    @property
+    def inflight(self) -> int:
+        """正在等待响应的命令数"""
+        return self._inflight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        占用一个在途名额
+
+        参数:
+            timeout: 超时时间(秒)，默认一直等待
+
+        返回:
+            是否占用成功
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._inflight >= int(self._window):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self._inflight += 1
+            return True
+
+    def release(self, cmd_type: str, rtt: Optional[float]) -> None:
+        """
+        归还在途名额并根据结果调整窗口
+
+        参数:
+            cmd_type: 命令类型
+            rtt: 往返时延(秒)，超时时为 None
+        """
+        now = time.monotonic()
+        with self._cond:
+            self._inflight -= 1
+            stats = self._stats.get(cmd_type)
+            if stats is None:
+                stats = self._stats[cmd_type] = _CommandTypeStats(self.sample_size)
+            stats.count += 1
+            if rtt is None:
+                stats.timeouts += 1
+                self._on_congestion(now)
+            else:
+                stats.add_sample(now, rtt, self.baseline_window)
+                self._smoothed_rtt = rtt if self._smoothed_rtt is None else 0.875 * self._smoothed_rtt + 0.125 * rtt
+                if rtt > stats.min_rtt * self.spike_ratio:
+                    self._on_congestion(now)
+                else:
+                    self._window = min(self.max_window, self._window + self.increase / self._window)
+            self._cond.notify_all()
+
+    def abort(self) -> None:
+        """
+        归还在途名额但不调整窗口
+
+        用于未发出(发送前被取消或发送失败)或因断线被提前结束的命令，
+        这些情况与服务器的承载能力无关，不视为拥塞。
+        """
+        with self._cond:
+            self._inflight -= 1
+            self._aborted += 1
+            self._cond.notify_all()
+
+    def _on_congestion(self, now: float) -> None:
+        """拥塞时缩小窗口，同一往返时间内只缩小一次"""
+        if now - self._last_decrease < (self._smoothed_rtt or 0.0):
+            return
+        self._last_decrease = now
+        self._window = max(self.min_window, self._window * self.decrease)
+
+    def rtt_percentiles(
+        self,
+        cmd_type: Optional[str] = None,
+        percentiles: Iterable[float] = (50, 90, 99)
+    ) -> Dict[str, float]:
+        """
+        获取往返时延百分位数
+
+        参数:
+            cmd_type: 命令类型，默认汇总所有类型
+            percentiles: 需要的百分位
+
+        返回:
+            如 {"p50": 0.03, "p90": 0.08, "p99": 0.2}，单位为秒
+        """
+        with self._cond:
+            if cmd_type is None:
+                samples = sorted(s for stats in self._stats.values() for s in stats.samples)
+            else:
+                stats = self._stats.get(cmd_type)
+                samples = sorted(stats.samples) if stats else []
+        return {f"p{p:g}": percentile(samples, p) for p in percentiles}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            窗口大小、在途数、未计入拥塞判断的中止数，以及各命令类型的响应数、超时数与往返时延百分位数
+        """
+        with self._cond:
+            types = list(self._stats.items())
+            result: Dict[str, Any] = {
+                "window": self._window,
+                "inflight": self._inflight,
+                "aborted": self._aborted,
+                "smoothed_rtt": self._smoothed_rtt,
+            }
+            counts = {name: (stats.count, stats.timeouts, stats.min_rtt) for name, stats in types}
+        result["types"] = {
+            name: {
+                "count": count,
+                "timeouts": timeouts,
+                "min_rtt": min_rtt,
+                **self.rtt_percentiles(name),
+            }
+            for name, (count, timeouts, min_rtt) in counts.items()
+        }
+        return result
@@ -0,0 +1,29 @@
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """首次访问属性时才导入的模块代理"""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module_name"] = name
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__dict__["_lazy_module_name"])
+        # 之后的属性访问直接命中实例字典，不再经过 __getattr__
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    延迟导入可选的重量级依赖
+
+    参数:
+        name: 模块名
+
+    返回:
+        首次使用时才真正导入的模块代理
+    """
+    return LazyModule(name)
@@ -0,0 +1,168 @@
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .token_bucket import TokenBucket
+
+# Go 日志级别 -> (logger 方法名, logging 数值级别)
+LOG_LEVELS: Dict[str, Tuple[str, int]] = {
+    "TRACE": ("info", logging.INFO),
+    "DEBUG": ("debug", logging.DEBUG),
+    "INFO": ("info", logging.INFO),
+    "WARN": ("warning", logging.WARNING),
+    "ERROR": ("error", logging.ERROR),
+    "FATAL": ("critical", logging.CRITICAL),
+    "UNKNOWN": ("info", logging.INFO),
+}
+
+_STOP = object()
+
+
+def resolve_level(level: str) -> Optional[Tuple[str, int]]:
+    """
+    解析 Go 日志级别
+
+    参数:
+        level: 日志级别字符串(不区分大小写)
+
+    返回:
+        (logger 方法名, logging 数值级别)，未知级别返回 None
+    """
+    return LOG_LEVELS.get(level) or LOG_LEVELS.get(level.upper())
+
+
+class LogPipeline:
+    """
+    异步日志输出管线
+
+    由独立的输出线程调用 logger，轮询线程只负责入队。
+    时间窗口内重复的日志只输出一次并在窗口结束时汇总重复次数；
+    可选的令牌桶限制 ERROR 以下级别的输出速率；队列满时丢弃新日志并计数。
+    """
+
+    def __init__(
+        self,
+        logger,
+        max_queue: int = 10000,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        dedup_window: float = 1.0
+    ) -> None:
+        """
+        初始化日志管线
+
+        参数:
+            logger: 日志记录器
+            max_queue: 队列容量
+            rate: ERROR 以下级别每秒最多输出的日志数，为 None 时不限速
+            burst: 限速的突发容量
+            dedup_window: 重复日志的合并窗口(秒)，为 0 时不去重
+        """
+        self.logger = logger
+        self.dedup_window = dedup_window
+        self._queue: "queue.Queue" = queue.Queue(max_queue)
+        self._bucket = TokenBucket(rate, burst)
+        self._thread: Optional[threading.Thread] = None
+
+        # 去重状态，仅由输出线程访问
+        self._last: Optional[Tuple[str, str]] = None
+        self._last_at = 0.0
+        self._repeats = 0
+
+        # 统计信息
+        self.emitted = 0
+        self.dropped_full = 0
+        self.dropped_rate = 0
+        self.deduplicated = 0
+
+    def start(self) -> None:
+        """启动输出线程"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """输出队列中剩余的日志后停止输出线程"""
+        if not (self._thread and self._thread.is_alive()):
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def submit(self, method: str, levelno: int, message: str) -> bool:
+        """
+        提交一条日志
+
+        参数:
+            method: logger 方法名
+            levelno: logging 数值级别
+            message: 日志内容
+
+        返回:
+            是否已入队
+        """
+        try:
+            self._queue.put_nowait((method, levelno, message))
+            return True
+        except queue.Full:
+            self.dropped_full += 1
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取统计信息
+
+        返回:
+            已输出、队列满丢弃、限速丢弃与去重合并的日志数，以及当前队列长度
+        """
+        return {
+            "emitted": self.emitted,
+            "dropped_full": self.dropped_full,
+            "dropped_rate": self.dropped_rate,
+            "deduplicated": self.deduplicated,
+            "queued": self._queue.qsize(),
+        }
+
+    def _flush_repeats(self) -> None:
+        """输出上一条日志的重复次数"""
+        if self._repeats and self._last is not None:
+            method, message = self._last
+            getattr(self.logger, method)(f"{message} (重复 {self._repeats} 次)")
+        self._repeats = 0
+
+    def _emit(self, method: str, levelno: int, message: str) -> None:
+        """去重、限速后调用 logger"""
+        now = time.monotonic()
+        key = (method, message)
+        if self.dedup_window > 0:
+            if key == self._last and now - self._last_at < self.dedup_window:
+                self._repeats += 1
+                self.deduplicated += 1
+                return
+            self._flush_repeats()
+            self._last, self._last_at = key, now
+        if levelno < logging.ERROR and not self._bucket.try_acquire():
+            self.dropped_rate += 1
+            return
+        try:
+            getattr(self.logger, method)(message)
+            self.emitted += 1
+        except Exception:
+            pass
+
+    def _run(self) -> None:
+        """输出主循环"""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.dedup_window or None)
+            except queue.Empty:
+                # 空闲时补上被合并的重复次数
+                self._flush_repeats()
+                self._last = None
+                continue
+            if item is _STOP:
+                self._flush_repeats()
+                return
+            self._emit(*item)
@@ -0,0 +1,232 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from .token_bucket import TokenBucket
+
+# (方法名, 位置参数, 关键字参数, 入队时间戳)
+OutboxEntry = Tuple[str, Tuple[Any, ...], Dict[str, Any], float]
+
+
+def outboxable(func):
+    """将方法标记为断线期间可暂存到发件箱的即发即弃方法"""
+    func._outboxable = True
+    return func
+
+
+class CommandOutbox:
+    """
+    断线期间的命令发件箱
+
+    断线时即发即弃的调用会被暂存而不是阻塞调用方线程，恢复连接后按限定速率依次重放。
+    超过 ttl 的条目在重放前丢弃；超出容量时丢弃最旧的条目。
+    条目在重放成功后才出队，重放期间 pending 不为 0，新的调用仍会排在其后；
+    重放时连接再次断开则保留条目等待恢复后重试，连接正常时出错的条目记为失败并丢弃。
+    指定 path 时条目同时追加写入 JSON Lines 文件，进程重启后再次启用时会继续重放，
+    因此重放语义为至少一次。
+    """
+
+    def __init__(
+        self,
+        sender: Callable[[str, Tuple[Any, ...], Dict[str, Any]], Any],
+        available: Callable[[], bool],
+        capacity: int = 10000,
+        ttl: Optional[float] = 300.0,
+        path: Optional[str] = None,
+        replay_rate: Optional[float] = 100.0,
+        logger=None
+    ) -> None:
+        """
+        初始化发件箱
+
+        参数:
+            sender: 重放函数，参数为(方法名, 位置参数, 关键字参数)
+            available: 连接是否可用
+            capacity: 最多暂存的条目数
+            ttl: 条目有效期(秒)，为 None 时不过期
+            path: 持久化文件路径，为 None 时仅保存在内存中
+            replay_rate: 每秒最多重放的条目数，为 None 时不限速
+            logger: 日志记录器
+        """
+        self.sender = sender
+        self.available = available
+        self.capacity = capacity
+        self.ttl = ttl
+        self.path = path
+        self.logger = logger
+        self._bucket = TokenBucket(replay_rate)
+        self._entries: Deque[OutboxEntry] = deque()
+        self._cond = threading.Condition()
+        self._file = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # 统计信息
+        self.queued = 0
+        self.replayed = 0
+        self.expired = 0
+        self.dropped = 0
+        self.failed = 0
+
+        if path is not None:
+            self._load()
+
+    @property
+    def pending(self) -> int:
+        """暂存中的条目数"""
+        return len(self._entries)
+
+    def put(self, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """
+        暂存一次调用
+
+        参数:
+            method: GameClient 方法名
+            args: 位置参数
+            kwargs: 关键字参数
+
+        异常:
+            TypeError: 启用持久化时参数无法序列化为 JSON，条目不会被暂存
+        """
+        entry = (method, tuple(args), dict(kwargs), time.time())
+        # 先序列化，避免无法序列化的条目进入队列后在重写文件时出错
+        line = self._dump(entry) if self.path is not None else None
+        with self._cond:
+            if len(self._entries) >= self.capacity:
+                self._entries.popleft()
+                self.dropped += 1
+            self._entries.append(entry)
+            self.queued += 1
+            if self._file is not None:
+                self._file.write(line)
+                self._file.flush()
+            self._cond.notify()
+
+    def start(self) -> None:
+        """启动重放线程"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止重放线程，未重放的条目保留在持久化文件中"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        with self._cond:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取统计信息
+
+        返回:
+            暂存、重放、过期、因容量丢弃与重放失败的条目数
+        """
+        return {
+            "pending": self.pending,
+            "queued": self.queued,
+            "replayed": self.replayed,
+            "expired": self.expired,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    @staticmethod
+    def _dump(entry: OutboxEntry) -> str:
+        """将条目序列化为一行 JSON"""
+        method, args, kwargs, created = entry
+        return json.dumps(
+            {"method": method, "args": args, "kwargs": kwargs, "created": created},
+            ensure_ascii=False
+        ) + "\n"
+
+    def _is_expired(self, created: float) -> bool:
+        """条目是否已过期"""
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _load(self) -> None:
+        """从持久化文件读取未重放的条目并压缩文件"""
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                        entry = (data["method"], tuple(data["args"]), data["kwargs"], data["created"])
+                    except (ValueError, KeyError, TypeError):
+                        # 进程中断时最后一行可能不完整
+                        continue
+                    if self._is_expired(entry[3]):
+                        self.expired += 1
+                        continue
+                    self._entries.append(entry)
+            while len(self._entries) > self.capacity:
+                self._entries.popleft()
+                self.dropped += 1
+        self._rewrite()
+
+    def _rewrite(self) -> None:
+        """以当前暂存的条目重写持久化文件"""
+        if self._file is not None:
+            self._file.close()
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.writelines(self._dump(entry) for entry in self._entries)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _run(self) -> None:
+        """重放主循环"""
+        while True:
+            with self._cond:
+                while self._running and not self._entries:
+                    self._cond.wait()
+                if not self._running:
+                    return
+            if not self.available():
+                time.sleep(0.1)
+                continue
+            delay = self._bucket.time_until_ready()
+            if delay > 0:
+                time.sleep(delay)
+                continue
+            with self._cond:
+                if not self._entries:
+                    continue
+                # 只查看队首，重放完成后才出队
+                entry = self._entries[0]
+            method, args, kwargs, created = entry
+            if self._is_expired(created):
+                self.expired += 1
+                self._remove(entry)
+                continue
+            self._bucket.consume()
+            try:
+                self.sender(method, args, kwargs)
+            except Exception as e:
+                if not self.available():
+                    # 重放期间再次断线，保留条目等待恢复后重试
+                    continue
+                self.failed += 1
+                if self.logger is not None:
+                    self.logger.error(f"发件箱重放 {method} 出错: {e}")
+            else:
+                self.replayed += 1
+            self._remove(entry)
+
+    def _remove(self, entry: OutboxEntry) -> None:
+        """将已处理的队首条目出队，全部处理后截断持久化文件"""
+        with self._cond:
+            # 重放期间队首可能已因容量限制被丢弃
+            if self._entries and self._entries[0] is entry:
+                self._entries.popleft()
+            # 全部重放后截断文件，避免其无限增长
+            if not self._entries and self._file is not None:
+                self._rewrite()
@@ -0,0 +1,169 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 轮询函数: 参数为本轮最多处理的事件数，返回实际处理的事件数
+PollFunc = Callable[[int], int]
+
+
+class IdleBackoff:
+    """
+    空闲退避策略
+
+    连续空转时休眠时间从 min_sleep 按 factor 倍增长到 max_sleep，
+    一旦有事件立即重置，使突发流量的首个事件延迟较低而长时间空闲时唤醒次数较少。
+    """
+
+    def __init__(self, min_sleep: float = 0.0005, max_sleep: float = 0.01, factor: float = 2.0) -> None:
+        """
+        参数:
+            min_sleep: 最短休眠时间(秒)
+            max_sleep: 最长休眠时间(秒)
+            factor: 每次空转后的增长倍数
+        """
+        self.min_sleep = min_sleep
+        self.max_sleep = max_sleep
+        self.factor = factor
+        self._sleep = min_sleep
+
+    def reset(self) -> None:
+        """有事件时重置休眠时间"""
+        self._sleep = self.min_sleep
+
+    def idle(self) -> float:
+        """
+        空转一次并休眠
+
+        返回:
+            本次休眠时间(秒)
+        """
+        sleep = self._sleep
+        time.sleep(sleep)
+        self._sleep = min(self.max_sleep, sleep * self.factor)
+        return sleep
+
+
+class Reactor:
+    """
+    统一事件循环
+
+    在单个线程中轮流轮询多个事件源(如 GameClient 的游戏事件与 LogClient 的日志)，
+    每个事件源每轮最多处理 batch_size 个事件以保证公平，全部空闲时共用同一退避策略。
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        idle: Optional[IdleBackoff] = None,
+        logger=None
+    ) -> None:
+        """
+        初始化事件循环
+
+        参数:
+            batch_size: 每个事件源每轮最多处理的事件数
+            idle: 空闲退避策略，默认为 IdleBackoff()
+            logger: 日志记录器
+        """
+        self.batch_size = batch_size
+        self.idle = idle or IdleBackoff()
+        self.logger = logger
+        self._sources: List[Tuple[str, PollFunc]] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 统计信息
+        self.loops = 0
+        self.idle_loops = 0
+        self.idle_time = 0.0
+        self.busy_time = 0.0
+        self.max_loop_time = 0.0
+        self.events: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add_source(self, name: str, poll: PollFunc) -> None:
+        """
+        注册事件源
+
+        参数:
+            name: 事件源名称，用于统计
+            poll: 轮询函数
+        """
+        with self._lock:
+            self._sources = [s for s in self._sources if s[0] != name] + [(name, poll)]
+            self.events.setdefault(name, 0)
+            self.errors.setdefault(name, 0)
+
+    def remove_source(self, name: str) -> None:
+        """移除事件源"""
+        with self._lock:
+            self._sources = [s for s in self._sources if s[0] != name]
+
+    @property
+    def running(self) -> bool:
+        """事件循环是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """启动事件循环线程"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 2.0) -> None:
+        """停止事件循环线程"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, object]:
+        """
+        获取事件循环统计信息
+
+        返回:
+            轮次、空转轮次、忙碌与空闲时间、最长单轮耗时，以及各事件源的事件数与错误数
+        """
+        total = self.busy_time + self.idle_time
+        return {
+            "loops": self.loops,
+            "idle_loops": self.idle_loops,
+            "busy_time": self.busy_time,
+            "idle_time": self.idle_time,
+            "utilization": self.busy_time / total if total else 0.0,
+            "max_loop_time": self.max_loop_time,
+            "events": dict(self.events),
+            "errors": dict(self.errors),
+        }
+
+    def _poll_round(self) -> int:
+        """轮询所有事件源一轮，返回处理的事件数"""
+        handled = 0
+        for name, poll in self._sources:
+            try:
+                count = poll(self.batch_size)
+            except Exception as e:
+                self.errors[name] += 1
+                if self.logger is not None:
+                    self.logger.error(f"事件源 {name} 轮询错误: {e}")
+                continue
+            self.events[name] += count
+            handled += count
+        return handled
+
+    def _run(self) -> None:
+        """事件循环主体"""
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            handled = self._poll_round()
+            elapsed = time.monotonic() - started
+            self.loops += 1
+            self.busy_time += elapsed
+            self.max_loop_time = max(self.max_loop_time, elapsed)
+            if handled:
+                self.idle.reset()
+            else:
+                self.idle_loops += 1
+                self.idle_time += self.idle.idle()
@@ -0,0 +1,121 @@
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class ReconnectSupervisor:
+    """
+    断线重连监督器
+
+    定期检查连接状态，断线超过宽限时间后按带抖动的指数退避重连。
+    重连沿用客户端的监听器与缓存，并让等待中的命令立即失败而不是等到超时。
+    """
+
+    def __init__(
+        self,
+        client,
+        check_interval: float = 1.0,
+        grace: float = 5.0,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0
+    ) -> None:
+        """
+        初始化重连监督器
+
+        参数:
+            client: GameClient 实例
+            check_interval: 连接状态检查间隔(秒)
+            grace: 断线多久后开始主动重连(秒)，期间等待底层自行恢复
+            base_delay: 首次重连的退避上限(秒)
+            max_delay: 退避上限的最大值(秒)
+        """
+        self.client = client
+        self.check_interval = check_interval
+        self.grace = grace
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 统计信息
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.last_outage: Optional[float] = None
+
+    def start(self) -> None:
+        """启动监督线程"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止监督线程"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        计算第 attempt 次重连前的等待时间(全抖动指数退避)
+
+        参数:
+            attempt: 已失败的重连次数
+
+        返回:
+            等待时间(秒)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        返回:
+            重连次数、失败次数、上次断线时长与重连后首个数据包的到达耗时(秒)
+        """
+        return {
+            "reconnects": self.reconnects,
+            "failed_attempts": self.failed_attempts,
+            "last_outage": self.last_outage,
+            "last_time_to_first_packet": self.client.last_time_to_first_packet,
+        }
+
+    def _run(self) -> None:
+        """监督主循环"""
+        attempt = 0
+        lost_at: Optional[float] = None
+        while not self._stop_event.is_set():
+            if self.client.check_available():
+                if lost_at is not None:
+                    self.last_outage = time.monotonic() - lost_at
+                    lost_at = None
+                attempt = 0
+                self._stop_event.wait(self.check_interval)
+                continue
+
+            if lost_at is None:
+                lost_at = time.monotonic()
+                # 断线后等待中的命令不会再收到响应
+                self.client._fail_pending_commands()
+                self.client.logger.warning("FunCore 已与游戏断开连接，等待恢复")
+            if time.monotonic() - lost_at < self.grace:
+                self._stop_event.wait(self.check_interval)
+                continue
+
+            if self._stop_event.wait(self.backoff(attempt)):
+                return
+            try:
+                self.client.reconnect()
+            except ConnectionError as e:
+                attempt += 1
+                self.failed_attempts += 1
+                self.client.logger.warning(f"重连失败 (第 {attempt} 次): {e}")
+                continue
+            self.reconnects += 1
+            self.last_outage = time.monotonic() - lost_at
+            lost_at = None
+            attempt = 0
+            self.client.logger.success("FunCore 已重新连接到游戏")
@@ -0,0 +1,216 @@
+import heapq
+import math
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+Vec3 = Tuple[float, float, float]
+Cell = Tuple[int, int, int]
+
+
+class SpatialHash:
+    """
+    均匀网格空间哈希
+
+    按 cell_size 把三维空间划分为立方体格子，每个格子记录其中的对象，
+    半径、包围盒与 k 近邻查询只检查相关格子。非线程安全，由调用方加锁。
+    """
+
+    def __init__(self, cell_size: float = 16.0) -> None:
+        """
+        参数:
+            cell_size: 格子边长，接近常用查询半径时效率最高
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size 必须大于 0")
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._positions: Dict[Hashable, Vec3] = {}
+        self._cell_of: Dict[Hashable, Cell] = {}
+
+    def _cell(self, x: float, y: float, z: float) -> Cell:
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size), math.floor(z / size))
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def position(self, key: Hashable) -> Optional[Vec3]:
+        """获取对象坐标，不存在时返回 None"""
+        return self._positions.get(key)
+
+    def update(self, key: Hashable, position: Vec3) -> None:
+        """
+        插入或移动对象
+
+        参数:
+            key: 对象标识
+            position: 坐标 (x, y, z)
+        """
+        cell = self._cell(*position)
+        old = self._cell_of.get(key)
+        if old != cell:
+            if old is not None:
+                self._discard(key, old)
+            self._cells.setdefault(cell, set()).add(key)
+            self._cell_of[key] = cell
+        self._positions[key] = position
+
+    def remove(self, key: Hashable) -> None:
+        """移除对象，不存在时忽略"""
+        cell = self._cell_of.pop(key, None)
+        self._positions.pop(key, None)
+        if cell is not None:
+            self._discard(key, cell)
+
+    def clear(self) -> None:
+        """移除所有对象"""
+        self._cells.clear()
+        self._positions.clear()
+        self._cell_of.clear()
+
+    def _discard(self, key: Hashable, cell: Cell) -> None:
+        members = self._cells.get(cell)
+        if members is not None:
+            members.discard(key)
+            if not members:
+                del self._cells[cell]
+
+    def _keys_in_cells(self, low: Cell, high: Cell) -> Iterator[Hashable]:
+        """遍历格子范围内的对象，范围较大时改为遍历已占用的格子"""
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+        if span > len(self._cells):
+            for (cx, cy, cz), members in self._cells.items():
+                if low[0] <= cx <= high[0] and low[1] <= cy <= high[1] and low[2] <= cz <= high[2]:
+                    yield from members
+            return
+        for cx in range(low[0], high[0] + 1):
+            for cy in range(low[1], high[1] + 1):
+                for cz in range(low[2], high[2] + 1):
+                    members = self._cells.get((cx, cy, cz))
+                    if members:
+                        yield from members
+
+    def query_box(self, low: Vec3, high: Vec3) -> List[Hashable]:
+        """
+        查询包围盒内(含边界)的对象
+
+        参数:
+            low: 最小角坐标
+            high: 最大角坐标
+
+        返回:
+            对象标识列表
+        """
+        positions = self._positions
+        result = []
+        for key in self._keys_in_cells(self._cell(*low), self._cell(*high)):
+            x, y, z = positions[key]
+            if low[0] <= x <= high[0] and low[1] <= y <= high[1] and low[2] <= z <= high[2]:
+                result.append(key)
+        return result
+
+    def query_radius(self, center: Vec3, radius: float) -> List[Tuple[float, Hashable]]:
+        """
+        查询球形范围内的对象
+
+        参数:
+            center: 球心坐标
+            radius: 半径
+
+        返回:
+            按距离升序排列的 (距离, 对象标识) 列表
+        """
+        cx, cy, cz = center
+        low = self._cell(cx - radius, cy - radius, cz - radius)
+        high = self._cell(cx + radius, cy + radius, cz + radius)
+        limit = radius * radius
+        positions = self._positions
+        result = []
+        for key in self._keys_in_cells(low, high):
+            x, y, z = positions[key]
+            d2 = (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2
+            if d2 <= limit:
+                result.append((math.sqrt(d2), key))
+        result.sort(key=lambda item: item[0])
+        return result
+
+    def nearest(
+        self,
+        center: Vec3,
+        k: int = 1,
+        max_radius: Optional[float] = None,
+        accept=None
+    ) -> List[Tuple[float, Hashable]]:
+        """
+        查询最近的 k 个对象
+
+        从球心所在格子逐圈向外扩展，已找到 k 个且下一圈不可能更近时停止。
+
+        参数:
+            center: 查询坐标
+            k: 数量
+            max_radius: 最大搜索半径，为 None 时不限
+            accept: 过滤函数，参数为对象标识，返回 False 的对象被忽略
+
+        返回:
+            按距离升序排列的 (距离, 对象标识) 列表
+        """
+        if k <= 0 or not self._positions:
+            return []
+        cx, cy, cz = center
+        origin = self._cell(cx, cy, cz)
+        positions = self._positions
+        limit2 = max_radius * max_radius if max_radius is not None else math.inf
+        # 最大堆保存当前最近的 k 个，元素为 (-距离平方, 序号, 对象标识)
+        best: List[Tuple[float, int, Hashable]] = []
+        counter = iter(range(len(positions)))
+
+        def offer(keys) -> None:
+            for key in keys:
+                if accept is not None and not accept(key):
+                    continue
+                x, y, z = positions[key]
+                d2 = (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2
+                if d2 > limit2:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-d2, next(counter), key))
+                elif d2 < -best[0][0]:
+                    heapq.heapreplace(best, (-d2, next(counter), key))
+
+        # 所有已占用格子到原点格子的最大切比雪夫距离，超过后不再扩展
+        max_ring = max(
+            max(abs(c[0] - origin[0]), abs(c[1] - origin[1]), abs(c[2] - origin[2]))
+            for c in self._cells
+        )
+        for ring in range(max_ring + 1):
+            if 24 * ring * ring + 2 > len(self._cells):
+                # 对象稀疏且距离较远时逐圈扩展反而更慢，直接检查剩余格子中的全部对象
+                for cell, members in self._cells.items():
+                    if max(abs(cell[0] - origin[0]), abs(cell[1] - origin[1]), abs(cell[2] - origin[2])) >= ring:
+                        offer(members)
+                break
+            for cell in self._ring_cells(origin, ring):
+                offer(self._cells.get(cell, ()))
+            # 第 ring+1 圈中的点到查询点的距离至少为 ring * cell_size
+            reach2 = (ring * self.cell_size) ** 2
+            if reach2 > limit2 or (len(best) == k and reach2 >= -best[0][0]):
+                break
+        return sorted(((math.sqrt(-d2), key) for d2, _, key in best), key=lambda item: item[0])
+
+    def _ring_cells(self, origin: Cell, ring: int) -> Iterator[Cell]:
+        """遍历与原点格子切比雪夫距离恰为 ring 的格子"""
+        ox, oy, oz = origin
+        if ring == 0:
+            yield origin
+            return
+        for dx in range(-ring, ring + 1):
+            for dy in range(-ring, ring + 1):
+                if abs(dx) == ring or abs(dy) == ring:
+                    for dz in range(-ring, ring + 1):
+                        yield (ox + dx, oy + dy, oz + dz)
+                else:
+                    yield (ox + dx, oy + dy, oz - ring)
+                    yield (ox + dx, oy + dy, oz + ring)
@@ -0,0 +1,136 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+# 每层 2**_SLOT_BITS 个槽位
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+
+
+class TimerTask:
+    """定时任务，由 TimerWheel.schedule 创建"""
+
+    __slots__ = ("callback", "args", "due", "interval", "cancelled")
+
+    def __init__(
+        self,
+        callback: Callable[..., Any],
+        args: Tuple[Any, ...],
+        due: int,
+        interval: Optional[int] = None
+    ) -> None:
+        self.callback = callback
+        self.args = args
+        self.due = due
+        self.interval = interval
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """取消任务，已在时间轮中的任务到期时被丢弃"""
+        self.cancelled = True
+
+    def __repr__(self) -> str:
+        name = getattr(self.callback, "__qualname__", repr(self.callback))
+        every = f" every {self.interval}" if self.interval else ""
+        return f"<TimerTask {name} at {self.due}{every}>"
+
+
+class TimerWheel:
+    """
+    分层时间轮
+
+    每层 64 个槽位，第 n 层每个槽位跨越 64**n 个刻，插入与取消为 O(1)，
+    每推进一刻只检查第 0 层的一个槽位，高层槽位在低层转满一圈时下放。
+    超出最高层范围的任务暂存在最高层，下放时重新计算位置。非线程安全，由调用方加锁。
+    """
+
+    def __init__(self, levels: int = 4, start: int = 0) -> None:
+        """
+        参数:
+            levels: 层数，默认 4 层可覆盖 64**4 (约 1677 万) 刻
+            start: 起始刻
+        """
+        if levels <= 0:
+            raise ValueError("levels 必须大于 0")
+        self.levels = levels
+        self.tick = start
+        self._wheels: List[List[List[TimerTask]]] = [[[] for _ in range(_SLOTS)] for _ in range(levels)]
+        self._count = 0
+
+    def __len__(self) -> int:
+        """时间轮中的任务数(含已取消但尚未到期的任务)"""
+        return self._count
+
+    def schedule(self, task: TimerTask) -> TimerTask:
+        """
+        插入任务，到期刻不晚于当前刻的任务在下一刻执行
+
+        参数:
+            task: 定时任务
+
+        返回:
+            传入的任务
+        """
+        if task.due <= self.tick:
+            task.due = self.tick + 1
+        self._place(task)
+        self._count += 1
+        return task
+
+    def _place(self, task: TimerTask) -> None:
+        delta = task.due - self.tick
+        level = 0
+        while level < self.levels - 1 and delta >= 1 << (_SLOT_BITS * (level + 1)):
+            level += 1
+        slot = (task.due >> (_SLOT_BITS * level)) & _SLOT_MASK
+        self._wheels[level][slot].append(task)
+
+    def advance(self, to_tick: int) -> List[TimerTask]:
+        """
+        推进到指定刻
+
+        参数:
+            to_tick: 目标刻，不大于当前刻时不推进
+
+        返回:
+            按到期刻排序的到期任务(已跳过取消的任务)，重复任务由调用方重新插入
+        """
+        due: List[TimerTask] = []
+        wheels = self._wheels
+        while self.tick < to_tick:
+            if self._count == 0:
+                self.tick = to_tick
+                break
+            self.tick += 1
+            tick = self.tick
+            # 低层转满一圈时把高层当前槽位的任务下放，从高层到低层以便逐层下放
+            top = 0
+            while top + 1 < self.levels and tick & ((1 << (_SLOT_BITS * (top + 1))) - 1) == 0:
+                top += 1
+            for level in range(top, 0, -1):
+                slot = wheels[level][(tick >> (_SLOT_BITS * level)) & _SLOT_MASK]
+                if slot:
+                    tasks = slot[:]
+                    slot.clear()
+                    for task in tasks:
+                        self._place(task)
+            bucket = wheels[0][tick & _SLOT_MASK]
+            if not bucket:
+                continue
+            keep = []
+            for task in bucket:
+                if task.due > tick:
+                    # 超出最高层范围的任务绕回到同一槽位
+                    keep.append(task)
+                    continue
+                self._count -= 1
+                if not task.cancelled:
+                    due.append(task)
+            bucket[:] = keep
+        return due
+
+    def clear(self) -> None:
+        """移除所有任务"""
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+        self._count = 0
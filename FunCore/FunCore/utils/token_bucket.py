@@ -0,0 +1,90 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """令牌桶限速器"""
+
+    def __init__(self, rate: Optional[float], burst: Optional[float] = None) -> None:
+        """
+        初始化令牌桶
+
+        参数:
+            rate: 每秒补充的令牌数，为 None 时不限速
+            burst: 桶容量，默认与 rate 相同(至少为 1)
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate or 1.0, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """按经过的时间补充令牌"""
+        if self.rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, cost: float = 1.0) -> bool:
+        """
+        尝试取出令牌
+
+        参数:
+            cost: 需要的令牌数
+
+        返回:
+            令牌是否足够(足够时已扣除)
+        """
+        if self.rate is None:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= cost:
+                self._tokens -= cost
+                return True
+            return False
+
+    def ready(self) -> bool:
+        """桶内是否有剩余令牌"""
+        if self.rate is None:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens > 0
+
+    def consume(self, cost: float = 1.0) -> None:
+        """
+        扣除令牌，允许透支
+
+        透支的令牌会推迟之后的 ready()，使大批量任务的平均速率仍受限。
+
+        参数:
+            cost: 扣除的令牌数
+        """
+        if self.rate is None:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= cost
+
+    def full(self) -> bool:
+        """桶是否已补满，此时与新建的桶等价"""
+        if self.rate is None:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens >= self.burst
+
+    def time_until_ready(self) -> float:
+        """距离桶内重新有令牌的时间(秒)"""
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens > 0:
+                return 0.0
+            if self.rate <= 0:
+                return float("inf")
+            # 令牌需要严格大于 0，多等一点避免浮点误差导致空转
+            return (-self._tokens) / self.rate + 1e-4
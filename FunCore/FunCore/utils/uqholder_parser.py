@@ -1,11 +1,11 @@
 import struct
 import uuid as uuid_lib
-from io import BytesIO
 from datetime import datetime
 from typing import Dict, Any, List, Tuple, Optional, BinaryIO
+from .buffer_reader import open_reader
 
 class UQHolderParser:
-    """解析 UQHolder 数据的类"""
+    """解析 UQHolder 数据的类，数据可为 bytes、memoryview 或 GoBuffer"""
     
     @staticmethod
     def parse_bool(reader: BinaryIO) -> bool:
@@ -107,9 +107,9 @@ class UQHolderParser:
         return uuid_lib.UUID(bytes=data)
 
     @classmethod
-    def parse_extend_info(cls, data: bytes) -> Dict[str, Any]:
+    def parse_extend_info(cls, data: bytes | memoryview) -> Dict[str, Any]:
         """解析 ExtendInfoHolder 结构"""
-        reader = BytesIO(data)
+        reader = open_reader(data)
         result = {}
         
         result["CompressThreshold"] = cls.parse_uint16(reader)
@@ -181,9 +181,9 @@ class UQHolderParser:
         return result
 
     @classmethod
-    def parse_bot_basic_info(cls, data: bytes) -> Dict[str, Any]:
+    def parse_bot_basic_info(cls, data: bytes | memoryview) -> Dict[str, Any]:
         """解析 BotBasicInfoHolder 结构"""
-        reader = BytesIO(data)
+        reader = open_reader(data)
         result = {}
         
         result["BotName"] = cls.parse_string(reader)
@@ -197,9 +197,9 @@ class UQHolderParser:
         return result
 
     @classmethod
-    def parse_player(cls, data: bytes) -> Dict[str, Any]:
+    def parse_player(cls, data: bytes | memoryview) -> Dict[str, Any]:
         """解析 Player 结构"""
-        reader = BytesIO(data)
+        reader = open_reader(data)
         result = {}
         total_len = len(data)
         
@@ -262,9 +262,9 @@ class UQHolderParser:
         return result
 
     @classmethod
-    def parse_players(cls, data: bytes) -> Dict[str, Any]:
+    def parse_players(cls, data: bytes | memoryview) -> Dict[str, Any]:
         """解析 Players 结构（包含多个 Player）"""
-        reader = BytesIO(data)
+        reader = open_reader(data)
         result = {"players": []}
         
         player_count = cls.parse_uint32(reader)
@@ -282,9 +282,9 @@ class UQHolderParser:
         return result
 
     @classmethod
-    def parse_uqholder(cls, data: bytes) -> Dict[str, bytes]:
+    def parse_uqholder(cls, data: bytes | memoryview) -> Dict[str, bytes]:
         """解析顶层 UQHolder 结构"""
-        reader = BytesIO(data)
+        reader = open_reader(data)
         result = {}
         
         modules = ["ExtendInfo", "BotBasicInfoHolder", "PlayersInfoHolder"]
@@ -305,7 +305,7 @@ class UQHolderParser:
         return result
 
     @classmethod
-    def parse_full(cls, data: bytes) -> Dict[str, Any]:
+    def parse_full(cls, data: bytes | memoryview) -> Dict[str, Any]:
         """解析完整的 UQHolder 数据"""
         top_level = cls.parse_uqholder(data)
         result = {}
@@ -13,6 +13,10 @@ default_console_handler.setLevel(logging.INFO)
 default_console_handler.setFormatter(conn.DefaultLoggingFormatter())
 default_logger.addHandler(default_console_handler)
 
+def _as_dict(result):
+    """把 CommandResult 转换为 dict，其他结果(原始字符串、None)原样返回"""
+    return result.to_dict() if isinstance(result, conn.CommandResult) else result
+
 class FakeOmega:
     def __init__(self, funcore) -> None:
         self.funcore = funcore
@@ -40,8 +44,13 @@ class FunCore(conn.GameClient):
 
     send_command = conn.GameClient.send_player_command_omit_response
     send_ws_command = conn.GameClient.send_websocket_command_omit_response
-    send_command_with_response = conn.GameClient.send_player_command_need_response
-    send_ws_command_with_response = conn.GameClient.send_websocket_command_need_response
+
+    # 旧接口返回 dict，保持不变；GameClient 的方法返回延迟解析的 CommandResult
+    def send_command_with_response(self, *args, **kwargs):
+        return _as_dict(self.send_player_command_need_response(*args, **kwargs))
+
+    def send_ws_command_with_response(self, *args, **kwargs):
+        return _as_dict(self.send_websocket_command_need_response(*args, **kwargs))
 
     @property
     def bot_name(self):